@@ -10,7 +10,22 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Уровень extended: графики рисуются средствами Qt, без matplotlib; экспорт
+    # в arrow/parquet без pyarrow сообщает, что пакет не установлен
+    excludes=[
+        'matplotlib',
+        'tkinter',
+        'pyarrow',
+        'scipy',
+        'pandas',
+        'IPython',
+        'PyQt5.QtMultimedia',
+        'PyQt5.QtNetwork',
+        'PyQt5.QtQml',
+        'PyQt5.QtQuick',
+        'PyQt5.QtSql',
+        'PyQt5.QtWebEngineWidgets',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -10,7 +10,30 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Сторонние пакеты и модули Qt, которые окно не импортирует
+    excludes=[
+        'matplotlib',
+        'tkinter',
+        'pyarrow',
+        'scipy',
+        'pandas',
+        'IPython',
+        'PyQt5.QtMultimedia',
+        'PyQt5.QtNetwork',
+        'PyQt5.QtQml',
+        'PyQt5.QtQuick',
+        'PyQt5.QtSql',
+        'PyQt5.QtWebEngineWidgets',
+        # Уровень mini: без фоновой генерации, таблицы результатов, экспорта и сервера
+        'rng_gui.worker',
+        'rng_gui.results',
+        'rng.export',
+        'rng.core',
+        'rng.pool',
+        'rng.server',
+        'rng.quality',
+        'rng.cli',
+    ],
     noarchive=False,
     optimize=0,
 )
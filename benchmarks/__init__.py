@@ -0,0 +1,31 @@
+"""
+Замеры производительности генераторов.
+
+Каждый модуль запускается из корня репозитория, например:
+
+    python -m benchmarks.bench_unique
+"""
+import time
+
+
+def best_time(func, repeat=3):
+    """
+    Лучшее время выполнения func из нескольких запусков, в секундах.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(header, rows):
+    """
+    Вывод результатов выровненной таблицей.
+    """
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(h)), *(len(row[i]) for row in rows)) for i, h in enumerate(header)]
+    print('  '.join(str(h).ljust(w) for h, w in zip(header, widths)))
+    for row in rows:
+        print('  '.join(cell.ljust(w) for cell, w in zip(row, widths)))
@@ -0,0 +1,37 @@
+"""
+Скорость генерации для каждого бэкенда (rng.backends).
+"""
+import argparse
+
+from benchmarks import best_time, print_table
+from rng.backends import BACKENDS, create_generator
+from rng.distributions import sample_distribution
+from rng.engine import generate_array
+
+
+def run(count, repeat):
+    rows = []
+    for backend in BACKENDS:
+        generator = create_generator(backend, seed=1)
+        cases = [
+            ('слова uint64', lambda: generator.bit_generator.random_raw(count)),
+            ('целые [1, 100]', lambda: generate_array(count, 1, 100, 'int', generator=generator)),
+            ('вещественные', lambda: generate_array(count, 0, 1, 'float', generator=generator)),
+            ('нормальное', lambda: sample_distribution('normal', count, generator)),
+        ]
+        for name, func in cases:
+            seconds = best_time(func, repeat)
+            rows.append([backend, name, f"{seconds:.4f}", f"{count / seconds / 1e6:.1f}"])
+    print_table(['бэкенд', 'операция', 'сек', 'млн/с'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Скорость криптостойкой генерации рядом с обычной (некриптографической).
+"""
+import argparse
+import secrets
+
+from benchmarks import best_time, print_table
+from rng.crypto import CryptoRandom
+from rng.engine import generate_array
+
+
+def run(count, min_val, max_val, repeat):
+    span = max_val - min_val + 1
+    loop_count = min(count, 200_000)
+    cases = [
+        ('secrets.randbelow', loop_count,
+         lambda: [secrets.randbelow(span) + min_val for _ in range(loop_count)]),
+        ('crypto os', count, lambda: CryptoRandom('os').integers(min_val, max_val, count)),
+        ('crypto chacha20', count, lambda: CryptoRandom('chacha20').integers(min_val, max_val, count)),
+        ('engine (не крипто)', count, lambda: generate_array(count, min_val, max_val)),
+    ]
+    rows = []
+    for name, size, func in cases:
+        seconds = best_time(func, repeat)
+        rows.append([name, size, f"{seconds:.4f}", f"{size / seconds / 1e6:.2f}"])
+    print_table(['режим', 'чисел', 'сек', 'млн/с'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10_000_000)
+    parser.add_argument('--min', type=int, default=0)
+    parser.add_argument('--max', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.min, args.max, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Перемешивание и выборка строк файла (rng.dataset) против чтения файла целиком.
+
+Создаётся временный файл из lines строк. Замеряются построение индекса,
+перемешивание всех строк, равновероятная и взвешенная выборка и, для
+сравнения, readlines() с random.shuffle / random.sample. Пиковая память
+(tracemalloc) сравнивается с размером индекса и размером файла.
+"""
+import argparse
+import os
+import random
+import tempfile
+import tracemalloc
+
+from benchmarks import best_time, print_table
+from rng.backends import create_generator
+from rng.dataset import LineIndex, sample_lines, shuffle_lines, weighted_sample_lines
+
+
+class _Discard:
+    """
+    Поток, который только считает записанные байты.
+    """
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+
+
+def _make_file(path, lines):
+    generator = create_generator('pcg64', 1)
+    weights = generator.random(lines)
+    with open(path, 'wb') as file:
+        for start in range(0, lines, 65536):
+            stop = min(start + 65536, lines)
+            file.write(''.join(f"{i},record-{i:09d},{weights[i]:.6f}\n"
+                               for i in range(start, stop)).encode('ascii'))
+
+
+def _naive_shuffle(path):
+    with open(path, 'rb') as file:
+        lines = file.readlines()
+    random.shuffle(lines)
+    _Discard().write(b''.join(lines))
+
+
+def _naive_sample(path, size):
+    with open(path, 'rb') as file:
+        lines = file.readlines()
+    _Discard().write(b''.join(random.sample(lines, size)))
+
+
+def _peak(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run(lines, size, repeat):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'data.csv')
+        _make_file(path, lines)
+        file_bytes = os.path.getsize(path)
+        seconds = best_time(lambda: LineIndex(path).close(), repeat)
+        print(f"файл: {lines} строк, {file_bytes / 2 ** 20:.0f} МБ; "
+              f"индекс: {file_bytes / seconds / 2 ** 20:.0f} МБ/с")
+        print()
+
+        generator = create_generator('pcg64', 2)
+        with LineIndex(path) as index:
+            methods = [
+                ('readlines + random.shuffle', lines, lambda: _naive_shuffle(path)),
+                ('shuffle_lines', lines, lambda: shuffle_lines(index, _Discard(), generator)),
+                ('readlines + random.sample', size, lambda: _naive_sample(path, size)),
+                ('sample_lines (алгоритм L)', size, lambda: sample_lines(index, _Discard(), size, generator)),
+                ('weighted_sample_lines', size,
+                 lambda: weighted_sample_lines(index, _Discard(), size, 3, ',', generator)),
+            ]
+            rows = []
+            for name, count, func in methods:
+                seconds = best_time(func, repeat)
+                rows.append([name, count, f"{seconds:.3f}", f"{lines / seconds / 1e6:.2f}",
+                             f"{_peak(func) / 2 ** 20:.1f}"])
+            index_bytes = index.nbytes
+        print_table(['способ', 'строк на выходе', 'с', 'млн строк файла/с', 'пик памяти, МБ'], rows)
+        print()
+        print(f"индекс: {index_bytes / 2 ** 20:.1f} МБ, файл: {file_bytes / 2 ** 20:.1f} МБ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=2 * 10 ** 6)
+    parser.add_argument('--size', type=int, default=1000, help="размер выборки")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.lines, args.size, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
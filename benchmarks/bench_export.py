@@ -0,0 +1,56 @@
+"""
+Скорость и размер экспорта: текст по строкам против двоичных форматов.
+"""
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from benchmarks import best_time, print_table
+from rng.export import FORMATS, export_array
+
+
+def _text(values, path):
+    # Прежний способ: одно число в строке
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(map(str, values.tolist())))
+
+
+def _available(file_format):
+    if file_format not in ('arrow', 'parquet'):
+        return True
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def run(count, repeat):
+    values = np.random.default_rng().integers(0, 1_000_000, count)
+    extensions = {'raw': '.bin', 'npy': '.npy', 'arrow': '.arrow', 'parquet': '.parquet'}
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [('text', '.txt', lambda path: _text(values, path))]
+        cases += [(file_format, extensions[file_format],
+                   lambda path, file_format=file_format: export_array(values, path, file_format=file_format))
+                  for file_format in FORMATS if _available(file_format)]
+        for name, extension, func in cases:
+            path = os.path.join(directory, 'numbers' + extension)
+            seconds = best_time(lambda: func(path), repeat)
+            size = os.path.getsize(path)
+            rows.append([name, count, f"{seconds:.4f}", f"{count / seconds:,.0f}", f"{size / 2**20:.1f}"])
+    print_table(['формат', 'чисел', 'сек', 'чисел/с', 'МиБ'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Вещественные числа на десятичной сетке (rng.engine) и их текстовый вывод (rng.text).
+
+Сравниваются round(random.uniform(a, b), decimals) для каждого числа,
+прежний способ (масштабирование [0, 1) и np.round), целое на сетке и
+53 бита без округления. Отдельно - частота граничных значений сетки
+(при округлении каждая граница выпадает вдвое реже остальных точек) и
+скорость печати порции по сравнению со str для каждого значения.
+"""
+import argparse
+import random
+
+import numpy as np
+
+from benchmarks import best_time, print_table
+from rng.engine import generate_array, get_generator
+from rng.text import format_lines
+
+
+def _rounded(count, min_val, max_val, decimals):
+    # Прежний способ: равномерное [0, 1), масштаб и округление
+    values = get_generator().random(count)
+    values *= max_val - min_val
+    values += min_val
+    return np.round(values, decimals)
+
+
+def run(count, decimals, repeat):
+    min_val, max_val = -1000.0, 1000.0
+    methods = [
+        ('round(random.uniform)', lambda: [round(random.uniform(min_val, max_val), decimals)
+                                           for _ in range(count)]),
+        ('масштаб + np.round', lambda: _rounded(count, min_val, max_val, decimals)),
+        ('целое на сетке', lambda: generate_array(count, min_val, max_val, 'float', decimals=decimals)),
+        ('53 бита', lambda: generate_array(count, min_val, max_val, 'float', decimals=None)),
+    ]
+    rows = [[name, f"{count / best_time(func, repeat) / 1e6:.2f}"] for name, func in methods]
+    print_table(['генерация', 'млн чисел/с'], rows)
+    print()
+
+    # Сетка из 11 точек: у равномерной выборки доля каждой 1/11
+    points = 11
+    rows = []
+    for name, values in [('масштаб + np.round', _rounded(count, 0, 0.1, 2)),
+                         ('целое на сетке', generate_array(count, 0, 0.1, 'float', decimals=2))]:
+        shares = np.bincount(np.rint(values * 100).astype(np.intp), minlength=points) / count
+        rows.append([name, f"{shares[0] * points:.3f}", f"{shares[1:-1].mean() * points:.3f}",
+                     f"{shares[-1] * points:.3f}"])
+    print_table(['сетка [0, 0.1]', 'min / ожидаемая', 'внутри / ожидаемая', 'max / ожидаемая'], rows)
+    print()
+
+    values = generate_array(count, min_val, max_val, 'float', decimals=decimals)
+    integers = generate_array(count, -10 ** 9, 10 ** 9)
+    methods = [
+        ('вещественные: str', lambda: '\n'.join(map(str, values.tolist()))),
+        ('вещественные: format', lambda: '\n'.join(f"{value:.{decimals}f}" for value in values.tolist())),
+        ('вещественные: format_lines', lambda: format_lines(values, decimals)),
+        ('целые: str', lambda: '\n'.join(map(str, integers.tolist()))),
+        ('целые: format_lines', lambda: format_lines(integers)),
+    ]
+    rows = [[name, f"{count / best_time(func, repeat) / 1e6:.2f}"] for name, func in methods]
+    print_table(['текстовый вывод', 'млн чисел/с'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10 ** 6)
+    parser.add_argument('--decimals', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.decimals, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Гистограмма по порциям против построения графика по всем значениям.
+
+Для каждого размера выборки замеряются: пополнение потоковой гистограммы
+(rng.histogram), подготовка данных графиков (гистограмма, функция
+распределения, QQ) и их объём, а также np.sort всей выборки - столько
+стоит QQ-график или функция распределения по отдельным значениям.
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks import best_time, print_table
+from rng.engine import generate_array
+from rng.histogram import DEFAULT_BINS, StreamingHistogram, qq_points, reference_cdf
+from rng.stream import DEFAULT_CHUNK_SIZE
+
+
+def run(sizes, bins, repeat):
+    rows = []
+    for size in sizes:
+        values = generate_array(size, 0, 1, 'float')
+        params = {'mode': 'random', 'count': size, 'min_val': 0, 'max_val': 1, 'num_type': 'float'}
+
+        def fill():
+            histogram = StreamingHistogram(bins)
+            for start in range(0, size, DEFAULT_CHUNK_SIZE):
+                histogram.update(values[start:start + DEFAULT_CHUNK_SIZE])
+            return histogram
+
+        histogram = fill()
+        cdf = reference_cdf(params)
+
+        def plot_data():
+            histogram.trimmed()
+            histogram.cdf()
+            qq_points(histogram, cdf)
+
+        fill_time = best_time(fill, repeat)
+        plot_time = best_time(plot_data, repeat)
+        sort_time = best_time(lambda: np.sort(values), repeat)
+        points = sum(len(part) for part in (histogram.trimmed()[1], histogram.cdf()[1], qq_points(histogram, cdf)[1]))
+        rows.append([size, f"{size / fill_time / 1e6:.1f}", f"{plot_time * 1000:.2f}", points,
+                     f"{sort_time * 1000:.1f}"])
+    print_table(['значений', 'гистограмма млн/с', 'графики мс', 'точек', 'np.sort мс'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 5, 10 ** 6, 10 ** 7])
+    parser.add_argument('--bins', type=int, default=DEFAULT_BINS)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.bins, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Масштабирование параллельной генерации по числу процессов.
+
+Заодно проверяется, что результат при одном seed не зависит от числа процессов.
+"""
+import argparse
+import os
+
+import numpy as np
+
+from benchmarks import best_time, print_table
+from rng.parallel import ParallelGenerator
+
+
+def run(count, workers_list, repeat):
+    rows = []
+    reference = {}
+    for workers in workers_list:
+        with ParallelGenerator(seed=12345, workers=workers) as generator:
+            cases = [
+                ('целые [1, 100]', lambda: generator.generate_random_sequence(count, 1, 100)),
+                ('нормальное', lambda: generator.generate_advanced_numbers('normal', count)),
+                ('криптостойкие', lambda: generator.generate_crypto_secure_numbers(1, 100, count)),
+            ]
+            for name, func in cases:
+                func()  # прогрев пула процессов
+                seconds = best_time(func, repeat)
+                same = ''
+                if name != 'криптостойкие':
+                    result = func()
+                    reference.setdefault(name, result)
+                    same = 'да' if np.array_equal(reference[name], result) else 'НЕТ'
+                rows.append([workers, name, f"{seconds:.4f}", f"{count / seconds / 1e6:.1f}", same])
+    print_table(['процессов', 'режим', 'сек', 'млн/с', 'совпадает'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=100_000_000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.workers, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
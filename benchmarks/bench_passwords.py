@@ -0,0 +1,47 @@
+"""
+Скорость генерации паролей и энтропия одного пароля.
+"""
+import argparse
+import io
+import random
+import string
+
+from benchmarks import best_time, print_table
+from rng.passwords import PasswordGenerator, PasswordPolicy
+
+
+def _legacy(length, count):
+    # Прежний способ: посимвольно через random.choice
+    characters = string.ascii_letters + string.digits + string.punctuation
+    return [''.join(random.choice(characters) for _ in range(length)) for _ in range(count)]
+
+
+def run(count, lengths, repeat):
+    rows = []
+    for length in lengths:
+        policy = PasswordPolicy(length, require_each_class=True)
+        generator = PasswordGenerator(policy)
+        legacy_count = min(count, 100_000)
+        cases = [
+            ('random.choice', legacy_count, lambda: _legacy(length, legacy_count)),
+            ('generate', count, lambda: generator.generate(count)),
+            ('write_to', count, lambda: generator.write_to(io.BytesIO(), count)),
+        ]
+        for name, size, func in cases:
+            seconds = best_time(func, repeat)
+            rows.append([length, name, size, f"{seconds:.4f}", f"{size / seconds:,.0f}",
+                         f"{policy.entropy_bits:.1f}"])
+    print_table(['длина', 'способ', 'паролей', 'сек', 'паролей/с', 'бит энтропии'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--lengths', type=int, nargs='+', default=[8, 16, 32])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.lengths, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
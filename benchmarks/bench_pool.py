@@ -0,0 +1,65 @@
+"""
+Задержка одиночного запроса: пул с фоновым дозаполнением против прямых вызовов.
+
+Выводятся перцентили p50, p99 и p99.9 в микросекундах и метрики пулов.
+"""
+import argparse
+import secrets
+import time
+
+from benchmarks import print_table
+from rng.crypto import crypto_integers
+from rng.engine import generate_array
+from rng.pool import RandomPool
+
+
+def _latencies(func, draws):
+    timer = time.perf_counter_ns
+    samples = []
+    for _ in range(draws):
+        start = timer()
+        func()
+        samples.append(timer() - start)
+    samples.sort()
+    return [samples[min(len(samples) - 1, int(len(samples) * q))] / 1000 for q in (0.5, 0.99, 0.999)]
+
+
+def run(draws, min_val, max_val):
+    pool = RandomPool()
+    crypto_pool = RandomPool(crypto_source='os')
+    # Пулы успевают заполниться до начала замеров
+    time.sleep(0.5)
+    span = max_val - min_val + 1
+    cases = [
+        ('secrets.randbelow', lambda: secrets.randbelow(span) + min_val),
+        ('generate_array(1)', lambda: generate_array(1, min_val, max_val)[0].item()),
+        ('crypto_integers(1)', lambda: crypto_integers(min_val, max_val, 1)[0].item()),
+        ('пул', lambda: pool.randint(min_val, max_val)),
+        ('криптостойкий пул', lambda: crypto_pool.randint(min_val, max_val)),
+    ]
+    rows = []
+    for name, func in cases:
+        p50, p99, p999 = _latencies(func, draws)
+        rows.append([name, draws, f"{p50:.2f}", f"{p99:.2f}", f"{p999:.2f}"])
+    print_table(['способ', 'чисел', 'p50 мкс', 'p99 мкс', 'p99.9 мкс'], rows)
+    print()
+    rows = []
+    for item in (pool, crypto_pool):
+        stats = item.stats()
+        rows.append([stats['source'], stats['draws'], stats['misses'], f"{stats['hit_rate']:.4f}",
+                     stats['refills'], f"{stats['refill_seconds']:.3f}"])
+        item.close()
+    print_table(['пул', 'выдано', 'промахов', 'доля попаданий', 'дозаполнений', 'сек в фоне'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--draws', type=int, default=200_000)
+    parser.add_argument('--min', type=int, default=1)
+    parser.add_argument('--max', type=int, default=100)
+    args = parser.parse_args()
+    run(args.draws, args.min, args.max)
+
+
+if __name__ == '__main__':
+    main()
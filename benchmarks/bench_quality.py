@@ -0,0 +1,203 @@
+"""
+Скорость, задержка, пиковая память и статистическое качество каждого режима.
+
+Для каждого режима RandomNumberGenerator и размера запроса замеряются
+значений в секунду, задержка вызова (p50, p99) и пик памяти (tracemalloc);
+на большой выборке выполняются тесты rng.quality. С --json результаты
+пишутся в файл, а с --baseline сравниваются с прошлым запуском:
+
+    python -m benchmarks.bench_quality --json results.json
+    python -m benchmarks.bench_quality --baseline results.json
+
+Код возврата 1 означает проваленный тест качества или замедление больше --tolerance.
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks import print_table
+from rng.core import RandomNumberGenerator
+from rng.crypto import crypto_integers
+from rng.distributions import distribution_names, get_distribution
+from rng.engine import generate_array
+from rng.quality import (DEFAULT_ALPHA, birthday_spacings, distribution_test, runs_test,
+                         uniform_chi_square, weighted_chi_square)
+
+WEIGHTED_VALUES = [1, 2, 3, 4, 5]
+WEIGHTS = [0.1, 0.2, 0.3, 0.2, 0.2]
+UNIQUE_MAX = 10 ** 9
+
+
+def _checked(result):
+    # Обёртки RandomNumberGenerator сообщают об ошибке строкой
+    if isinstance(result, str):
+        raise ValueError(result)
+    return result
+
+
+def _modes():
+    """
+    Режимы: имя -> (генерация size значений, тесты качества по выборке).
+    """
+    rng = RandomNumberGenerator
+    modes = {
+        'random': (
+            lambda size: _checked(rng.generate_random_sequence(size, 1, 100)),
+            lambda values, alpha: [
+                uniform_chi_square(values, 1, 100, alpha),
+                runs_test(values, alpha),
+                birthday_spacings(lambda size: generate_array(size, 0, 2 ** 32 - 1), alpha=alpha),
+            ]),
+        'unique': (
+            lambda size: _checked(rng.generate_unique_numbers(1, UNIQUE_MAX, size)),
+            lambda values, alpha: [
+                uniform_chi_square(values, 1, UNIQUE_MAX, alpha),
+                runs_test(values, alpha),
+            ]),
+        'weighted': (
+            lambda size: _checked(rng.generate_weighted_random(WEIGHTED_VALUES, WEIGHTS, size)),
+            lambda values, alpha: [
+                weighted_chi_square(values, WEIGHTED_VALUES, WEIGHTS, alpha),
+                runs_test(values, alpha),
+            ]),
+        'crypto': (
+            lambda size: _checked(rng.generate_crypto_secure_numbers(1, 100, size)),
+            lambda values, alpha: [
+                uniform_chi_square(values, 1, 100, alpha),
+                runs_test(values, alpha),
+                birthday_spacings(lambda size: crypto_integers(0, 2 ** 32 - 1, size), alpha=alpha),
+            ]),
+    }
+    for name in distribution_names():
+        distribution = get_distribution(name)
+        alias = distribution.aliases[0] if distribution.aliases else name
+        modes[f'distribution:{alias}'] = (
+            lambda size, name=name: _checked(rng.generate_advanced_numbers(name, size)),
+            lambda values, alpha, distribution=distribution: [
+                distribution_test(distribution, values, {}, alpha),
+                runs_test(values, alpha),
+            ])
+    return modes
+
+
+def _speed(generate, size, min_time):
+    """
+    Значений в секунду, задержка вызова (p50, p99) и пик памяти одного вызова.
+    """
+    tracemalloc.start()
+    generate(size)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    latencies = []
+    deadline = time.perf_counter() + min_time
+    while len(latencies) < 5 or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        generate(size)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return {'values_per_second': size / p50, 'p50': p50, 'p99': p99, 'peak_bytes': peak,
+            'calls': len(latencies)}
+
+
+def run(modes, sizes, sample, alpha, min_time):
+    """
+    Замеры и тесты для выбранных режимов; результат пригоден для JSON.
+    """
+    available = _modes()
+    speed, quality = [], []
+    for mode in modes:
+        generate, tests = available[mode]
+        for size in sizes:
+            try:
+                speed.append(dict(mode=mode, size=size, **_speed(generate, size, min_time)))
+            except ValueError as e:
+                speed.append({'mode': mode, 'size': size, 'error': str(e)})
+        try:
+            for result in tests(np.asarray(generate(sample)), alpha):
+                quality.append(dict(mode=mode, sample=sample, **result))
+        except ValueError as e:
+            quality.append({'mode': mode, 'sample': sample, 'test': '-', 'passed': False, 'error': str(e)})
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'alpha': alpha,
+        'speed': speed,
+        'quality': quality,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Строки сравнения скорости с прошлым запуском и число замедлений.
+    """
+    previous = {(row['mode'], row['size']): row for row in baseline['speed'] if 'error' not in row}
+    rows, slower = [], 0
+    for row in results['speed']:
+        old = previous.get((row['mode'], row['size']))
+        if old is None or 'error' in row:
+            continue
+        ratio = row['values_per_second'] / old['values_per_second']
+        regression = ratio < 1 - tolerance
+        slower += regression
+        rows.append([row['mode'], row['size'], f"{old['values_per_second']:,.0f}",
+                     f"{row['values_per_second']:,.0f}", f"{ratio:.2f}", 'ЗАМЕДЛЕНИЕ' if regression else ''])
+    return rows, slower
+
+
+def report(results):
+    rows = []
+    for row in results['speed']:
+        if 'error' in row:
+            rows.append([row['mode'], row['size'], '-', '-', '-', '-', row['error']])
+            continue
+        rows.append([row['mode'], row['size'], f"{row['values_per_second']:,.0f}",
+                     f"{row['p50'] * 1e6:,.1f}", f"{row['p99'] * 1e6:,.1f}",
+                     f"{row['peak_bytes'] / 2**20:,.2f}", ''])
+    print_table(['режим', 'размер', 'значений/с', 'p50 мкс', 'p99 мкс', 'пик МиБ', 'ошибка'], rows)
+    print()
+    rows = [[row['mode'], row['test'], f"{row.get('statistic', float('nan')):.4g}",
+             f"{row.get('p_value', float('nan')):.4g}", 'да' if row['passed'] else 'НЕТ', row.get('error', '')]
+            for row in results['quality']]
+    print_table(['режим', 'тест', 'статистика', 'p', 'пройден', 'ошибка'], rows)
+
+
+def main():
+    modes = list(_modes())
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', choices=modes, default=modes)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 1000, 1_000_000])
+    parser.add_argument('--sample', type=int, default=1_000_000, help="размер выборки для тестов качества")
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="уровень значимости")
+    parser.add_argument('--min-time', type=float, default=0.2, help="секунд замеров на размер")
+    parser.add_argument('--json', default=None, help="записать результаты в файл JSON")
+    parser.add_argument('--baseline', default=None, help="файл JSON прошлого запуска для сравнения")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="допустимое замедление относительно --baseline (доля)")
+    args = parser.parse_args()
+
+    results = run(args.modes, args.sizes, args.sample, args.alpha, args.min_time)
+    report(results)
+    failed = sum(not row['passed'] for row in results['quality'])
+    failed += sum('error' in row for row in results['speed'])
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            rows, slower = compare(results, json.load(file), args.tolerance)
+        print()
+        print_table(['режим', 'размер', 'было/с', 'стало/с', 'отношение', ''], rows)
+        failed += slower
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
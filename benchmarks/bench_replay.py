@@ -0,0 +1,41 @@
+"""
+Время восстановления среза результата по описанию в зависимости от его положения.
+
+Для сравнения - прежний способ: повторная генерация всего префикса тем же seed.
+"""
+import argparse
+
+from benchmarks import best_time, print_table
+from rng.backends import create_generator
+from rng.engine import generate_array
+from rng.replay import ReplayDescriptor
+
+
+def run(positions, length, repeat):
+    count = max(positions) + length
+    descriptor = ReplayDescriptor('random', {'min_val': 1, 'max_val': 100}, count, seed=42)
+    rows = []
+    for position in positions:
+        cases = [
+            ('префикс', lambda: generate_array(position + length, 1, 100,
+                                              generator=create_generator('pcg64', 42))[position:]),
+            ('описание', lambda: descriptor.generate(position, position + length)),
+        ]
+        for name, func in cases:
+            seconds = best_time(func, repeat)
+            rows.append([f"{position:,}", name, length, f"{seconds * 1000:.3f}"])
+    print(f"Описание: {descriptor.to_token()} ({len(descriptor.to_token())} байт)")
+    print_table(['позиция', 'способ', 'чисел', 'мс'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--positions', type=int, nargs='+', default=[0, 10**6, 10**7, 10**8])
+    parser.add_argument('--length', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.positions, args.length, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Нагрузочный клиент сервиса rng.server: запросов в секунду и перцентили задержки.
+
+Без --port сервис запускается в отдельном процессе (python -m rng serve) на
+свободных портах. Каждый из --connections клиентов держит одно keep-alive
+соединение и отправляет GET-запросы подряд; затем замеряется пропускная
+способность потокового протокола на одном большом двоичном запросе.
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks import print_table
+
+
+async def _read_http_response(reader):
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    if 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = bytearray()
+        while True:
+            size = int(await reader.readline(), 16)
+            body += await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status, body
+
+
+async def _http_client(host, port, target, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    request = f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('ascii')
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            status, _ = await _read_http_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def _http_load(host, port, target, connections, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(_http_client(host, port, target, deadline, latencies, errors)
+                           for _ in range(connections)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def _stream_throughput(host, port, count):
+    reader, writer = await asyncio.open_connection(host, port)
+    start = time.perf_counter()
+    writer.write(json.dumps({'mode': 'random', 'count': count, 'format': 'binary'}).encode() + b'\n')
+    header = json.loads(await reader.readline())
+    remaining = header['bytes']
+    while remaining:
+        remaining -= len(await reader.read(min(remaining, 1 << 20)))
+    seconds = time.perf_counter() - start
+    writer.close()
+    return seconds
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def _start_server():
+    process = subprocess.Popen([sys.executable, '-m', 'rng', 'serve', '--port', '0', '--stream-port', '0'],
+                               stdout=subprocess.PIPE, text=True)
+    addresses = {}
+    for _ in range(2):
+        name, _, address = process.stdout.readline().strip().partition(': ')
+        host, _, port = address.rpartition(':')
+        addresses[name] = (host, int(port))
+    return process, addresses
+
+
+def run(host, port, stream_port, connections, duration, counts, stream_count):
+    process = None
+    if port is None:
+        process, addresses = _start_server()
+        host, port = addresses['http']
+        stream_port = addresses['tcp'][1]
+    try:
+        rows = []
+        for count in counts:
+            target = f"/random?min=1&max=100&count={count}"
+            latencies, errors, seconds = asyncio.run(_http_load(host, port, target, connections, duration))
+            latencies.sort()
+            rows.append([count, connections, len(latencies), len(errors), f"{len(latencies) / seconds:,.0f}",
+                         *(f"{_percentile(latencies, q) * 1000:.2f}" for q in (0.5, 0.99, 0.999))])
+        print_table(['чисел', 'соединений', 'запросов', 'ошибок', 'запросов/с',
+                     'p50 мс', 'p99 мс', 'p99.9 мс'], rows)
+        if stream_port is not None and stream_count:
+            seconds = asyncio.run(_stream_throughput(host, stream_port, stream_count))
+            print()
+            print_table(['поток', 'чисел', 'сек', 'чисел/с', 'МиБ/с'],
+                        [['tcp binary', stream_count, f"{seconds:.3f}", f"{stream_count / seconds:,.0f}",
+                          f"{stream_count * 8 / seconds / 2**20:,.1f}"]])
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help="порт HTTP работающего сервиса")
+    parser.add_argument('--stream-port', type=int, default=None, help="порт потокового протокола")
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=3.0, help="секунд на каждый замер")
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 100, 10000])
+    parser.add_argument('--stream-count', type=int, default=10_000_000)
+    args = parser.parse_args()
+    run(args.host, args.port, args.stream_port, args.connections, args.duration, args.counts,
+        args.stream_count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Время до первого рабочего окна для каждого графического интерфейса.
+
+Каждый запуск - отдельный процесс Python: замеряется время от запуска
+процесса до импорта модуля окна и до показа главного окна (с заставкой
+и без неё). Без дисплея используется платформа Qt offscreen.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import print_table
+
+FRONT_ENDS = ['Random_Number_Generator-1.py', 'Random_Number_Generator-2.py',
+              'Random_Number_Generator-3-Mini.py']
+
+# Выполняется в дочернем процессе: argv - путь, режим, время запуска процесса
+_DRIVER = """
+import importlib.util, json, sys, time
+path, mode, launched = sys.argv[1], sys.argv[2], float(sys.argv[3])
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+spec = importlib.util.spec_from_file_location('front_end', path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.time() - launched
+if mode == 'splash':
+    from rng_gui.splash import SplashScreen
+    keep = SplashScreen(module.RandomGenerator)
+else:
+    keep = module.RandomGenerator()
+    keep.show()
+
+def poll():
+    for widget in app.topLevelWidgets():
+        if isinstance(widget, module.RandomGenerator) and widget.isVisible():
+            print(json.dumps({'import': imported, 'window': time.time() - launched}), flush=True)
+            app.quit()
+
+timer = QTimer()
+timer.timeout.connect(poll)
+timer.start(5)
+app.exec_()
+"""
+
+
+def _measure(path, mode, env, directory):
+    launched = time.time()
+    output = subprocess.run([sys.executable, '-c', _DRIVER, path, mode, repr(launched)], env=env,
+                            cwd=directory, capture_output=True, text=True, timeout=120)
+    for line in output.stdout.splitlines():
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(output.stderr.strip().splitlines()[-1] if output.stderr else "окно не открылось")
+
+
+def run(front_ends, repeat):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+    if not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    rows = []
+    for name in front_ends:
+        path = os.path.join(root, name)
+        with open(path, encoding='utf-8') as file:
+            modes = ['fast', 'splash'] if 'run_app' in file.read() else ['fast']
+        for mode in modes:
+            try:
+                # Окна пишут историю в текущий каталог - запуск во временном
+                with tempfile.TemporaryDirectory() as directory:
+                    results = [_measure(path, mode, env, directory) for _ in range(repeat)]
+            except RuntimeError as e:
+                rows.append([name, mode, '-', '-', str(e)])
+                continue
+            best = min(results, key=lambda result: result['window'])
+            rows.append([name, mode, f"{best['import']:.3f}", f"{best['window']:.3f}", ''])
+    print_table(['интерфейс', 'запуск', 'импорт, с', 'окно, с', 'ошибка'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--front-ends', nargs='+', default=FRONT_ENDS)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.front_ends, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
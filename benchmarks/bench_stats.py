@@ -0,0 +1,68 @@
+"""
+Потоковая статистика (rng.stats): скорость, размер состояния и точность.
+
+Для каждого накопителя замеряется скорость обработки порций, число байт
+состояния после прохода и ошибка относительно точного расчёта по всему
+массиву; отдельно - объединение статистики, посчитанной по частям.
+"""
+import argparse
+import pickle
+
+import numpy as np
+
+from benchmarks import best_time, print_table
+from rng.engine import generate_array
+from rng.stats import HyperLogLog, Moments, QuantileSketch, StreamStats
+from rng.stream import DEFAULT_CHUNK_SIZE
+
+QUANTILES = (0.01, 0.5, 0.99)
+
+
+def _feed(accumulator, values):
+    for start in range(0, len(values), DEFAULT_CHUNK_SIZE):
+        accumulator.update(values[start:start + DEFAULT_CHUNK_SIZE])
+    return accumulator
+
+
+def _errors(stats, values):
+    ordered = np.sort(values)
+    rank_error = max(abs(np.searchsorted(ordered, estimate) / len(values) - q)
+                     for q, estimate in zip(QUANTILES, stats.sketch.quantiles(QUANTILES)))
+    distinct = len(np.unique(ordered))
+    return (abs(stats.moments.mean - values.mean()), abs(stats.moments.variance / values.var(ddof=1) - 1),
+            rank_error, abs(stats.distinct.estimate() / distinct - 1))
+
+
+def run(count, max_val, parts, repeat):
+    values = generate_array(count, 1, max_val)
+    rows = []
+    for name, factory in [('Moments', Moments), ('QuantileSketch', QuantileSketch),
+                          ('HyperLogLog', HyperLogLog), ('StreamStats', StreamStats)]:
+        seconds = best_time(lambda: _feed(factory(), values), repeat)
+        state = len(pickle.dumps(_feed(factory(), values)))
+        rows.append([name, f"{count / seconds / 1e6:.1f}", state])
+    print_table(['накопитель', 'млн значений/с', 'байт состояния'], rows)
+    print()
+
+    whole = _feed(StreamStats(), values)
+    merged = StreamStats()
+    for part in np.array_split(values, parts):
+        merged.merge(_feed(StreamStats(), part))
+    rows = [[label, *(f"{error:.2e}" for error in _errors(stats, values))]
+            for label, stats in [('один проход', whole), (f'{parts} частей + merge', merged)]]
+    print_table(['статистика', 'ошибка среднего', 'отн. ошибка дисперсии', 'ошибка ранга',
+                 'отн. ошибка различных'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10 ** 7)
+    parser.add_argument('--max', type=int, default=10 ** 9)
+    parser.add_argument('--parts', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.max, args.parts, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Скорость выборки уникальных чисел при разной плотности count / диапазон.
+
+После замеров каждый алгоритм проверяется на граничных диапазонах int64 и
+uint64: все значения должны лежать в [min_val, max_val] и не повторяться.
+"""
+import argparse
+import random
+
+from benchmarks import best_time, print_table
+from rng.unique import METHODS, choose_method, sample_unique
+
+DENSITIES = [1e-6, 1e-3, 0.05, 0.3, 0.6, 0.95, 1.0]
+# Граничные диапазоны: весь int64, весь uint64, верхняя половина uint64, края int64
+EDGE_RANGES = [(-2 ** 63, 2 ** 63 - 1), (0, 2 ** 64 - 1), (2 ** 63, 2 ** 64 - 1),
+               (-2 ** 63, -2 ** 63 + 99), (2 ** 63 - 100, 2 ** 63 - 1), (-50, 49)]
+
+
+def run(count, repeat):
+    rows = []
+    for density in DENSITIES:
+        span = max(count, int(count / density))
+        auto = choose_method(count, span)
+        for method in METHODS + ('random.sample',):
+            if method == 'random.sample':
+                if span > 1 << 40:
+                    continue
+                func = lambda: random.sample(range(span), count)
+            else:
+                if method == 'fisher_yates' and span > 1 << 26:
+                    continue
+                if method == 'floyd' and count > 1 << 20:
+                    continue
+                if method == 'rejection' and density > 0.6:
+                    # Отбраковка при почти полном диапазоне сводится к задаче о купонах
+                    continue
+                func = lambda method=method: sample_unique(0, span - 1, count, method=method)
+            seconds = best_time(func, repeat)
+            mark = '*' if method == auto else ''
+            rows.append([density, span, method + mark, f"{seconds:.4f}", f"{count / seconds / 1e6:.2f}"])
+    print_table(['плотность', 'диапазон', 'алгоритм', 'сек', 'млн/с'], rows)
+    print("* - алгоритм, выбираемый автоматически")
+    print()
+    check_ranges()
+
+
+def check_ranges(count=100):
+    """
+    Проверка границ и различности значений на EDGE_RANGES.
+    """
+    rows = []
+    for min_val, max_val in EDGE_RANGES:
+        for method in METHODS:
+            if method == 'fisher_yates' and max_val - min_val >= 1 << 26:
+                continue
+            values = [int(value) for value in sample_unique(min_val, max_val, count, method=method)]
+            inside = all(min_val <= value <= max_val for value in values)
+            rows.append([min_val, max_val, method, 'да' if inside else 'НЕТ',
+                         'да' if len(set(values)) == count else 'НЕТ'])
+    print_table(['min', 'max', 'алгоритм', 'в диапазоне', 'различны'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
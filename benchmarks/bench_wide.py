@@ -0,0 +1,46 @@
+"""
+Длинные целые (rng.wide): скорость по ширине диапазона и виду результата.
+
+Для каждой ширины замеряются два диапазона: [0, 2**bits - 1] (без
+отбраковки) и [0, 2**(bits - 1)] (отбраковывается почти половина
+значений). Для сравнения - random.randrange по одному числу.
+"""
+import argparse
+import random
+
+from benchmarks import best_time, print_table
+from rng.backends import create_generator
+from rng.wide import FAST_BITS, OUTPUTS, byte_width, wide_integers
+
+WIDTHS = (32, 64, 96, 128, 160, 256)
+
+
+def run(widths, count, repeat, source):
+    generator = None if source else create_generator('pcg64', 1)
+    rows = []
+    for bits in widths:
+        for label, max_val in [('2**n - 1', (1 << bits) - 1), ('2**(n-1)', 1 << (bits - 1))]:
+            baseline = best_time(lambda: [random.randrange(max_val + 1) for _ in range(count)], repeat)
+            width = byte_width(0, max_val)
+            for output in OUTPUTS:
+                seconds = best_time(lambda: wide_integers(0, max_val, count, output, generator, source),
+                                    repeat)
+                rows.append([bits, label, 'numpy' if width * 8 <= FAST_BITS else 'int', output,
+                             f"{count / seconds / 1e6:.2f}", f"{count * width / seconds / 2 ** 20:.0f}",
+                             f"{baseline / seconds:.1f}"])
+    print_table(['бит', 'максимум', 'путь', 'вид', 'млн чисел/с', 'МБ/с', 'быстрее randrange'], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--widths', type=int, nargs='+', default=list(WIDTHS))
+    parser.add_argument('--count', type=int, default=10 ** 5)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--source', choices=['os', 'chacha20'], default=None,
+                        help="криптостойкий источник вместо pcg64")
+    args = parser.parse_args()
+    run(args.widths, args.count, args.repeat, args.source)
+
+
+if __name__ == '__main__':
+    main()
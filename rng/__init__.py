@@ -0,0 +1,41 @@
+"""
+Ядро генератора случайных чисел без зависимостей от графического интерфейса.
+
+Имена пакета загружаются при первом обращении, поэтому import rng.history
+или import rng.replay не тянут за собой остальные модули.
+"""
+import importlib
+
+# Имя -> модуль, в котором оно определено
+_EXPORTS = {
+    'ChunkStream': 'rng.stream',
+    'GenerationJob': 'rng.jobs',
+    'JobCancelled': 'rng.jobs',
+    'LineIndex': 'rng.dataset',
+    'ParallelGenerator': 'rng.parallel',
+    'RandomNumberGenerator': 'rng.core',
+    'RandomPool': 'rng.pool',
+    'ReplayDescriptor': 'rng.replay',
+    'SeededGenerator': 'rng.core',
+    'StreamStats': 'rng.stats',
+    'create_job': 'rng.jobs',
+    'get_pool': 'rng.pool',
+    'stream_advanced': 'rng.stream',
+    'stream_crypto': 'rng.stream',
+    'stream_random': 'rng.stream',
+    'wide_integers': 'rng.wide',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'rng' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,503 @@
+"""
+Сменные алгоритмы генерации (бэкенды) с собственным состоянием.
+
+Бэкенды NumPy (MT19937, PCG64, Philox, SFC64) подключаются как есть.
+SplitMix64 и Xoshiro256** в NumPy отсутствуют и реализованы здесь векторно
+поверх массивов uint64; класс WordGenerator даёт для них тот же набор методов
+numpy.random.Generator, которым пользуется пакет (integers, random, choice,
+shuffle и распределения), так что остальной код не различает бэкенды.
+
+    generator = create_generator('xoshiro256**', seed=42)
+    state = get_state(generator)   # можно сохранить в JSON
+    ...
+    set_state(generator, state)
+"""
+import math
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_BACKEND = 'pcg64'
+
+_UINT64_SPAN = 1 << 64
+
+
+def mix64(z):
+    """
+    Финализатор SplitMix64: биективное перемешивание битов массива uint64.
+    """
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _rotl64(x, n):
+    return (x << np.uint64(n)) | (x >> np.uint64(64 - n))
+
+
+class SplitMix64:
+    """
+    SplitMix64: счётчик с шагом золотого сечения и перемешиванием.
+
+    Выход с номером i зависит только от начального состояния и i, поэтому
+    блок любой длины вычисляется одной векторной операцией.
+    """
+    GAMMA = 0x9E3779B97F4A7C15
+
+    def __init__(self, seed=0):
+        self._state = seed % _UINT64_SPAN
+        self.lock = threading.Lock()
+
+    def random_raw(self, size=None):
+        """
+        Массив из size слов uint64 (одно слово при size=None).
+        """
+        count = 1 if size is None else size
+        with self.lock:
+            steps = np.arange(1, count + 1, dtype=np.uint64) * np.uint64(self.GAMMA)
+            words = mix64(steps + np.uint64(self._state))
+            self._state = (self._state + self.GAMMA * count) % _UINT64_SPAN
+        return words[0] if size is None else words
+
+    def advance(self, delta):
+        """
+        Пропуск delta слов без их вычисления.
+        """
+        with self.lock:
+            self._state = (self._state + self.GAMMA * delta) % _UINT64_SPAN
+
+    @property
+    def state(self):
+        return {'bit_generator': 'SplitMix64', 'state': self._state}
+
+    @state.setter
+    def state(self, value):
+        self._state = int(value['state']) % _UINT64_SPAN
+
+
+class Xoshiro256StarStar:
+    """
+    Xoshiro256** в нескольких независимых дорожках.
+
+    Один шаг алгоритма выполняется сразу для всех дорожек, и слова выдаются
+    по шагам: сначала слово каждой дорожки для первого шага, затем для второго.
+    Дорожки получают начальное состояние из SplitMix64(seed), как рекомендуют
+    авторы алгоритма; при lanes=1 выход совпадает с эталонным xoshiro256**.
+    Невыданные слова хранятся в буфере, поэтому последовательность не зависит
+    от того, какими порциями её запрашивают.
+    """
+    DEFAULT_LANES = 4096
+
+    def __init__(self, seed=0, lanes=DEFAULT_LANES):
+        self._s = SplitMix64(seed).random_raw(4 * lanes).reshape(lanes, 4).T.copy()
+        self._buffer = np.empty(0, dtype=np.uint64)
+        self._pos = 0
+        self.lock = threading.Lock()
+
+    @property
+    def lanes(self):
+        return self._s.shape[1]
+
+    def _step(self, out):
+        s0, s1, s2, s3 = self._s
+        out[...] = _rotl64(s1 * np.uint64(5), 7) * np.uint64(9)
+        t = s1 << np.uint64(17)
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3[...] = _rotl64(s3, 45)
+
+    def random_raw(self, size=None):
+        """
+        Массив из size слов uint64 (одно слово при size=None).
+        """
+        count = 1 if size is None else size
+        with self.lock:
+            words = np.empty(count, dtype=np.uint64)
+            taken = min(count, len(self._buffer) - self._pos)
+            words[:taken] = self._buffer[self._pos:self._pos + taken]
+            self._pos += taken
+            if taken < count:
+                steps = -(-(count - taken) // self.lanes)
+                block = np.empty((steps, self.lanes), dtype=np.uint64)
+                for row in block:
+                    self._step(row)
+                block = block.reshape(-1)
+                words[taken:] = block[:count - taken]
+                self._buffer = block
+                self._pos = count - taken
+        return words[0] if size is None else words
+
+    @property
+    def state(self):
+        return {
+            'bit_generator': 'Xoshiro256StarStar',
+            'state': self._s.tolist(),
+            'buffer': self._buffer[self._pos:].tolist(),
+        }
+
+    @state.setter
+    def state(self, value):
+        self._s = np.array(value['state'], dtype=np.uint64)
+        self._buffer = np.array(value.get('buffer', []), dtype=np.uint64)
+        self._pos = 0
+
+
+_lgamma = np.vectorize(math.lgamma, otypes=[np.float64])
+
+
+def _inverse_table(start, log_pmf):
+    """
+    Таблица обратной функции распределения для дискретного распределения.
+    """
+    pmf = np.exp(log_pmf - log_pmf.max())
+    cdf = np.cumsum(pmf)
+    return start, cdf / cdf[-1]
+
+
+# Наибольшая дисперсия, для которой строится таблица обратной функции
+# распределения (около 24 тысяч значений, 200 КБ); при большей - отбраковка
+# PTRS / BTRS (Хёрманн), время которой от параметров не зависит
+TABLE_VARIANCE_LIMIT = 10 ** 6
+
+
+@lru_cache(maxsize=64)
+def _poisson_table(lam):
+    if lam == 0:
+        # Вырожденное распределение: всегда 0
+        return 0, np.ones(1)
+    # Хвосты дальше 12 стандартных отклонений имеют вероятность меньше 1e-30
+    width = 12 * math.sqrt(lam) + 30
+    k = np.arange(max(0, int(lam - width)), int(lam + width) + 1)
+    return _inverse_table(k[0], k * math.log(lam) - lam - _lgamma(k + 1.0))
+
+
+@lru_cache(maxsize=64)
+def _binomial_table(n, p):
+    width = 12 * math.sqrt(n * p * (1 - p)) + 30
+    k = np.arange(max(0, int(n * p - width)), min(n, int(n * p + width)) + 1)
+    log_pmf = (math.lgamma(n + 1) - _lgamma(k + 1.0) - _lgamma(n - k + 1.0)
+               + k * math.log(p) + (n - k) * math.log1p(-p))
+    return _inverse_table(k[0], log_pmf)
+
+
+def _as_uint64(value):
+    """
+    Целые числа (в том числе отрицательные) по модулю 2**64.
+    """
+    value = np.asarray(value)
+    if value.dtype == object:
+        value = np.array([int(v) % _UINT64_SPAN for v in value.ravel()], dtype=np.uint64).reshape(value.shape)
+    return value.astype(np.uint64)
+
+
+class WordGenerator:
+    """
+    Методы numpy.random.Generator поверх источника слов uint64 (random_raw).
+
+    Целые числа выбираются без смещения отбраковкой, вещественные берут
+    старшие 53 бита слова, распределения строятся из равномерных чисел:
+    нормальное - преобразованием Бокса-Мюллера, гамма - методом Марсальи-Цанга,
+    Пуассона и биномиальное - обратной функцией распределения по таблице.
+    """
+    def __init__(self, bit_generator):
+        self.bit_generator = bit_generator
+
+    def _words(self, count):
+        return self.bit_generator.random_raw(count)
+
+    @staticmethod
+    def _count(size):
+        return 1 if size is None else int(np.prod(size))
+
+    @staticmethod
+    def _shape(values, size):
+        return values[0] if size is None else values.reshape(size)
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        dtype = np.dtype(dtype)
+        count = out.size if out is not None else self._count(size)
+        words = self._words(count)
+        if dtype == np.float32:
+            values = (words >> np.uint64(40)).astype(np.float32) * np.float32(2.0 ** -24)
+        else:
+            values = (words >> np.uint64(11)).astype(np.float64) * (2.0 ** -53)
+        if out is not None:
+            out.reshape(-1)[...] = values
+            return out
+        return self._shape(values, size)
+
+    def integers(self, low, high=None, size=None, dtype=np.int64, endpoint=False):
+        if high is None:
+            low, high = 0, low
+        low_values, high_values = np.broadcast_arrays(np.asarray(low), np.asarray(high))
+        if np.any(high_values < low_values) or (not endpoint and np.any(high_values == low_values)):
+            raise ValueError("low >= high" if not endpoint else "low > high")
+        if size is None and low_values.ndim:
+            size = low_values.shape
+        count = self._count(size)
+        if low_values.ndim == 0:
+            values = self._integers_scalar(int(low_values), int(high_values) + bool(endpoint), count)
+            return self._shape(values.astype(dtype), size)
+        low_u = np.broadcast_to(_as_uint64(low_values), (count,) if low_values.ndim == 0 else low_values.shape).reshape(-1)
+        span = np.broadcast_to(_as_uint64(high_values), low_u.shape).reshape(-1) - low_u
+        if endpoint:
+            span = span + np.uint64(1)
+        low_u = np.broadcast_to(low_u, (count,))
+        span = np.broadcast_to(span, (count,))
+
+        # Нулевой span означает полный диапазон 2**64 (после переполнения)
+        full = span == 0
+        safe_span = np.where(full, np.uint64(1), span)
+        # Слово w принимается, если w >= 2**64 mod span (метод arc4random_uniform)
+        threshold = np.where(full, np.uint64(0), (np.uint64(0) - safe_span) % safe_span)
+        offsets = np.empty(count, dtype=np.uint64)
+        pending = np.arange(count)
+        while len(pending):
+            words = self._words(len(pending))
+            accepted = words >= threshold[pending]
+            index = pending[accepted]
+            offsets[index] = np.where(full[index], words[accepted], words[accepted] % safe_span[index])
+            pending = pending[~accepted]
+        values = (offsets + low_u).astype(dtype)
+        return self._shape(values, size)
+
+    def _integers_scalar(self, low, high, count):
+        """
+        Целые из [low, high) для скалярных границ: одна отбраковка на весь массив.
+        """
+        span = high - low
+        words = self._words(count)
+        if span < _UINT64_SPAN:
+            # Слово w принимается, если w >= 2**64 mod span (метод arc4random_uniform)
+            threshold = np.uint64((_UINT64_SPAN - span) % span)
+            rejected = np.flatnonzero(words < threshold)
+            while len(rejected):
+                words[rejected] = self._words(len(rejected))
+                rejected = rejected[words[rejected] < threshold]
+            words %= np.uint64(span)
+        return words + np.uint64(low % _UINT64_SPAN)
+
+    def permutation(self, x):
+        if isinstance(x, (int, np.integer)):
+            return np.argsort(self._words(int(x)), kind='stable')
+        x = np.asarray(x)
+        return x[np.argsort(self._words(len(x)), kind='stable')]
+
+    def shuffle(self, x):
+        x[...] = x[np.argsort(self._words(len(x)), kind='stable')]
+
+    def choice(self, a, size=None, replace=True, p=None):
+        population = np.arange(a) if isinstance(a, (int, np.integer)) else np.asarray(a)
+        count = self._count(size)
+        if p is not None:
+            cdf = np.cumsum(p, dtype=np.float64)
+            index = np.searchsorted(cdf / cdf[-1], self.random(count), side='right')
+        elif replace:
+            index = self.integers(0, len(population), count)
+        else:
+            if count > len(population):
+                raise ValueError("Cannot take a larger sample than population when replace is False")
+            index = np.argsort(self._words(len(population)), kind='stable')[:count]
+        return self._shape(population[index], size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + (high - low) * self.random(size)
+
+    def standard_normal(self, size=None):
+        count = self._count(size)
+        pairs = (count + 1) // 2
+        u1 = 1.0 - self.random(pairs)
+        u2 = self.random(pairs)
+        radius = np.sqrt(-2.0 * np.log(u1))
+        values = np.concatenate([radius * np.cos(2 * np.pi * u2), radius * np.sin(2 * np.pi * u2)])[:count]
+        return self._shape(values, size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        if scale < 0:
+            raise ValueError("scale < 0")
+        return loc + scale * self.standard_normal(size)
+
+    def lognormal(self, mean=0.0, sigma=1.0, size=None):
+        return np.exp(self.normal(mean, sigma, size))
+
+    def exponential(self, scale=1.0, size=None):
+        if scale < 0:
+            raise ValueError("scale < 0")
+        return -scale * np.log1p(-self.random(size))
+
+    def standard_gamma(self, shape, size=None):
+        if shape <= 0:
+            raise ValueError("shape <= 0")
+        count = self._count(size)
+        if shape < 1:
+            # Усиление: Gamma(a) = Gamma(a + 1) * U**(1/a)
+            values = self.standard_gamma(shape + 1.0, count) * self.random(count) ** (1.0 / shape)
+            return self._shape(values, size)
+        d = shape - 1.0 / 3.0
+        c = 1.0 / math.sqrt(9.0 * d)
+        values = np.empty(count)
+        pending = np.arange(count)
+        while len(pending):
+            x = self.standard_normal(len(pending))
+            v = (1.0 + c * x) ** 3
+            u = self.random(len(pending))
+            with np.errstate(invalid='ignore', divide='ignore'):
+                accepted = (v > 0) & (np.log(u) < 0.5 * x * x + d - d * v + d * np.log(v))
+            values[pending[accepted]] = d * v[accepted]
+            pending = pending[~accepted]
+        return self._shape(values, size)
+
+    def gamma(self, shape, scale=1.0, size=None):
+        return scale * self.standard_gamma(shape, size)
+
+    def beta(self, a, b, size=None):
+        x = self.standard_gamma(a, size)
+        return x / (x + self.standard_gamma(b, size))
+
+    def _discrete(self, table, size):
+        start, cdf = table
+        index = np.searchsorted(cdf, self.random(self._count(size)), side='right')
+        return self._shape(start + np.minimum(index, len(cdf) - 1), size)
+
+    def _transformed_rejection(self, count, a, b, shift, squeeze, accept):
+        """
+        Общая схема PTRS / BTRS: кандидат k = floor((2a / us + b) * u + shift).
+
+        Кандидаты в «сжатой» области (us >= 0.07, v <= squeeze) принимаются
+        сразу, остальные - по accept(k, us, v) (маска для массивов).
+        """
+        values = np.empty(count, dtype=np.int64)
+        pending = np.arange(count)
+        while len(pending):
+            u = self.random(len(pending)) - 0.5
+            v = self.random(len(pending))
+            us = 0.5 - np.abs(u)
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                k = np.floor((2 * a / us + b) * u + shift)
+                accepted = (us >= 0.07) & (v <= squeeze)
+                rest = np.flatnonzero(~accepted & np.isfinite(k))
+                accepted[rest] = accept(k[rest], us[rest], v[rest])
+            values[pending[accepted]] = k[accepted]
+            pending = pending[~accepted]
+        return values
+
+    def _poisson_ptrs(self, lam, count):
+        slam = math.sqrt(lam)
+        b = 0.931 + 2.53 * slam
+        a = -0.059 + 0.02483 * b
+        log_alpha = math.log(1.1239 + 1.1328 / (b - 3.4))
+
+        def accept(k, us, v):
+            valid = (k >= 0) & ~((us < 0.013) & (v > us))
+            k = np.where(valid, k, 0.0)
+            bound = -lam + k * math.log(lam) - _lgamma(k + 1.0)
+            return valid & (np.log(v) + log_alpha - np.log(a / (us * us) + b) <= bound)
+        return self._transformed_rejection(count, a, b, lam + 0.43, 0.9277 - 3.6224 / (b - 2), accept)
+
+    def _binomial_btrs(self, n, p, count):
+        # Для p > 1/2 считается число неудач
+        flip = p > 0.5
+        p = 1.0 - p if flip else p
+        q = 1.0 - p
+        spq = math.sqrt(n * p * q)
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        alpha = (2.83 + 5.1 / b) * spq
+        m = math.floor((n + 1) * p)
+        h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+        log_ratio = math.log(p / q)
+
+        def accept(k, us, v):
+            valid = (k >= 0) & (k <= n)
+            k = np.where(valid, k, 0.0)
+            bound = h - _lgamma(k + 1.0) - _lgamma(n - k + 1.0) + (k - m) * log_ratio
+            return valid & (np.log(v * alpha / (a / (us * us) + b)) <= bound)
+        values = self._transformed_rejection(count, a, b, n * p + 0.5, 0.92 - 4.2 / b, accept)
+        return n - values if flip else values
+
+    def poisson(self, lam=1.0, size=None):
+        if lam < 0:
+            raise ValueError("lam < 0")
+        if lam > TABLE_VARIANCE_LIMIT:
+            return self._shape(self._poisson_ptrs(float(lam), self._count(size)), size)
+        return self._discrete(_poisson_table(float(lam)), size)
+
+    def binomial(self, n, p, size=None):
+        if n < 0 or not 0 <= p <= 1:
+            raise ValueError("n < 0 или p вне [0, 1]")
+        if p in (0, 1) or n == 0:
+            return self._shape(np.full(self._count(size), int(n * p)), size)
+        if n * p * (1 - p) > TABLE_VARIANCE_LIMIT:
+            return self._shape(self._binomial_btrs(int(n), float(p), self._count(size)), size)
+        return self._discrete(_binomial_table(int(n), float(p)), size)
+
+
+def _numpy_backend(bit_generator):
+    return lambda seed: np.random.Generator(bit_generator(seed))
+
+
+# Фабрики генераторов по имени бэкенда: factory(seed) -> генератор
+BACKENDS = {
+    'mt19937': _numpy_backend(np.random.MT19937),
+    'pcg64': _numpy_backend(np.random.PCG64),
+    'philox': _numpy_backend(np.random.Philox),
+    'sfc64': _numpy_backend(np.random.SFC64),
+    'xoshiro256**': lambda seed: WordGenerator(Xoshiro256StarStar(seed)),
+    'splitmix64': lambda seed: WordGenerator(SplitMix64(seed)),
+}
+
+
+def create_generator(backend=DEFAULT_BACKEND, seed=None):
+    """
+    Новый генератор выбранного бэкенда с начальным значением seed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестный алгоритм генерации: {backend}")
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    return BACKENDS[backend](seed)
+
+
+def _plain(value):
+    """
+    Состояние без массивов NumPy, пригодное для JSON.
+    """
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def _arrays(value):
+    """
+    Обратное преобразование списков состояния NumPy в массивы uint64.
+    """
+    if isinstance(value, dict):
+        return {key: _arrays(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return np.array(value, dtype=np.uint64)
+    return value
+
+
+def get_state(generator):
+    """
+    Снимок состояния генератора.
+    """
+    return _plain(generator.bit_generator.state)
+
+
+def set_state(generator, state):
+    """
+    Восстановление состояния из снимка get_state.
+    """
+    if isinstance(generator, WordGenerator):
+        generator.bit_generator.state = state
+    else:
+        generator.bit_generator.state = _arrays(state)
@@ -0,0 +1,533 @@
+"""
+Консольная утилита rng для генерации случайных чисел без графического интерфейса.
+
+Числа выводятся в stdout по одному в строке и пишутся порциями, поэтому
+вывод можно сразу перенаправлять в файл или другой процесс:
+
+    python -m rng random --min 1 --max 100 --count 1000000 > numbers.txt
+    python -m rng random --type float --min 0 --max 1 --decimals 6 --count 10
+    python -m rng --backend 'xoshiro256**' --seed 42 random --count 10
+    python -m rng weighted --table weights.txt --count 1000
+    python -m rng distribution normal -p mean=5 -p sigma=2 --count 10
+    python -m rng crypto --min 0 --max 255 --unlimited | head -n 1000
+    python -m rng password --length 16 --count 3
+    python -m rng wide --bits 128 --count 1000 --as hex
+    python -m rng wide --min=-2**100 --max 2**100 --count 10
+    python -m rng dataset shuffle big.csv --header > shuffled.csv
+    python -m rng --seed 1 dataset sample big.csv --size 1000 --weight-field 3 --delimiter ,
+    python -m rng --output numbers.npy random --min 1 --max 100 --count 100000000
+    python -m rng history --last 5
+    python -m rng history --replay 12 --start 1000000 --stop 1000010
+    python -m rng replay rng1:eNpFjcEK... --start 0 --stop 100
+    python -m rng serve --port 8000 --stream-port 8001
+    python -m rng --stats unique --min 1 --max 1000000000 --count 1000000 > /dev/null
+"""
+import argparse
+import itertools
+import os
+import sys
+
+from rng.backends import BACKENDS, DEFAULT_BACKEND, create_generator
+from rng.crypto import SOURCES
+from rng.dataset import LineIndex, reservoir_sample, sample_lines, shuffle_lines, weighted_sample_lines
+from rng.distributions import distribution_names, get_distribution, parse_params
+from rng.engine import FLOAT_DECIMALS, INT64_MAX, INT64_MIN, parse_decimals
+from rng.export import FORMATS, export_job
+from rng.history import DEFAULT_HISTORY_PATH, HistoryStore, format_record, replay_job
+from rng.jobs import create_job
+from rng.passwords import AMBIGUOUS_CHARACTERS, PasswordGenerator, PasswordPolicy
+from rng.replay import ReplayDescriptor
+from rng.stats import StreamStats, observe
+from rng.stream import stream_advanced, stream_crypto, stream_random
+from rng.text import format_lines, text_decimals
+from rng.unique import sample_unique
+from rng.weighted import WeightedSampler, load_weight_table
+from rng.wide import OUTPUTS, parse_integer, wide_integers
+
+# Значения и веса взвешенной генерации по умолчанию (как в графическом интерфейсе)
+DEFAULT_WEIGHTED_VALUES = [1, 2, 3, 4, 5]
+DEFAULT_WEIGHTS = [0.1, 0.2, 0.3, 0.2, 0.2]
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def write_values(values, out):
+    """
+    Запись порции значений, по одному в строке.
+    """
+    if values:
+        out.write('\n'.join(map(str, values)))
+        out.write('\n')
+
+
+def _chunks(count, chunk_size):
+    """
+    Разбиение общего количества на порции.
+    """
+    while count > 0:
+        size = min(count, chunk_size)
+        yield size
+        count -= size
+
+
+def _total(args):
+    """
+    Общее количество чисел (None при неограниченном выводе).
+    """
+    return None if args.unlimited else args.count
+
+
+def write_chunk(chunk, out, decimals=None):
+    """
+    Запись порции массива целиком (rng.text), по одному значению в строке.
+    """
+    out.write(format_lines(chunk, decimals).decode('utf-8'))
+
+
+def _write_stream(stream, out, stats=None, decimals=None):
+    if stats is not None:
+        stream = observe(stream, stats)
+    for chunk in stream:
+        write_chunk(chunk, out, decimals)
+
+
+def _check_bounds(args):
+    if args.type == 'int' and not (isinstance(args.min, int) and isinstance(args.max, int)):
+        raise ValueError("Границы целых чисел должны быть целыми")
+
+
+def _run_random(args, out):
+    _check_bounds(args)
+    decimals = args.decimals if args.type == 'float' else None
+    _write_stream(stream_random(args.min, args.max, args.type, args.chunk_size, _total(args),
+                                decimals=decimals, generator=args.generator), out, args.stats, decimals)
+
+
+def _run_unique(args, out):
+    values = sample_unique(args.min, args.max, args.count, generator=args.generator)
+    if args.stats is not None:
+        args.stats.update(values)
+    write_chunk(values, out)
+
+
+def _weight_table(args):
+    """
+    Значения и веса из файла таблицы или аргументов.
+    """
+    if args.table:
+        return load_weight_table(args.table)
+    values = args.values or DEFAULT_WEIGHTED_VALUES
+    weights = args.weights or (DEFAULT_WEIGHTS if args.values is None else None)
+    return values, weights
+
+
+def _run_weighted(args, out):
+    sampler = WeightedSampler(*_weight_table(args))
+    for size in _chunks(args.count, args.chunk_size):
+        values = sampler.sample(size, args.generator)
+        if args.stats is not None:
+            args.stats.update(values)
+        write_chunk(values, out)
+
+
+def _run_distribution(args, out):
+    params = parse_params(','.join(args.param))
+    _write_stream(stream_advanced(args.name, args.chunk_size, _total(args),
+                                  generator=args.generator, **params), out, args.stats)
+
+
+def _run_crypto(args, out):
+    _write_stream(stream_crypto(args.min, args.max, args.chunk_size, _total(args),
+                                source=args.source), out, args.stats)
+
+
+def _run_password(args, out):
+    policy = PasswordPolicy(args.length, args.uppercase, args.numbers, args.symbols,
+                            args.exclude_ambiguous, args.require_each_class)
+    generator = PasswordGenerator(policy, args.source)
+    for block in generator.iter_lines(_total(args), args.chunk_size):
+        if args.stats is not None:
+            args.stats.update(block.split(b'\n')[:-1])
+        out.write(block.decode('ascii'))
+
+
+def _wide_range(args):
+    """
+    Границы режима wide: --bits N задаёт [0, 2**N - 1] вместо --min и --max.
+    """
+    if args.bits is None:
+        return args.min, args.max
+    if args.bits < 1:
+        raise ValueError("Число бит должно быть положительным")
+    return 0, (1 << args.bits) - 1
+
+
+def _run_wide(args, out):
+    min_val, max_val = _wide_range(args)
+    if args.output_as == 'bytes':
+        # Байты пишутся подряд, без разделителей, в двоичный поток
+        binary = getattr(out, 'buffer', None)
+        if binary is None:
+            raise ValueError("Байты можно выводить только в двоичный поток")
+        out.flush()
+    # Числа шире int64 numpy привёл бы к float64 - статистика считает их как строки
+    exact = min_val >= INT64_MIN and max_val <= INT64_MAX
+    sizes = itertools.repeat(args.chunk_size) if args.unlimited else _chunks(args.count, args.chunk_size)
+    for size in sizes:
+        values = wide_integers(min_val, max_val, size, args.output_as, args.generator, args.source)
+        if args.output_as == 'bytes':
+            if args.stats is not None:
+                args.stats.update([row.tobytes() for row in values])
+            binary.write(values.tobytes())
+            continue
+        if args.stats is not None:
+            args.stats.update(values if exact or args.output_as == 'hex' else list(map(str, values)))
+        write_values(values, out)
+    if args.output_as == 'bytes':
+        binary.flush()
+
+
+class _DecodedWriter:
+    """
+    Двоичный вывод поверх текстового потока без buffer (например, io.StringIO).
+    """
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, data):
+        self.out.write(data.decode('utf-8', 'replace'))
+
+    def flush(self):
+        self.out.flush()
+
+
+def _binary_output(out):
+    binary = getattr(out, 'buffer', None)
+    if binary is None:
+        return _DecodedWriter(out)
+    out.flush()
+    return binary
+
+
+def _check_dataset(args):
+    if args.size is not None and args.size < 0:
+        raise ValueError("Размер выборки не может быть отрицательным")
+    if args.action == 'sample' and args.size is None:
+        raise ValueError("Для выборки нужен размер (--size)")
+    if args.action == 'shuffle' and args.weight_field is not None:
+        raise ValueError("Веса (--weight-field) используются только при выборке")
+
+
+def _sample_stdin(args, binary, on_chunk):
+    """
+    Выборка из stdin: длина потока заранее неизвестна, индекс не строится.
+    """
+    if args.weight_field is not None:
+        raise ValueError("Взвешенная выборка требует файла, а не stdin")
+    lines = sys.stdin.buffer
+    if args.header:
+        binary.write(lines.readline())
+    chosen = reservoir_sample(lines, args.size, args.generator)
+    if on_chunk is not None:
+        on_chunk(chosen)
+    # Последняя строка потока может быть без перевода строки
+    binary.write(b''.join(line if line.endswith(b'\n') else line + b'\n' for line in chosen))
+
+
+def _run_dataset(args, out):
+    _check_dataset(args)
+    binary = _binary_output(out)
+    on_chunk = None
+    if args.stats is not None:
+        on_chunk = lambda lines: args.stats.update([line.rstrip(b'\n') for line in lines])
+    if args.file == '-':
+        if args.action == 'shuffle':
+            raise ValueError("Перемешивание требует файла, а не stdin")
+        _sample_stdin(args, binary, on_chunk)
+        binary.flush()
+        return
+    with LineIndex(args.file) as index:
+        first = min(1, len(index)) if args.header else 0
+        window = args.chunk_size
+        if args.action == 'shuffle':
+            shuffle_lines(index, binary, args.generator, first, window, on_chunk)
+        elif args.weight_field is None:
+            sample_lines(index, binary, args.size, args.generator, first, window, on_chunk)
+        else:
+            weighted_sample_lines(index, binary, args.size, args.weight_field, args.delimiter,
+                                  args.generator, first, window, on_chunk)
+    binary.flush()
+
+
+def _run_history(args, out):
+    with HistoryStore(args.file) as history:
+        if args.replay is None:
+            for record in history.tail(args.last):
+                out.write(format_record(record) + '\n\n')
+            return
+        if not -len(history) <= args.replay < len(history):
+            raise ValueError(f"В истории нет записи #{args.replay}")
+        record = history.get(args.replay)
+        job = replay_job(record, args.start, args.stop)
+    _write_stream(job.iter_chunks(), out, args.stats, text_decimals(record['params']))
+
+
+def _run_replay(args, out):
+    descriptor = ReplayDescriptor.from_token(args.token)
+    job = descriptor.job(args.start, args.stop)
+    _write_stream(job.iter_chunks(), out, args.stats,
+                  text_decimals(dict(descriptor.params, mode=descriptor.mode)))
+
+
+def _run_serve(args, out):
+    # Импорт здесь: asyncio нужен только сервису
+    from rng.server import serve
+
+    def on_start(addresses):
+        for name, address in addresses.items():
+            out.write(f"{name}: {address if name == 'unix' else '%s:%d' % tuple(address)}\n")
+        out.flush()
+
+    serve(args.host, args.port, args.stream_port, args.unix, args.workers, args.chunk_size, on_start)
+
+
+def _add_slice(parser):
+    parser.add_argument('--start', type=int, default=0, help="номер первого значения (по умолчанию 0)")
+    parser.add_argument('--stop', type=int, default=None,
+                        help="номер после последнего значения (по умолчанию до конца)")
+
+
+def _export(args):
+    """
+    Генерация прямо в двоичный файл (--output) вместо текстового вывода.
+    """
+    if getattr(args, 'unlimited', False):
+        raise ValueError("Двоичный экспорт требует конечного количества (--count)")
+    metadata = {'mode': args.mode}
+    if args.mode == 'random':
+        _check_bounds(args)
+        job = create_job('random', args.count, args.min, args.max, args.type,
+                         generator=args.generator, chunk_size=args.chunk_size, decimals=args.decimals)
+        metadata.update(min=args.min, max=args.max)
+        if args.type == 'float':
+            metadata.update(decimals=args.decimals)
+    elif args.mode == 'unique':
+        job = create_job('unique', args.count, args.min, args.max, generator=args.generator)
+        metadata.update(min=args.min, max=args.max)
+    elif args.mode == 'weighted':
+        values, weights = _weight_table(args)
+        job = create_job('weighted', args.count, numbers=values, weights=weights,
+                         generator=args.generator, chunk_size=args.chunk_size)
+        metadata.update(values=values, weights=weights)
+    elif args.mode == 'distribution':
+        params = parse_params(','.join(args.param))
+        job = create_job('distribution', args.count, distribution=args.name, params=params,
+                         generator=args.generator, chunk_size=args.chunk_size)
+        metadata.update(distribution=get_distribution(args.name).name, params=params)
+    elif args.mode == 'crypto':
+        job = create_job('crypto', args.count, args.min, args.max, source=args.source,
+                         chunk_size=args.chunk_size)
+        metadata.update(min=args.min, max=args.max)
+    elif args.mode == 'replay':
+        descriptor = ReplayDescriptor.from_token(args.token)
+        job = descriptor.job(args.start, args.stop)
+        metadata.update(replay=descriptor.to_dict(), start=args.start)
+    else:
+        raise ValueError(f"Режим {args.mode} не поддерживает двоичный экспорт")
+    if args.seed is not None and args.mode not in ('crypto', 'replay'):
+        metadata.update(backend=args.backend or DEFAULT_BACKEND, seed=args.seed)
+    export_job(job, args.output, metadata, args.format,
+               on_chunk=None if args.stats is None else args.stats.update)
+
+
+def _add_unlimited(parser):
+    parser.add_argument('--unlimited', action='store_true',
+                        help="выводить числа без ограничения количества")
+
+
+def _number(text):
+    """
+    Целое или вещественное число из строки.
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _add_range(parser, number=int):
+    parser.add_argument('--min', type=number, default=0, help="минимальное значение (по умолчанию 0)")
+    parser.add_argument('--max', type=number, default=100, help="максимальное значение (по умолчанию 100)")
+
+
+def build_parser():
+    """
+    Создание парсера аргументов командной строки.
+    """
+    parser = argparse.ArgumentParser(prog='rng', description="Генератор случайных чисел")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="размер порции при потоковом выводе")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=None,
+                        help=f"алгоритм генерации (по умолчанию {DEFAULT_BACKEND})")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="начальное значение для воспроизводимого вывода")
+    parser.add_argument('--output', default=None,
+                        help="записать числа в двоичный файл (.bin, .npy, .arrow, .parquet)")
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help="формат файла --output (по умолчанию по расширению)")
+    parser.add_argument('--stats', action='store_true',
+                        help="вывести в stderr статистику результата: среднее, отклонение, квантили, "
+                             "число различных значений и повторов")
+    subparsers = parser.add_subparsers(dest='mode', required=True)
+
+    random_parser = subparsers.add_parser('random', help="случайные числа")
+    # Вещественные границы допустимы только для --type float
+    _add_range(random_parser, _number)
+    random_parser.add_argument('--type', choices=['int', 'float'], default='int', help="тип числа")
+    random_parser.add_argument('--decimals', type=parse_decimals, default=FLOAT_DECIMALS,
+                               help=f"знаков после запятой у вещественных чисел (по умолчанию "
+                                    f"{FLOAT_DECIMALS}, full - все 53 бита без округления)")
+    random_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    _add_unlimited(random_parser)
+    random_parser.set_defaults(run=_run_random)
+
+    unique_parser = subparsers.add_parser('unique', help="уникальные числа")
+    _add_range(unique_parser)
+    unique_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    unique_parser.set_defaults(run=_run_unique)
+
+    weighted_parser = subparsers.add_parser('weighted', help="взвешенная генерация")
+    weighted_parser.add_argument('--values', type=int, nargs='+', help="значения (по умолчанию 1..5)")
+    weighted_parser.add_argument('--weights', type=float, nargs='+', help="веса значений")
+    weighted_parser.add_argument('--table', help="файл таблицы: строки \"значение вес\"")
+    weighted_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    weighted_parser.set_defaults(run=_run_weighted)
+
+    distribution_parser = subparsers.add_parser('distribution', help="числа по распределению")
+    distribution_parser.add_argument('name', help="распределение: " + ', '.join(
+        alias for name in distribution_names() for alias in get_distribution(name).aliases))
+    distribution_parser.add_argument('-p', '--param', action='append', default=[],
+                                     help="параметр распределения, например mean=0 или lam=2")
+    distribution_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    _add_unlimited(distribution_parser)
+    distribution_parser.set_defaults(run=_run_distribution)
+
+    crypto_parser = subparsers.add_parser('crypto', help="криптостойкие числа")
+    _add_range(crypto_parser)
+    crypto_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    crypto_parser.add_argument('--source', choices=sorted(SOURCES), default=None,
+                               help="источник случайности (по умолчанию ОС)")
+    _add_unlimited(crypto_parser)
+    crypto_parser.set_defaults(run=_run_crypto)
+
+    wide_parser = subparsers.add_parser('wide', help="целые числа любой ширины (128 бит и больше)")
+    wide_parser.add_argument('--min', type=parse_integer, default=0,
+                             help="минимальное значение: десятичное, 0x... или 2**N (по умолчанию 0)")
+    wide_parser.add_argument('--max', type=parse_integer, default=(1 << 128) - 1,
+                             help="максимальное значение (по умолчанию 2**128 - 1)")
+    wide_parser.add_argument('--bits', type=int, default=None,
+                             help="диапазон [0, 2**bits - 1] вместо --min и --max")
+    wide_parser.add_argument('--count', type=int, default=1, help="количество чисел")
+    wide_parser.add_argument('--as', dest='output_as', choices=OUTPUTS, default='int',
+                             help="вид чисел: десятичные, hex фиксированной длины или байты подряд "
+                                  "(старшим байтом вперёд)")
+    wide_parser.add_argument('--source', choices=sorted(SOURCES), default=None,
+                             help="криптостойкий источник вместо генератора --backend")
+    _add_unlimited(wide_parser)
+    wide_parser.set_defaults(run=_run_wide)
+
+    password_parser = subparsers.add_parser('password', help="генератор паролей")
+    password_parser.add_argument('--length', type=int, default=12, help="длина пароля")
+    password_parser.add_argument('--count', type=int, default=5, help="количество паролей")
+    password_parser.add_argument('--no-uppercase', dest='uppercase', action='store_false',
+                                 help="без заглавных букв")
+    password_parser.add_argument('--no-numbers', dest='numbers', action='store_false',
+                                 help="без цифр")
+    password_parser.add_argument('--no-symbols', dest='symbols', action='store_false',
+                                 help="без спецсимволов")
+    password_parser.add_argument('--exclude-ambiguous', action='store_true',
+                                 help=f"без легко путаемых символов ({AMBIGUOUS_CHARACTERS})")
+    password_parser.add_argument('--require-each', dest='require_each_class', action='store_true',
+                                 help="требовать хотя бы один символ каждого выбранного класса")
+    password_parser.add_argument('--source', choices=sorted(SOURCES), default=None,
+                                 help="источник случайности (по умолчанию ОС)")
+    _add_unlimited(password_parser)
+    password_parser.set_defaults(run=_run_password)
+
+    dataset_parser = subparsers.add_parser('dataset', help="перемешивание и выборка строк большого файла")
+    dataset_parser.add_argument('action', choices=['shuffle', 'sample'],
+                                help="shuffle - все строки в случайном порядке, sample - выборка без повторений")
+    dataset_parser.add_argument('file', help="файл строк (для sample можно - для stdin)")
+    dataset_parser.add_argument('--size', type=int, default=None, help="размер выборки")
+    dataset_parser.add_argument('--weight-field', type=int, default=None,
+                                help="номер поля (с 1) с весом строки для взвешенной выборки")
+    dataset_parser.add_argument('--delimiter', default=None,
+                                help="разделитель полей (по умолчанию пробельные символы)")
+    dataset_parser.add_argument('--header', action='store_true',
+                                help="первая строка - заголовок, выводится первой без изменений")
+    dataset_parser.set_defaults(run=_run_dataset)
+
+    history_parser = subparsers.add_parser('history', help="история генерации")
+    history_parser.add_argument('--file', default=DEFAULT_HISTORY_PATH,
+                                help=f"файл истории (по умолчанию {DEFAULT_HISTORY_PATH})")
+    history_parser.add_argument('--last', type=int, default=10, help="сколько последних записей показать")
+    history_parser.add_argument('--replay', type=int, default=None,
+                                help="повторить генерацию записи с указанным номером")
+    _add_slice(history_parser)
+    history_parser.set_defaults(run=_run_history)
+
+    replay_parser = subparsers.add_parser('replay', help="воспроизведение результата по описанию")
+    replay_parser.add_argument('token', help="описание результата (строка rng1:...)")
+    _add_slice(replay_parser)
+    replay_parser.set_defaults(run=_run_replay)
+
+    serve_parser = subparsers.add_parser('serve', help="локальный сервис генерации (HTTP и поток)")
+    serve_parser.add_argument('--host', default='127.0.0.1', help="адрес (по умолчанию 127.0.0.1)")
+    serve_parser.add_argument('--port', type=int, default=8000,
+                              help="порт HTTP (по умолчанию 8000, 0 - любой свободный)")
+    serve_parser.add_argument('--stream-port', type=int, default=None,
+                              help="порт потокового протокола TCP")
+    serve_parser.add_argument('--unix', default=None, help="Unix-сокет потокового протокола")
+    serve_parser.add_argument('--workers', type=int, default=None,
+                              help="число потоков генерации (по умолчанию по числу ядер)")
+    serve_parser.set_defaults(run=_run_serve)
+
+    return parser
+
+
+def _print_stats(args):
+    if args.stats is not None:
+        print(args.stats.format(), file=sys.stderr)
+
+
+def main(argv=None, out=None):
+    """
+    Точка входа консольной утилиты.
+    """
+    args = build_parser().parse_args(argv)
+    out = sys.stdout if out is None else out
+    if args.chunk_size < 1:
+        print("Ошибка: размер порции должен быть положительным", file=sys.stderr)
+        return 2
+    # Статистика копится по тем же порциям, что выводятся, в памяти постоянного размера
+    args.stats = StreamStats() if args.stats else None
+    try:
+        args.generator = None
+        if args.backend is not None or args.seed is not None:
+            args.generator = create_generator(args.backend or DEFAULT_BACKEND, args.seed)
+        if args.output is not None:
+            _export(args)
+        else:
+            args.run(args, out)
+            out.flush()
+    except BrokenPipeError:
+        # Читатель закрыл канал (например, head) - это не ошибка
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        _print_stats(args)
+        return 0
+    except (ValueError, TypeError) as e:
+        print(f"Ошибка: {str(e)}", file=sys.stderr)
+        return 1
+    _print_stats(args)
+    return 0
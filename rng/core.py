@@ -0,0 +1,169 @@
+"""
+Генерация случайных чисел без графического интерфейса.
+
+Модуль не импортирует PyQt5 и matplotlib, поэтому подходит для консольных
+утилит и серверных сценариев.
+"""
+import secrets
+
+from rng.backends import DEFAULT_BACKEND, create_generator, get_state, set_state
+from rng.crypto import crypto_integers
+from rng.distributions import sample_distribution
+from rng.engine import FLOAT_DECIMALS, INT64_MAX, INT64_MIN, generate_array, get_generator
+from rng.passwords import get_password_generator
+from rng.pool import get_pool
+from rng.unique import sample_unique
+from rng.weighted import get_sampler
+from rng.wide import wide_integers
+
+
+class SeededGenerator:
+    """
+    Генератор случайных чисел с собственным состоянием.
+
+    Алгоритм выбирается параметром backend (см. rng.backends.BACKENDS),
+    одинаковые backend и seed дают одинаковые последовательности. Состояние
+    можно сохранить методом get_state и восстановить методом set_state.
+    Криптостойкие числа и пароли берутся из криптостойкого источника
+    и от бэкенда не зависят.
+    """
+    def __init__(self, backend=DEFAULT_BACKEND, seed=None, generator=None):
+        if generator is None:
+            if seed is None:
+                seed = secrets.randbits(128)
+            generator = create_generator(backend, seed)
+        self.backend = backend
+        self.seed = seed
+        self.generator = generator
+
+    def get_state(self):
+        """
+        Снимок состояния (словарь, пригодный для JSON).
+        """
+        return {'backend': self.backend, 'seed': self.seed, 'state': get_state(self.generator)}
+
+    def set_state(self, state):
+        """
+        Восстановление состояния из снимка get_state.
+        """
+        if state['backend'] != self.backend:
+            raise ValueError(f"Снимок сделан для алгоритма {state['backend']}, а не {self.backend}")
+        set_state(self.generator, state['state'])
+
+    def generate_random_number(self, min_val, max_val, num_type='int', decimals=FLOAT_DECIMALS):
+        """
+        Генерация случайного числа.
+
+        decimals - знаков после запятой у вещественного числа (None - без округления).
+        """
+        try:
+            return generate_array(1, min_val, max_val, num_type, decimals=decimals,
+                                  generator=self.generator)[0].item()
+        except Exception as e:
+            return f"Ошибка: {str(e)}"
+
+    def generate_random_sequence(self, length, min_val, max_val, num_type='int', decimals=FLOAT_DECIMALS):
+        """
+        Генерация последовательности случайных чисел.
+
+        Обёртка над векторизованным движком rng.engine, возвращающая список.
+        """
+        try:
+            return generate_array(length, min_val, max_val, num_type, decimals=decimals,
+                                  generator=self.generator).tolist()
+        except Exception as e:
+            return f"Ошибка: {str(e)}"
+
+    def generate_unique_numbers(self, min_val, max_val, count):
+        """
+        Генерация уникальных случайных чисел
+        """
+        try:
+            return sample_unique(min_val, max_val, count, generator=self.generator).tolist()
+        except ValueError:
+            return "Невозможно сгенерировать уникальные числа с заданными параметрами"
+
+    def generate_weighted_random(self, numbers, weights, count):
+        """
+        Генерация чисел с весовыми коэффициентами.
+
+        Таблица псевдонимов для одних и тех же чисел и весов строится один раз.
+        """
+        return get_sampler(numbers, weights).sample(count, self.generator).tolist()
+
+    def generate_advanced_numbers(self, distribution, count, **params):
+        """
+        Генерация чисел по распределению с параметрами (mean, sigma, lam и т.д.)
+        """
+        try:
+            return sample_distribution(distribution, count, self.generator, **params).tolist()
+        except Exception as e:
+            return f"Ошибка: {str(e)}"
+
+    def generate_crypto_secure_numbers(self, min_val, max_val, count):
+        """
+        Генерация криптографически стойких случайных чисел.
+
+        Диапазоны в пределах int64 обрабатываются пакетно (rng.crypto), более
+        широкие - из 64-битных слов (rng.wide), одиночные числа - из
+        криптостойкого пула rng.pool.
+        """
+        if count != 1:
+            if min_val >= INT64_MIN and max_val <= INT64_MAX:
+                return crypto_integers(min_val, max_val, count).tolist()
+            return wide_integers(min_val, max_val, count, source='os')
+        pool = get_pool(crypto_source='os')
+        return [pool.randint(min_val, max_val) for _ in range(count)]
+
+    def generate_wide_numbers(self, min_val, max_val, count, output='int'):
+        """
+        Генерация целых чисел из диапазона любой ширины (rng.wide).
+
+        output - 'int', 'hex' (строки фиксированной длины) или 'bytes'.
+        """
+        try:
+            values = wide_integers(min_val, max_val, count, output, self.generator)
+            return [row.tobytes() for row in values] if output == 'bytes' else values
+        except Exception as e:
+            return f"Ошибка: {str(e)}"
+
+    def generate_password(self, length, use_uppercase=True, use_numbers=True, use_symbols=True, count=5):
+        """
+        Генерация случайных паролей (по умолчанию 5) из криптостойкого источника
+        """
+        try:
+            return get_password_generator(length, use_uppercase, use_numbers, use_symbols).generate(count)
+        except Exception as e:
+            return f"Ошибка: {str(e)}"
+
+
+# Общий генератор модуля rng.engine, которым пользуются статические методы
+_shared = SeededGenerator(generator=get_generator())
+
+
+def _pooled_random_number(min_val, max_val, num_type='int', decimals=FLOAT_DECIMALS):
+    """
+    Генерация случайного числа из общего пула rng.pool, без обращения к генератору.
+    """
+    try:
+        return get_pool().random_number(min_val, max_val, num_type, decimals)
+    except Exception as e:
+        return f"Ошибка: {str(e)}"
+
+
+class RandomNumberGenerator:
+    """
+    Класс для генерации случайных чисел.
+
+    Статические методы работают с общим генератором пакета, одиночные
+    числа берутся из заранее заполненного пула; для воспроизводимых
+    результатов используйте SeededGenerator.
+    """
+    generate_random_number = staticmethod(_pooled_random_number)
+    generate_random_sequence = staticmethod(_shared.generate_random_sequence)
+    generate_unique_numbers = staticmethod(_shared.generate_unique_numbers)
+    generate_weighted_random = staticmethod(_shared.generate_weighted_random)
+    generate_advanced_numbers = staticmethod(_shared.generate_advanced_numbers)
+    generate_crypto_secure_numbers = staticmethod(_shared.generate_crypto_secure_numbers)
+    generate_wide_numbers = staticmethod(_shared.generate_wide_numbers)
+    generate_password = staticmethod(_shared.generate_password)
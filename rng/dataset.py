@@ -0,0 +1,317 @@
+"""
+Перемешивание и выборка строк из больших файлов.
+
+Файл отображается в память (mmap) и не читается целиком: индекс хранит
+только смещения начал строк (8 байт на строку), поэтому память зависит от
+числа строк, а не от размера файла. По индексу строятся:
+
+* shuffle_lines - случайная перестановка всех строк; строки читаются окнами
+  по window штук, внутри окна - в порядке файла;
+* sample_lines - равномерная выборка без повторений алгоритмом L: пропуски
+  между заменами в резервуаре считаются сразу, без чтения пропущенных строк;
+* weighted_sample_lines - взвешенная выборка без повторений (ключи
+  Эфраимидиса - Спиракиса), вес берётся из поля строки.
+
+Результат пишется в двоичный поток порциями:
+
+    with LineIndex('data.csv') as index:
+        shuffle_lines(index, sys.stdout.buffer, first=1)
+
+Для потоков без индекса (например, stdin) есть reservoir_sample.
+"""
+import itertools
+import math
+import mmap
+import os
+
+import numpy as np
+
+from rng.engine import get_generator
+
+# Байт файла, просматриваемых за один шаг построения индекса
+INDEX_BLOCK = 1 << 24
+# Строк в одном окне чтения при перемешивании и в одной порции вывода
+DEFAULT_WINDOW = 65536
+
+_NEWLINE = ord('\n')
+
+
+def _line_offsets(data, size, block_size):
+    """
+    Смещения начал строк и размер файла в конце (массив int64).
+    """
+    view = np.frombuffer(data, dtype=np.uint8)
+    starts = [np.zeros(1, dtype=np.int64)]
+    for start in range(0, size, block_size):
+        # Следующая строка начинается после каждого перевода строки
+        newlines = np.flatnonzero(view[start:start + block_size] == _NEWLINE)
+        starts.append(newlines.astype(np.int64) + (start + 1))
+    starts.append(np.array([size], dtype=np.int64))
+    offsets = np.concatenate(starts)
+    # Перевод строки в самом конце файла не открывает новую строку
+    return offsets[:-1] if offsets[-2] == size else offsets
+
+
+class LineIndex:
+    """
+    Индекс строк файла, отображённого в память.
+
+    offsets[i] - смещение начала строки i, offsets[-1] - размер файла.
+    Последняя строка без перевода строки при выводе получает его.
+    """
+    def __init__(self, path, block_size=INDEX_BLOCK):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # Пустой файл отобразить нельзя - у него просто нет строк
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = _line_offsets(self._map, size, block_size) if size else np.zeros(1, dtype=np.int64)
+        self.complete = size == 0 or self._map[size - 1] == _NEWLINE
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self):
+        """
+        Память индекса в байтах.
+        """
+        return self.offsets.nbytes
+
+    def lines(self, indices):
+        """
+        Строки с номерами indices (в указанном порядке), каждая с переводом строки.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices].tolist()
+        ends = self.offsets[indices + 1].tolist()
+        lines = [self._map[start:end] for start, end in zip(starts, ends)]
+        if not self.complete:
+            for position in np.flatnonzero(indices == len(self) - 1).tolist():
+                lines[position] += b'\n'
+        return lines
+
+    def read(self, start, stop):
+        """
+        Строки [start, stop) одним куском байтов.
+        """
+        data = self._map[int(self.offsets[start]):int(self.offsets[stop])]
+        return data + b'\n' if stop == len(self) and not self.complete and stop > start else data
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _check_first(index, first):
+    if not 0 <= first <= len(index):
+        raise ValueError("Номер первой строки выходит за пределы файла")
+
+
+def _write(out, lines, on_chunk):
+    if on_chunk is not None:
+        on_chunk(lines)
+    out.write(b''.join(lines))
+
+
+def shuffle_lines(index, out, generator=None, first=0, window=DEFAULT_WINDOW, on_chunk=None):
+    """
+    Запись строк [first, len(index)) в случайном порядке; строки до first - без изменений.
+
+    Перестановка номеров занимает столько же памяти, сколько индекс; строки
+    одного окна читаются в порядке возрастания смещений. on_chunk(lines)
+    получает каждую порцию строк до записи.
+    """
+    _check_first(index, first)
+    if window < 1:
+        raise ValueError("Размер окна должен быть положительным")
+    if first:
+        out.write(index.read(0, first))
+    order = get_generator(generator).permutation(len(index) - first) + first
+    for start in range(0, len(order), window):
+        chunk = order[start:start + window]
+        # Чтение по возрастанию смещений, вывод - в порядке перестановки
+        sorted_positions = np.argsort(chunk, kind='stable')
+        lines = index.lines(chunk[sorted_positions])
+        placed = [None] * len(chunk)
+        for position, line in zip(sorted_positions.tolist(), lines):
+            placed[position] = line
+        _write(out, placed, on_chunk)
+    return len(order)
+
+
+def _uniform(generator):
+    # Равномерное из (0, 1]: логарифм всегда конечен
+    return 1.0 - float(generator.random())
+
+
+def _skips(size, generator):
+    """
+    Пропуски алгоритма L: сколько элементов пропустить до следующей замены в резервуаре.
+    """
+    weight = math.exp(math.log(_uniform(generator)) / size)
+    while True:
+        if weight >= 1.0:
+            yield 0
+        else:
+            yield math.floor(math.log(_uniform(generator)) / math.log1p(-weight))
+        weight *= math.exp(math.log(_uniform(generator)) / size)
+
+
+def reservoir_indices(count, size, generator=None):
+    """
+    Номера size из count элементов, равновероятная выборка без повторений (алгоритм L).
+
+    Число обращений к генератору - O(size * log(count / size)); результат отсортирован.
+    """
+    if size < 0:
+        raise ValueError("Размер выборки не может быть отрицательным")
+    if size >= count:
+        return np.arange(count, dtype=np.int64)
+    generator = get_generator(generator)
+    reservoir = np.arange(size, dtype=np.int64)
+    if size == 0:
+        return reservoir
+    position = size - 1
+    for skip in _skips(size, generator):
+        position += skip + 1
+        if position >= count:
+            break
+        reservoir[int(generator.integers(size))] = position
+    return np.sort(reservoir)
+
+
+def reservoir_sample(items, size, generator=None):
+    """
+    Равновероятная выборка size элементов из итератора неизвестной длины (алгоритм L).
+
+    Пропущенные элементы не сохраняются; результат - в порядке появления.
+    """
+    if size < 0:
+        raise ValueError("Размер выборки не может быть отрицательным")
+    iterator = iter(items)
+    reservoir = list(enumerate(itertools.islice(iterator, size)))
+    if len(reservoir) < size or size == 0:
+        return [item for _, item in reservoir]
+    generator = get_generator(generator)
+    position = size - 1
+    missing = object()
+    for skip in _skips(size, generator):
+        item = next(itertools.islice(iterator, skip, None), missing)
+        if item is missing:
+            break
+        position += skip + 1
+        reservoir[int(generator.integers(size))] = (position, item)
+    return [item for _, item in sorted(reservoir, key=lambda pair: pair[0])]
+
+
+def sample_lines(index, out, size, generator=None, first=0, window=DEFAULT_WINDOW, on_chunk=None):
+    """
+    Запись size случайных строк из [first, len(index)) в порядке файла; строки до first - первыми.
+    """
+    _check_first(index, first)
+    if first:
+        out.write(index.read(0, first))
+    chosen = reservoir_indices(len(index) - first, size, generator) + first
+    for start in range(0, len(chosen), window):
+        _write(out, index.lines(chosen[start:start + window]), on_chunk)
+    return len(chosen)
+
+
+def parse_weight(line, field, delimiter=None):
+    """
+    Вес строки из поля с номером field (с 1), поля разделены delimiter (по умолчанию пробелами).
+    """
+    fields = line.split(delimiter)
+    try:
+        weight = float(fields[field - 1])
+    except (IndexError, ValueError):
+        raise ValueError(f"нет числового поля {field}") from None
+    if not weight >= 0 or math.isinf(weight):
+        raise ValueError(f"вес {weight} должен быть конечным неотрицательным числом")
+    return weight
+
+
+def _parse_weights(lines, field, delimiter=None):
+    """
+    Веса порции строк одним преобразованием numpy; None, если какой-то вес некорректен.
+    """
+    try:
+        fields = [line.split(delimiter, field)[field - 1] for line in lines]
+        weights = np.array(list(map(float, fields)), dtype=np.float64)
+    except (IndexError, ValueError):
+        return None
+    with np.errstate(invalid='ignore'):
+        valid = np.all((weights >= 0) & np.isfinite(weights))
+    return weights if valid else None
+
+
+def weighted_sample_indices(weights, size, generator=None):
+    """
+    Номера size элементов, выбранных без повторений с вероятностями по весам.
+
+    weights - итератор порций весов (массивов). У каждого элемента ключ
+    log(u) / вес (u - равномерное), выбираются size наибольших ключей; между
+    порциями хранятся только они. Элементы с нулевым весом не выбираются.
+    """
+    if size < 0:
+        raise ValueError("Размер выборки не может быть отрицательным")
+    generator = get_generator(generator)
+    best_keys = np.empty(0)
+    best_indices = np.empty(0, dtype=np.int64)
+    offset = 0
+    for block in weights:
+        block = np.asarray(block, dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            keys = np.log(1.0 - generator.random(len(block))) / block
+        keys[block == 0] = -np.inf
+        keys = np.concatenate([best_keys, keys])
+        indices = np.concatenate([best_indices, np.arange(offset, offset + len(block), dtype=np.int64)])
+        offset += len(block)
+        if len(keys) > size:
+            top = np.argpartition(-keys, size - 1)[:size] if size else np.empty(0, dtype=np.intp)
+            keys, indices = keys[top], indices[top]
+        best_keys, best_indices = keys, indices
+    return np.sort(best_indices[np.isfinite(best_keys)])
+
+
+def weighted_sample_lines(index, out, size, field, delimiter=None, generator=None, first=0,
+                          window=DEFAULT_WINDOW, on_chunk=None):
+    """
+    Запись size строк из [first, len(index)), выбранных без повторений с весами из поля field.
+
+    Строки выводятся в порядке файла; строки до first (заголовок) - первыми.
+    """
+    _check_first(index, first)
+    if field < 1:
+        raise ValueError("Номер поля начинается с 1")
+    if isinstance(delimiter, str):
+        delimiter = delimiter.encode('utf-8')
+
+    def weights():
+        for start in range(first, len(index), window):
+            # Окно подряд идущих строк дешевле разрезать одним split
+            lines = index.read(start, min(start + window, len(index))).split(b'\n')[:-1]
+            block = _parse_weights(lines, field, delimiter)
+            if block is None:
+                # Медленный проход только чтобы найти строку с ошибкой
+                for number, line in enumerate(lines, start + 1):
+                    try:
+                        parse_weight(line, field, delimiter)
+                    except ValueError as error:
+                        raise ValueError(f"Строка {number}: {error}") from None
+            yield block
+
+    chosen = weighted_sample_indices(weights(), size, generator) + first
+    if first:
+        out.write(index.read(0, first))
+    for start in range(0, len(chosen), window):
+        _write(out, index.lines(chosen[start:start + window]), on_chunk)
+    return len(chosen)
@@ -0,0 +1,141 @@
+"""
+Векторизованный движок генерации чисел по распределениям.
+
+Каждое распределение зарегистрировано по имени вместе со значениями
+параметров по умолчанию; выборка любого размера строится одним вызовом
+генератора NumPy. Новые распределения подключаются через register_distribution:
+
+    register_distribution('Вейбулла', lambda generator, size, a: generator.weibull(a, size),
+                          defaults={'a': 1.5}, aliases=['weibull'])
+"""
+import numpy as np
+
+from rng.engine import get_generator
+
+
+class Distribution:
+    """
+    Распределение: функция выборки sampler(generator, size, **params)
+    и значения параметров по умолчанию.
+    """
+    def __init__(self, name, sampler, defaults=None, dtype=np.float64, aliases=()):
+        self.name = name
+        self.sampler = sampler
+        self.defaults = dict(defaults or {})
+        self.dtype = np.dtype(dtype)
+        self.aliases = tuple(aliases)
+
+    def resolve_params(self, params):
+        """
+        Параметры по умолчанию, дополненные переданными.
+        """
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Неизвестные параметры распределения {self.name}: {', '.join(sorted(unknown))}")
+        return {**self.defaults, **params}
+
+    def sample(self, count, generator=None, **params):
+        """
+        Массив из count чисел.
+        """
+        if count < 0:
+            raise ValueError("Количество чисел не может быть отрицательным")
+        params = self.resolve_params(params)
+        return np.asarray(self.sampler(get_generator(generator), count, **params), dtype=self.dtype)
+
+
+# Распределения по имени и по псевдонимам
+DISTRIBUTIONS = {}
+
+
+def register_distribution(name, sampler, defaults=None, dtype=np.float64, aliases=()):
+    """
+    Регистрация распределения под именем и псевдонимами.
+    """
+    distribution = Distribution(name, sampler, defaults, dtype, aliases)
+    for key in (name, *aliases):
+        DISTRIBUTIONS[key] = distribution
+    return distribution
+
+
+def get_distribution(name):
+    """
+    Поиск распределения по имени или псевдониму.
+    """
+    try:
+        return DISTRIBUTIONS[name]
+    except KeyError:
+        raise ValueError(f"Неизвестное распределение: {name}") from None
+
+
+def distribution_names():
+    """
+    Основные имена зарегистрированных распределений в порядке регистрации.
+    """
+    names = []
+    for distribution in DISTRIBUTIONS.values():
+        if distribution.name not in names:
+            names.append(distribution.name)
+    return names
+
+
+def sample_distribution(name, count, generator=None, **params):
+    """
+    Массив из count чисел по распределению name.
+    """
+    return get_distribution(name).sample(count, generator, **params)
+
+
+def parse_params(text):
+    """
+    Разбор параметров вида "mean=0, sigma=2".
+    """
+    params = {}
+    for item in text.replace(';', ',').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"Параметр должен иметь вид имя=значение: {item}")
+        params[key.strip()] = float(value)
+    return params
+
+
+def format_params(params):
+    """
+    Запись параметров в виде, понятном parse_params.
+    """
+    return ', '.join(f"{key}={value}" for key, value in params.items())
+
+
+def _exponential(generator, size, lam):
+    if lam <= 0:
+        raise ValueError("Параметр lam должен быть положительным")
+    return generator.exponential(1.0 / lam, size)
+
+
+register_distribution(
+    'Равномерное', lambda generator, size, low, high: generator.uniform(low, high, size),
+    defaults={'low': 0.0, 'high': 1.0}, aliases=['uniform'])
+register_distribution(
+    'Нормальное', lambda generator, size, mean, sigma: generator.normal(mean, sigma, size),
+    defaults={'mean': 0.0, 'sigma': 1.0}, aliases=['normal'])
+register_distribution(
+    'Экспоненциальное', _exponential,
+    defaults={'lam': 1.0}, aliases=['exponential'])
+register_distribution(
+    'Пуассона', lambda generator, size, lam: generator.poisson(lam, size),
+    defaults={'lam': 3.0}, dtype=np.int64, aliases=['poisson'])
+register_distribution(
+    'Биномиальное', lambda generator, size, n, p: generator.binomial(int(n), p, size),
+    defaults={'n': 10, 'p': 0.5}, dtype=np.int64, aliases=['binomial'])
+register_distribution(
+    'Гамма', lambda generator, size, shape, scale: generator.gamma(shape, scale, size),
+    defaults={'shape': 2.0, 'scale': 1.0}, aliases=['gamma'])
+register_distribution(
+    'Бета', lambda generator, size, a, b: generator.beta(a, b, size),
+    defaults={'a': 2.0, 'b': 2.0}, aliases=['beta'])
+register_distribution(
+    'Логнормальное', lambda generator, size, mean, sigma: generator.lognormal(mean, sigma, size),
+    defaults={'mean': 0.0, 'sigma': 1.0}, aliases=['lognormal'])
@@ -0,0 +1,139 @@
+"""
+Векторизованный движок пакетной генерации случайных чисел.
+
+Заполняет массивы NumPy целиком вместо поэлементных вызовов модуля random,
+сохраняя семантику RandomNumberGenerator: границы включаются, вещественные
+числа по умолчанию имеют два знака после запятой.
+
+Вещественное число с decimals знаками - это равномерное целое k на сетке
+[min_val * 10**decimals, max_val * 10**decimals], делённое на 10**decimals:
+все точки сетки, включая обе границы, равновероятны, а результат совпадает
+с ближайшим к десятичной записи float64. При decimals=None (или если сетка
+мельче точности float64) число берётся из 53 случайных бит без округления.
+"""
+import math
+from decimal import Decimal
+
+import numpy as np
+
+# Соответствие типа числа и типа элементов массива
+DTYPES = {
+    'int': np.int64,
+    'float': np.float64,
+    'float32': np.float32,
+}
+
+# Количество знаков после запятой для вещественных чисел
+FLOAT_DECIMALS = 2
+# Наибольшее число знаков: 10**22 - наибольшая степень десяти, точная во float64
+MAX_DECIMALS = 22
+# Целые по модулю не больше 2**53 представимы во float64 точно
+_GRID_LIMIT = 1 << 53
+
+# Границы 64-битного целого
+INT64_MIN = int(np.iinfo(np.int64).min)
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+_default_generator = np.random.default_rng()
+
+
+def get_generator(generator=None):
+    """
+    Получение генератора NumPy (по умолчанию общего для модуля).
+    """
+    return _default_generator if generator is None else generator
+
+
+def resolve_dtype(num_type, dtype=None):
+    """
+    Определение типа элементов массива по типу числа.
+    """
+    if num_type not in ('int', 'float'):
+        raise ValueError(f"Неизвестный тип числа: {num_type}")
+    dtype = np.dtype(DTYPES[num_type] if dtype is None else dtype)
+    if num_type == 'int' and dtype.kind not in 'iu':
+        raise ValueError(f"Тип {dtype} не подходит для целых чисел")
+    if num_type == 'float' and dtype.kind != 'f':
+        raise ValueError(f"Тип {dtype} не подходит для вещественных чисел")
+    return dtype
+
+
+def check_range(min_val, max_val, num_type):
+    """
+    Проверка границ диапазона.
+    """
+    if min_val > max_val:
+        raise ValueError("Минимальное значение не может быть больше максимального!")
+    if num_type == 'int' and (min_val < INT64_MIN or max_val > INT64_MAX):
+        raise ValueError("Границы диапазона выходят за пределы 64-битного целого")
+
+
+def parse_decimals(text):
+    """
+    Число знаков после запятой из строки: целое или 'full' (без округления).
+    """
+    if str(text).lower() in ('full', 'none'):
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Число знаков должно быть целым или full: {text}") from None
+
+
+def decimal_grid(min_val, max_val, decimals):
+    """
+    Границы [low, high] целых k, для которых k / 10**decimals лежит в [min_val, max_val].
+
+    None - если сетка мельче точности float64 и округлять не к чему.
+    """
+    if not 0 <= decimals <= MAX_DECIMALS:
+        raise ValueError(f"Число знаков после запятой должно быть от 0 до {MAX_DECIMALS}")
+    if not (math.isfinite(min_val) and math.isfinite(max_val)):
+        raise ValueError("Границы диапазона должны быть конечными")
+    # Границы берутся в десятичной записи: 0.1 - это 0.1, а не 0.1000000000000000055...
+    low = math.ceil(Decimal(str(min_val)).scaleb(decimals))
+    high = math.floor(Decimal(str(max_val)).scaleb(decimals))
+    if max(abs(low), abs(high)) > _GRID_LIMIT:
+        return None
+    if low > high:
+        raise ValueError(f"В диапазоне нет чисел с {decimals} знаками после запятой")
+    return low, high
+
+
+def fill_random(out, min_val, max_val, num_type='int', decimals=FLOAT_DECIMALS, generator=None):
+    """
+    Заполнение готового массива случайными числами из [min_val, max_val].
+    """
+    check_range(min_val, max_val, num_type)
+    generator = get_generator(generator)
+    if num_type == 'int':
+        out[...] = generator.integers(min_val, max_val, size=out.shape,
+                                      dtype=out.dtype, endpoint=True)
+        return out
+
+    grid = None if decimals is None else decimal_grid(min_val, max_val, decimals)
+    if grid is not None:
+        # Целое на сетке, делённое на 10**decimals, - без поэлементного округления
+        steps = generator.integers(grid[0], grid[1], size=out.shape, dtype=np.int64, endpoint=True)
+        np.divide(steps, 10.0 ** decimals, out=out)
+        return out
+
+    # Равномерное [0, 1) масштабируется на месте, без промежуточных массивов
+    generator.random(out=out, dtype=out.dtype)
+    out *= max_val - min_val
+    out += min_val
+    return out
+
+
+def generate_array(length, min_val, max_val, num_type='int', dtype=None,
+                   decimals=FLOAT_DECIMALS, generator=None):
+    """
+    Генерация массива случайных чисел.
+
+    Целые числа возвращаются как int64, вещественные как float64
+    (или float32, если он указан в dtype).
+    """
+    if length < 0:
+        raise ValueError("Количество чисел не может быть отрицательным")
+    out = np.empty(length, dtype=resolve_dtype(num_type, dtype))
+    return fill_random(out, min_val, max_val, num_type, decimals, generator)
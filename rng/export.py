@@ -0,0 +1,253 @@
+"""
+Экспорт результатов в компактные двоичные форматы.
+
+Форматы (FORMATS):
+    raw     - заголовок RNG (JSON с dtype, количеством, диапазоном, seed и
+              алгоритмом) и данные little-endian без разделителей;
+    npy     - формат NumPy, метаданные в файле <имя>.json рядом;
+    arrow   - Arrow IPC, метаданные в схеме (нужен pyarrow);
+    parquet - Parquet, метаданные в схеме (нужен pyarrow).
+
+raw и npy пишутся прямо в отображённый в память файл (np.memmap) порциями,
+поэтому результат не хранится в памяти дважды:
+
+    job = create_job('random', 10**8, 1, 100)
+    export_job(job, 'numbers.npy', {'min': 1, 'max': 100})
+    metadata, numbers = read_export('numbers.npy')
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+from rng.stream import DEFAULT_CHUNK_SIZE
+from rng.text import json_default
+
+FORMATS = ('raw', 'npy', 'arrow', 'parquet')
+EXTENSIONS = {'.bin': 'raw', '.raw': 'raw', '.npy': 'npy', '.arrow': 'arrow', '.parquet': 'parquet'}
+
+RAW_MAGIC = b'RNGRAW\x00\x01'
+# Данные в raw начинаются с границы, кратной HEADER_ALIGN байтам
+HEADER_ALIGN = 64
+METADATA_SUFFIX = '.json'
+METADATA_KEY = b'rng'
+COLUMN_NAME = 'value'
+
+_HEADER_SIZE = struct.Struct('<I')
+
+
+def format_from_path(path):
+    """
+    Формат по расширению файла.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Неизвестное расширение файла: {extension or path}")
+    return EXTENSIONS[extension]
+
+
+def _little_endian(dtype):
+    dtype = np.dtype(dtype)
+    if dtype.kind not in 'iuf':
+        raise ValueError("В двоичные форматы экспортируются только числа")
+    return dtype.newbyteorder('<')
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ValueError("Для форматов arrow и parquet нужен пакет pyarrow") from None
+    return pyarrow
+
+
+def _encode_metadata(metadata):
+    return json.dumps(metadata, ensure_ascii=False, default=json_default).encode('utf-8')
+
+
+class _MemmapWriter:
+    """
+    Запись порций в массив, отображённый на файл.
+
+    paths - файлы, удаляемые при отмене (данные и метаданные).
+    """
+    def __init__(self, paths, array):
+        self.paths = paths
+        self.array = array
+        self.position = 0
+
+    def write(self, chunk):
+        end = self.position + len(chunk)
+        if end > len(self.array):
+            raise ValueError("Порций больше, чем указано при открытии файла")
+        self.array[self.position:end] = chunk
+        self.position = end
+
+    def close(self):
+        if self.position != len(self.array):
+            raise ValueError(f"Записано {self.position} значений из {len(self.array)}")
+        if isinstance(self.array, np.memmap):
+            self.array.flush()
+        self.array = None
+
+    def abort(self):
+        self.array = None
+        for path in self.paths:
+            os.remove(path)
+
+
+class _ArrowWriter:
+    """
+    Запись порций пакетами Arrow IPC или группами строк Parquet.
+    """
+    def __init__(self, path, dtype, metadata, file_format):
+        pyarrow = _import_pyarrow()
+        self.path = path
+        self._pyarrow = pyarrow
+        self.schema = pyarrow.schema([(COLUMN_NAME, pyarrow.from_numpy_dtype(dtype))],
+                                     metadata={METADATA_KEY: _encode_metadata(metadata)})
+        if file_format == 'parquet':
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(path, self.schema)
+
+    def write(self, chunk):
+        batch = self._pyarrow.record_batch([self._pyarrow.array(chunk)], schema=self.schema)
+        self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+    def abort(self):
+        try:
+            self._writer.close()
+        except Exception:
+            # Файл всё равно удаляется; наружу уходит исходная ошибка
+            pass
+        os.remove(self.path)
+
+
+def _open_raw(path, dtype, count, metadata):
+    header = _encode_metadata(metadata)
+    size = len(RAW_MAGIC) + _HEADER_SIZE.size + len(header)
+    # Заголовок дополняется пробелами, чтобы данные были выровнены
+    header += b' ' * (-size % HEADER_ALIGN)
+    with open(path, 'wb') as file:
+        file.write(RAW_MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+        offset = file.tell()
+        file.truncate(offset + count * dtype.itemsize)
+    if count == 0:
+        return _MemmapWriter([path], np.empty(0, dtype))
+    return _MemmapWriter([path], np.memmap(path, dtype=dtype, mode='r+', offset=offset, shape=(count,)))
+
+
+def _open_npy(path, dtype, count, metadata):
+    with open(path + METADATA_SUFFIX, 'wb') as file:
+        file.write(_encode_metadata(metadata))
+    paths = [path, path + METADATA_SUFFIX]
+    if count == 0:
+        np.save(path, np.empty(0, dtype))
+        return _MemmapWriter(paths, np.empty(0, dtype))
+    return _MemmapWriter(paths, np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(count,)))
+
+
+def open_writer(path, dtype, count, metadata=None, file_format=None):
+    """
+    Файл для записи count значений порциями: методы write(chunk), close() и abort().
+
+    В метаданные добавляются dtype (строка NumPy, например '<i8') и count.
+    """
+    file_format = file_format or format_from_path(path)
+    if file_format not in FORMATS:
+        raise ValueError(f"Неизвестный формат экспорта: {file_format}")
+    dtype = _little_endian(dtype)
+    metadata = dict(metadata or {}, dtype=dtype.str, count=count)
+    if file_format == 'raw':
+        return _open_raw(path, dtype, count, metadata)
+    if file_format == 'npy':
+        return _open_npy(path, dtype, count, metadata)
+    return _ArrowWriter(path, dtype, metadata, file_format)
+
+
+def export_chunks(chunks, path, dtype, count, metadata=None, file_format=None):
+    """
+    Экспорт итератора порций; при ошибке незаконченный файл удаляется.
+    """
+    writer = open_writer(path, dtype, count, metadata, file_format)
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+        # Ошибка при закрытии (не хватило порций, сбой сброса на диск) тоже удаляет файл
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def export_array(values, path, metadata=None, file_format=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Экспорт готового массива.
+    """
+    values = np.asarray(values)
+    chunks = (values[start:start + chunk_size] for start in range(0, len(values), chunk_size))
+    export_chunks(chunks, path, values.dtype, len(values), metadata, file_format)
+
+
+def export_job(job, path, metadata=None, file_format=None, on_progress=None, on_chunk=None):
+    """
+    Генерация задания rng.jobs сразу в файл, без построения результата в памяти.
+
+    on_chunk(chunk) вызывается для каждой порции перед записью.
+    """
+    if job.dtype is None:
+        raise ValueError("В двоичные форматы экспортируются только числа")
+    chunks = job.iter_chunks(on_progress)
+    if on_chunk is not None:
+        chunks = _observed(chunks, on_chunk)
+    export_chunks(chunks, path, job.dtype, job.count, metadata, file_format)
+
+
+def _observed(chunks, on_chunk):
+    for chunk in chunks:
+        on_chunk(chunk)
+        yield chunk
+
+
+def read_export(path, file_format=None):
+    """
+    Чтение экспортированного файла: (метаданные, массив).
+
+    raw и npy открываются через np.memmap без чтения данных в память.
+    """
+    file_format = file_format or format_from_path(path)
+    if file_format == 'raw':
+        with open(path, 'rb') as file:
+            if file.read(len(RAW_MAGIC)) != RAW_MAGIC:
+                raise ValueError("Файл не является экспортом RNG")
+            header_size, = _HEADER_SIZE.unpack(file.read(_HEADER_SIZE.size))
+            metadata = json.loads(file.read(header_size).decode('utf-8'))
+            offset = file.tell()
+        if metadata['count'] == 0:
+            return metadata, np.empty(0, metadata['dtype'])
+        return metadata, np.memmap(path, dtype=metadata['dtype'], mode='r', offset=offset,
+                                   shape=(metadata['count'],))
+    if file_format == 'npy':
+        metadata = {}
+        if os.path.exists(path + METADATA_SUFFIX):
+            with open(path + METADATA_SUFFIX, encoding='utf-8') as file:
+                metadata = json.load(file)
+        return metadata, np.load(path, mmap_mode='r')
+    if file_format in ('arrow', 'parquet'):
+        pyarrow = _import_pyarrow()
+        if file_format == 'parquet':
+            import pyarrow.parquet
+            table = pyarrow.parquet.read_table(path)
+        else:
+            import pyarrow.ipc
+            table = pyarrow.ipc.open_file(pyarrow.memory_map(path)).read_all()
+        metadata = json.loads(table.schema.metadata[METADATA_KEY].decode('utf-8'))
+        return metadata, table.column(COLUMN_NAME).to_numpy()
+    raise ValueError(f"Неизвестный формат экспорта: {file_format}")
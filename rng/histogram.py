@@ -0,0 +1,299 @@
+"""
+Потоковая гистограмма для графиков по большим выборкам.
+
+Значения поступают порциями (например, через on_chunk задания rng.jobs) и
+сразу раскладываются по интервалам (np.bincount), поэтому память и время
+построения графика зависят от числа интервалов, а не от размера выборки.
+Если новая порция выходит за текущий диапазон, ширина интервалов
+удваивается, а соседние интервалы объединяются попарно:
+
+    histogram = StreamingHistogram()
+    job.run(on_chunk=histogram.update)
+    edges, counts = histogram.snapshot()
+    theoretical, sample = qq_points(histogram, reference_cdf(params))
+
+Гистограмму можно пополнять из фонового потока и одновременно читать из
+потока интерфейса.
+"""
+import threading
+
+import numpy as np
+
+from rng.distributions import get_distribution
+from rng.quality import CDFS, PMFS
+from rng.stats import BLOCK_SIZE, Moments
+
+# Число интервалов по умолчанию (чётное - интервалы объединяются попарно)
+DEFAULT_BINS = 256
+# Точек на QQ-графике
+QQ_POINTS = 100
+
+
+class StreamingHistogram:
+    """
+    Гистограмма с фиксированным числом интервалов и растущим диапазоном.
+
+    Целые значения раскладываются по целочисленным интервалам: пока диапазон
+    не превышает bins, каждое значение попадает в свой интервал.
+    Нечисловые значения (например, пароли) не учитываются. Количество,
+    среднее, отклонение и границы значений считает rng.stats.Moments.
+    """
+    def __init__(self, bins=DEFAULT_BINS):
+        if bins < 2 or bins % 2:
+            raise ValueError("Число интервалов должно быть чётным и не меньше 2")
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.low = None
+        self.width = None
+        self.integer = True
+        self.moments = Moments()
+        # Номер изменения: по нему интерфейс узнаёт, что пора перерисовать
+        self.version = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_values(cls, values, bins=DEFAULT_BINS):
+        """
+        Гистограмма готового массива или списка.
+        """
+        histogram = cls(bins)
+        histogram.update(values)
+        return histogram
+
+    def update(self, values):
+        """
+        Добавление порции значений.
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.asarray(values) if len(values) else np.empty(0)
+        if values.dtype.kind not in 'iuf' or len(values) == 0:
+            return
+        integer = values.dtype.kind in 'iu'
+        with self._lock:
+            for start in range(0, len(values), BLOCK_SIZE):
+                block = values[start:start + BLOCK_SIZE].astype(np.float64)
+                if not integer:
+                    block = block[np.isfinite(block)]
+                    if len(block) == 0:
+                        continue
+                low, high = block.min().item(), block.max().item()
+                self._cover(low, high, integer)
+                index = np.floor((block - self.low) / self.width).astype(np.intp)
+                np.clip(index, 0, self.bins - 1, out=index)
+                self.counts += np.bincount(index, minlength=self.bins)
+                self.moments.update(block)
+            self.version += 1
+
+    def _cover(self, low, high, integer):
+        """
+        Расширение диапазона интервалов до [low, high].
+        """
+        if self.low is None:
+            self.integer = integer
+            if integer:
+                self.low = low
+                self.width = float(max(1, -(-int(high - low + 1) // self.bins)))
+            else:
+                self.low = low
+                self.width = (high - low) / self.bins or max(abs(low), 1.0) * 1e-9
+            return
+        if not integer:
+            self.integer = False
+        half = self.bins // 2
+        while True:
+            upper = self.low + self.bins * self.width
+            if low >= self.low and (high < upper if self.integer else high <= upper):
+                return
+            # Удвоение ширины: пары соседних интервалов становятся одним
+            pairs = self.counts.reshape(half, 2).sum(axis=1)
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+            if low < self.low:
+                self.counts[half:] = pairs
+                self.low -= self.bins * self.width
+            else:
+                self.counts[:half] = pairs
+            self.width *= 2
+
+    def snapshot(self):
+        """
+        Копия границ и частот (bins + 1 границ, bins частот).
+
+        Для целых значений границы сдвинуты на 0.5: целое k лежит в [k - 0.5, k + 0.5).
+        """
+        with self._lock:
+            if self.low is None:
+                return np.empty(0), np.empty(0, dtype=np.int64)
+            offset = 0.5 if self.integer else 0.0
+            edges = self.low - offset + np.arange(self.bins + 1) * self.width
+            return edges, self.counts.copy()
+
+    def trimmed(self):
+        """
+        Границы и частоты без пустых интервалов по краям.
+        """
+        edges, counts = self.snapshot()
+        filled = np.flatnonzero(counts)
+        if len(filled) == 0:
+            return edges[:0], counts[:0]
+        first, last = filled[0], filled[-1] + 1
+        return edges[first:last + 1], counts[first:last]
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    @property
+    def minimum(self):
+        return self.moments.minimum
+
+    @property
+    def maximum(self):
+        return self.moments.maximum
+
+    @property
+    def mean(self):
+        return self.moments.mean if self.moments.count else None
+
+    @property
+    def std(self):
+        return self.moments.std if self.moments.count else None
+
+    def cdf(self):
+        """
+        Эмпирическая функция распределения: правые границы интервалов и доли.
+        """
+        edges, counts = self.trimmed()
+        if len(counts) == 0:
+            return edges, np.empty(0)
+        cumulative = np.cumsum(counts)
+        return edges[1:], cumulative / cumulative[-1]
+
+    def quantiles(self, probabilities):
+        """
+        Квантили выборки (линейная интерполяция внутри интервала).
+        """
+        with self._lock:
+            width = self.width
+        edges, counts = self.trimmed()
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        if len(counts) == 0:
+            return np.full(len(probabilities), np.nan)
+        cumulative = np.cumsum(counts)
+        targets = probabilities * cumulative[-1]
+        index = np.minimum(np.searchsorted(cumulative, targets, side='left'), len(counts) - 1)
+        if self.integer and width == 1:
+            # Каждый интервал - одно целое значение
+            return edges[index] + 0.5
+        before = cumulative[index] - counts[index]
+        fraction = np.clip((targets - before) / np.maximum(counts[index], 1), 0.0, 1.0)
+        return edges[index] + fraction * (edges[index + 1] - edges[index])
+
+
+def _uniform_integer_cdf(low, high):
+    # Границы режима wide могут не помещаться в int64 - считаются во float
+    low, span = float(low), float(high - low + 1)
+    return lambda x: np.clip((np.floor(np.asarray(x, dtype=np.float64)) - low + 1) / span, 0.0, 1.0)
+
+
+def _discrete_cdf(pmf, start=0):
+    # Накопленные вероятности достраиваются по мере обращения к ним
+    cumulative = []
+
+    def cdf(x):
+        k = np.floor(np.asarray(x, dtype=np.float64)) - start
+        top = k.max() if k.size else -1
+        while len(cumulative) <= top and (not cumulative or cumulative[-1] < 1.0 - 1e-12):
+            previous = cumulative[-1] if cumulative else 0.0
+            cumulative.append(min(1.0, previous + pmf(start + len(cumulative))))
+        if not cumulative:
+            return np.zeros(k.shape)[()]
+        table = np.asarray(cumulative)
+        index = np.clip(k, 0, len(table) - 1).astype(np.int64)
+        return np.where(k < 0, 0.0, table[index])[()]
+    return cdf
+
+
+def reference_cdf(params):
+    """
+    Теоретическая функция распределения (для массивов и чисел) для параметров задания rng.jobs.
+
+    None - если она неизвестна (тогда QQ-график строится по нормальному закону).
+    """
+    mode = params.get('mode')
+    if mode in ('random', 'unique', 'crypto', 'wide'):
+        low, high = params.get('min_val', 0), params.get('max_val', 100)
+        if mode == 'random' and params.get('num_type', 'int') == 'float':
+            return (lambda x: CDFS['Равномерное'](x, low, high)) if high > low else None
+        return _uniform_integer_cdf(low, high)
+    if mode == 'distribution':
+        distribution = get_distribution(params['distribution'])
+        resolved = distribution.resolve_params(params.get('params') or {})
+        if distribution.name in CDFS:
+            return lambda x: CDFS[distribution.name](x, **resolved)
+        if distribution.name in PMFS:
+            return _discrete_cdf(lambda k: PMFS[distribution.name](k, **resolved))
+        return None
+    if mode == 'weighted':
+        numbers = params.get('numbers') or []
+        if not numbers or not all(isinstance(number, (int, float)) for number in numbers):
+            return None
+        weights = params.get('weights') or [1.0] * len(numbers)
+        order = np.argsort(numbers, kind='stable')
+        keys = np.asarray(numbers, dtype=np.float64)[order]
+        cumulative = np.cumsum(np.asarray(weights, dtype=np.float64)[order])
+        cumulative /= cumulative[-1]
+
+        def cdf(x):
+            index = np.searchsorted(keys, x, side='right')
+            return np.where(index > 0, cumulative[np.maximum(index - 1, 0)], 0.0)[()]
+        return cdf
+    return None
+
+
+def theoretical_quantiles(cdf, low, high, points=QQ_POINTS):
+    """
+    Теоретические квантили в точках (i + 0.5) / points.
+
+    Отрезок [low, high] расширяется, пока не накроет все квантили, затем
+    делится пополам сразу для всех точек - cdf вызывается для массива.
+    """
+    probabilities = (np.arange(points) + 0.5) / points
+    step = max(high - low, 1.0)
+    for _ in range(200):
+        if cdf(low) < probabilities[0]:
+            break
+        low -= step
+        step *= 2
+    step = max(high - low, 1.0)
+    for _ in range(200):
+        if cdf(high) >= probabilities[-1]:
+            break
+        high += step
+        step *= 2
+    lows, highs = np.full(points, float(low)), np.full(points, float(high))
+    for _ in range(100):
+        middle = (lows + highs) / 2
+        below = cdf(middle) < probabilities
+        lows = np.where(below, middle, lows)
+        highs = np.where(below, highs, middle)
+        if np.all(highs - lows <= 1e-9 * np.maximum(1.0, np.abs(highs))):
+            break
+    return highs
+
+
+def qq_points(histogram, cdf=None, points=QQ_POINTS, theoretical=None):
+    """
+    Точки QQ-графика: (теоретические квантили, квантили выборки).
+
+    Без cdf сравнение идёт с нормальным законом со средним и отклонением
+    выборки. Готовые теоретические квантили можно передать в theoretical.
+    """
+    if histogram.count == 0:
+        return np.empty(0), np.empty(0)
+    if theoretical is None:
+        if cdf is None:
+            mean, sigma = histogram.mean, histogram.std or 1.0
+            cdf = lambda x: CDFS['Нормальное'](x, mean, sigma)
+        theoretical = theoretical_quantiles(cdf, histogram.minimum, histogram.maximum, points)
+    sample = histogram.quantiles((np.arange(len(theoretical)) + 0.5) / len(theoretical))
+    return theoretical, sample
@@ -0,0 +1,243 @@
+"""
+Постоянная история генерации.
+
+Записи добавляются в конец файла JSON Lines (UTF-8, одна запись в строке)
+и не переписываются. Рядом лежит индекс - смещения начала записей
+(little-endian uint64), поэтому запись с любым номером читается без
+загрузки всего файла. fsync выполняется пачками: после sync_every записей
+или через sync_interval секунд после предыдущей синхронизации.
+
+    with HistoryStore() as history:
+        history.append(make_record(params, summary, values, descriptor))
+        for record in history.tail(5):
+            print(format_record(record))
+
+Записи с описанием rng.replay.ReplayDescriptor можно воспроизвести целиком
+или по частям функцией replay_job, сами числа в истории не хранятся.
+"""
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+from rng.replay import ReplayDescriptor
+from rng.text import json_default
+
+DEFAULT_HISTORY_PATH = 'history.jsonl'
+INDEX_SUFFIX = '.idx'
+
+# Сколько первых значений сохраняется в записи
+PREVIEW_SIZE = 20
+
+_OFFSET = struct.Struct('<Q')
+
+
+def make_record(params, summary=None, values=None, descriptor=None):
+    """
+    Запись истории: параметры create_job, описание для воспроизведения,
+    сводка и начало результата.
+    """
+    record = {'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'params': dict(params)}
+    if descriptor is not None:
+        record['replay'] = descriptor.to_dict()
+    if summary is not None:
+        record['summary'] = {'count': summary.count, 'min': summary.minimum,
+                             'max': summary.maximum, 'mean': summary.mean}
+    if values is not None:
+        record['preview'] = values[:PREVIEW_SIZE]
+    return record
+
+
+def replay_job(record, start=0, stop=None):
+    """
+    Задание rng.jobs, повторяющее значения [start, stop) результата из записи истории.
+    """
+    if record.get('replay') is None:
+        raise ValueError("Запись нельзя воспроизвести: генерация не была детерминированной")
+    return ReplayDescriptor.from_dict(record['replay']).job(start, stop)
+
+
+def format_record(record):
+    """
+    Текстовое представление записи (для экспорта и списка в консоли).
+    """
+    params = ', '.join(f"{key}={value}" for key, value in record['params'].items())
+    lines = [f"#{record.get('id', '?')} [{record['time']}] {params}"]
+    if record.get('replay') is not None:
+        lines.append(f"Описание: {ReplayDescriptor.from_dict(record['replay']).to_token()}")
+    summary = record.get('summary')
+    if summary:
+        if summary['min'] is None:
+            lines.append(f"Количество: {summary['count']}")
+        else:
+            lines.append(f"Количество: {summary['count']}   Мин: {summary['min']}   "
+                         f"Макс: {summary['max']}   Среднее: {summary['mean']:.6g}")
+    if 'preview' in record:
+        more = ', ...' if summary and summary['count'] > len(record['preview']) else ''
+        lines.append(f"[{', '.join(map(str, record['preview']))}{more}]")
+    return '\n'.join(lines)
+
+
+def _is_record(file, offset, number):
+    """
+    Начинается ли с offset (после перевода строки) запись с номером number.
+    """
+    file.seek(offset - 1)
+    if file.read(1) != b'\n':
+        return False
+    try:
+        return json.loads(file.readline().decode('utf-8')).get('id') == number
+    except (ValueError, AttributeError):
+        return False
+
+
+class HistoryStore:
+    """
+    Файл истории с индексом смещений.
+
+    Повреждённый хвост (запись, оборванная при сбое) при открытии отрезается.
+    Заново читается только файл после последней проиндексированной записи;
+    индекс обрезается или дописывается, только если расходится с данными.
+    Смещения хранятся массивом uint64 с запасом под новые записи.
+    """
+    def __init__(self, path=DEFAULT_HISTORY_PATH, sync_every=16, sync_interval=1.0):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._offsets = self._recover()
+        self._count = len(self._offsets)
+        self._size = os.path.getsize(path)
+        self._data = open(path, 'ab')
+        self._index = open(self.index_path, 'ab')
+        self._reader = None
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def _recover(self):
+        """
+        Чтение индекса и его согласование с файлом данных.
+        """
+        if not os.path.exists(self.path):
+            open(self.path, 'wb').close()
+        size = os.path.getsize(self.path)
+        index = np.zeros(0, dtype='<u8')
+        if os.path.exists(self.index_path):
+            index = np.fromfile(self.index_path, dtype='<u8')
+        # Верные смещения начинаются с нуля, растут и лежат внутри файла
+        valid = index < size
+        valid[1:] &= index[1:] > index[:-1]
+        valid[:1] &= index[:1] == 0
+        bad = np.flatnonzero(~valid)
+        known = int(bad[0]) if len(bad) else len(index)
+        # Последняя проиндексированная запись и всё после неё проверяются заново
+        known = max(known - 1, 0)
+        valid_end = int(index[known]) if known else 0
+        tail = []
+        with open(self.path, 'rb') as file:
+            if known and not _is_record(file, valid_end, known):
+                # Индекс не сходится с данными - файл читается с начала
+                known = valid_end = 0
+            file.seek(valid_end)
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+                tail.append(valid_end)
+                valid_end += len(line)
+        if valid_end < size:
+            with open(self.path, 'r+b') as file:
+                file.truncate(valid_end)
+        offsets = np.concatenate([index[:known], np.asarray(tail, dtype='<u8')])
+        # Длина общего начала индекса на диске и восстановленных смещений
+        common = min(len(index), len(offsets))
+        mismatch = np.flatnonzero(index[:common] != offsets[:common])
+        common = int(mismatch[0]) if len(mismatch) else common
+        if common < len(index) or common < len(offsets):
+            with open(self.index_path, 'r+b' if os.path.exists(self.index_path) else 'wb') as file:
+                file.truncate(common * _OFFSET.size)
+                file.seek(common * _OFFSET.size)
+                file.write(offsets[common:].tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+        return offsets
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def append(self, record):
+        """
+        Добавление записи; возвращает её номер.
+        """
+        record = dict(record, id=self._count)
+        line = json.dumps(record, ensure_ascii=False, default=json_default).encode('utf-8') + b'\n'
+        self._data.write(line)
+        self._index.write(_OFFSET.pack(self._size))
+        if self._count == len(self._offsets):
+            # Запас растёт вдвое, как у списка
+            self._offsets = np.resize(self._offsets, max(16, 2 * self._count))
+        self._offsets[self._count] = self._size
+        self._count += 1
+        self._size += len(line)
+        self._pending += 1
+        if (self._pending >= self.sync_every
+                or time.monotonic() - self._synced_at >= self.sync_interval):
+            self.sync()
+        return record['id']
+
+    def sync(self):
+        """
+        Сброс буферов и fsync данных и индекса.
+        """
+        for file in (self._data, self._index):
+            file.flush()
+            os.fsync(file.fileno())
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def get(self, number):
+        """
+        Запись с номером number (отрицательные номера - с конца).
+        """
+        offset = int(self._offsets[:self._count][number])
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        self._data.flush()
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline().decode('utf-8'))
+
+    def records(self, start=0, stop=None):
+        """
+        Итератор записей с номерами от start до stop.
+        """
+        for number in range(*slice(start, stop).indices(self._count)):
+            yield self.get(number)
+
+    def tail(self, count=10):
+        """
+        Последние count записей.
+        """
+        return list(self.records(max(0, self._count - count)))
+
+    def export_text(self, path):
+        """
+        Экспорт истории в текстовый файл UTF-8 (запись за записью).
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            for record in self.records():
+                file.write(format_record(record) + '\n\n')
+
+    def close(self):
+        if self._data.closed:
+            return
+        self.sync()
+        for file in (self._data, self._index, self._reader):
+            if file is not None:
+                file.close()
@@ -0,0 +1,148 @@
+"""
+Задания генерации с прогрессом и отменой.
+
+Задание выдаёт результат порциями и после каждой порции сообщает о прогрессе
+и проверяет флаг отмены. Модуль не зависит от графического интерфейса:
+обёртка для Qt (rng_gui.worker) только переносит вызовы в фоновый поток.
+
+    job = create_job('random', count=10**8, min_val=1, max_val=100)
+    numbers = job.run(on_progress=lambda done, total: print(done, total))
+"""
+import threading
+
+import numpy as np
+
+from rng.distributions import get_distribution
+from rng.engine import FLOAT_DECIMALS, INT64_MAX
+from rng.passwords import get_password_generator
+from rng.stream import DEFAULT_CHUNK_SIZE, stream_advanced, stream_crypto, stream_random
+from rng.unique import sample_unique
+from rng.weighted import get_sampler
+from rng.wide import check_wide, wide_integers
+
+# Режимы генерации (как в командной строке)
+MODES = ('random', 'unique', 'weighted', 'distribution', 'crypto', 'password', 'wide')
+
+
+class JobCancelled(Exception):
+    """
+    Задание отменено до завершения.
+    """
+
+
+class GenerationJob:
+    """
+    Задание генерации count значений порциями.
+
+    chunks - функция без аргументов, возвращающая итератор порций (массивов
+    или списков); dtype - тип элементов результата (None - список Python).
+    """
+    def __init__(self, chunks, count, dtype=None, description=''):
+        self._chunks = chunks
+        self.count = count
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.description = description
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """
+        Запрос отмены; задание остановится после текущей порции.
+        """
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def iter_chunks(self, on_progress=None):
+        """
+        Порции результата по мере генерации; при отмене выбрасывается JobCancelled.
+
+        on_progress(done, total) вызывается после каждой порции.
+        """
+        done = 0
+        if on_progress is not None:
+            on_progress(0, self.count)
+        for chunk in self._chunks():
+            if self.cancelled:
+                raise JobCancelled()
+            yield chunk
+            done += len(chunk)
+            if on_progress is not None:
+                on_progress(done, self.count)
+        if self.cancelled:
+            raise JobCancelled()
+
+    def run(self, on_progress=None, on_chunk=None):
+        """
+        Выполнение задания с построением всего результата в памяти.
+
+        on_chunk(chunk) получает порцию до её копирования в результат.
+        """
+        result = [] if self.dtype is None else np.empty(self.count, dtype=self.dtype)
+        done = 0
+        for chunk in self.iter_chunks(on_progress):
+            if on_chunk is not None:
+                on_chunk(chunk)
+            if self.dtype is None:
+                result.extend(chunk)
+            else:
+                result[done:done + len(chunk)] = chunk
+            done += len(chunk)
+        return result
+
+
+def _sized_chunks(count, chunk_size, produce):
+    """
+    Порции produce(size) суммарной длиной count.
+    """
+    def chunks():
+        for start in range(0, count, chunk_size):
+            yield produce(min(chunk_size, count - start))
+    return chunks
+
+
+def create_job(mode, count, min_val=0, max_val=100, num_type='int', numbers=None, weights=None,
+               distribution=None, params=None, password_length=12, use_uppercase=True,
+               use_numbers=True, use_symbols=True, generator=None, source=None,
+               chunk_size=DEFAULT_CHUNK_SIZE, output='int', decimals=FLOAT_DECIMALS):
+    """
+    Задание для одного из режимов MODES с параметрами как у RandomNumberGenerator.
+
+    source - источник криптостойких чисел (rng.crypto.SOURCES) для режимов crypto и wide;
+    output - 'int' или 'hex', вид чисел режима wide (rng.wide); decimals - знаков после
+    запятой у вещественных чисел режима random (None - без округления).
+    """
+    if count < 0:
+        raise ValueError("Количество чисел не может быть отрицательным")
+    if mode == 'random':
+        stream = stream_random(min_val, max_val, num_type, chunk_size, count, decimals=decimals,
+                               generator=generator)
+        return GenerationJob(lambda: iter(stream), count, stream.dtype, f"Случайные числа ({count} шт.)")
+    if mode == 'unique':
+        # Выборка без повторений строится целиком, порция одна
+        return GenerationJob(lambda: iter([sample_unique(min_val, max_val, count, generator=generator)]),
+                             count, np.int64 if max_val <= INT64_MAX else np.uint64,
+                             "Уникальные числа")
+    if mode == 'weighted':
+        sampler = get_sampler(numbers, weights)
+        return GenerationJob(_sized_chunks(count, chunk_size, lambda size: sampler.sample(size, generator)),
+                             count, sampler.values.dtype, "Взвешенные числа")
+    if mode == 'distribution':
+        distribution = get_distribution(distribution)
+        stream = stream_advanced(distribution.name, chunk_size, count, generator=generator, **(params or {}))
+        return GenerationJob(lambda: iter(stream), count, stream.dtype,
+                             f"Числа по распределению {distribution.name}")
+    if mode == 'crypto':
+        stream = stream_crypto(min_val, max_val, chunk_size, count, source=source)
+        return GenerationJob(lambda: iter(stream), count, stream.dtype, "Криптографически стойкие числа")
+    if mode == 'password':
+        passwords = get_password_generator(password_length, use_uppercase, use_numbers, use_symbols)
+        return GenerationJob(_sized_chunks(count, chunk_size, passwords.generate), count, None, "Пароли")
+    if mode == 'wide':
+        check_wide(min_val, max_val, count, output)
+        if output == 'bytes':
+            raise ValueError("В задании числа выдаются как int или hex")
+        return GenerationJob(_sized_chunks(count, chunk_size, lambda size: wide_integers(
+            min_val, max_val, size, output, generator, source)), count, None, "Длинные целые числа")
+    raise ValueError(f"Неизвестный режим генерации: {mode}")
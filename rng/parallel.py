@@ -0,0 +1,226 @@
+"""
+Параллельная генерация больших массивов на нескольких ядрах.
+
+Результат делится на блоки фиксированного размера, и каждый блок заполняется
+собственным независимым потоком: начальное значение блока порождается из
+главного seed через numpy.random.SeedSequence (spawn_key = номер блока).
+Разбиение не зависит от числа процессов, поэтому при одном и том же seed
+результат одинаков и при одном процессе, и при шестнадцати.
+
+Процессы пишут свои блоки прямо в общий массив (multiprocessing.shared_memory),
+списки и массивы между процессами не пересылаются.
+
+    with ParallelGenerator(seed=42, workers=8) as generator:
+        numbers = generator.generate_random_sequence(10**9, 1, 100)
+
+Методы describe_* не строят результат: каждый процесс считает статистику
+(rng.stats) по своим блокам, и она объединяется в вызывающем процессе.
+"""
+import os
+import secrets
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from rng.backends import DEFAULT_BACKEND, create_generator
+from rng.crypto import get_crypto
+from rng.distributions import get_distribution
+from rng.engine import FLOAT_DECIMALS, check_range, fill_random, resolve_dtype
+from rng.stats import StreamStats
+from rng.weighted import get_sampler
+
+# Количество чисел в одном блоке (единица распределения работы)
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+
+def block_seed(seed, index):
+    """
+    Начальное значение блока с номером index, порождённое из главного seed.
+    """
+    words = np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(2, np.uint64)
+    return int(words[0]) << 64 | int(words[1])
+
+
+def fill_block(out, task, seed, backend, index):
+    """
+    Заполнение одного блока по описанию задачи.
+    """
+    mode = task['mode']
+    if mode == 'random':
+        generator = create_generator(backend, block_seed(seed, index))
+        fill_random(out, task['min_val'], task['max_val'], task['num_type'], task['decimals'], generator)
+    elif mode == 'distribution':
+        generator = create_generator(backend, block_seed(seed, index))
+        out[...] = get_distribution(task['distribution']).sample(len(out), generator, **task['params'])
+    elif mode == 'weighted':
+        generator = create_generator(backend, block_seed(seed, index))
+        out[...] = get_sampler(task['numbers'], task['weights']).sample(len(out), generator)
+    elif mode == 'crypto':
+        # Криптостойкие числа не воспроизводимы по определению
+        get_crypto().fill_integers(out, task['min_val'], task['max_val'])
+    else:
+        raise ValueError(f"Неизвестный режим генерации: {mode}")
+
+
+def _fill_shared(name, dtype, count, start, stop, task, seed, backend, index):
+    """
+    Заполнение среза [start, stop) общего массива в рабочем процессе.
+    """
+    shared = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(count, dtype=dtype, buffer=shared.buf)
+        fill_block(out[start:stop], task, seed, backend, index)
+        del out
+    finally:
+        shared.close()
+
+
+def _describe_blocks(blocks, dtype, task, seed, backend):
+    """
+    Статистика по блокам [(номер, начало, конец)], заполняемым по очереди в одном буфере.
+    """
+    stats = StreamStats()
+    if not blocks:
+        return stats
+    buffer = np.empty(max(stop - start for _, start, stop in blocks), dtype=dtype)
+    for index, start, stop in blocks:
+        out = buffer[:stop - start]
+        fill_block(out, task, seed, backend, index)
+        stats.update(out)
+    return stats
+
+
+class ParallelGenerator:
+    """
+    Генерация больших массивов пулом процессов с воспроизводимыми потоками.
+    """
+    def __init__(self, backend=DEFAULT_BACKEND, seed=None, workers=None, block_size=DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.backend = backend
+        self.seed = secrets.randbits(128) if seed is None else seed
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Остановка пула процессов.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _process_pool(self):
+        if self._pool is None:
+            # Пул процессов нужен только здесь; импорт отложен ради быстрого запуска
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+            # Не fork: копия процесса унаследовала бы блокировки, занятые его
+            # потоками (например, потоком пополнения rng.pool)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context('spawn'))
+        return self._pool
+
+    def _blocks(self, count):
+        for index, start in enumerate(range(0, count, self.block_size)):
+            yield index, start, min(start + self.block_size, count)
+
+    def _run(self, count, dtype, task):
+        if count < 0:
+            raise ValueError("Количество чисел не может быть отрицательным")
+        dtype = np.dtype(dtype)
+        blocks = list(self._blocks(count))
+        if self.workers == 1 or len(blocks) <= 1:
+            out = np.empty(count, dtype=dtype)
+            for index, start, stop in blocks:
+                fill_block(out[start:stop], task, self.seed, self.backend, index)
+            return out
+
+        pool = self._process_pool()
+        shared = shared_memory.SharedMemory(create=True, size=max(1, count * dtype.itemsize))
+        try:
+            futures = [
+                pool.submit(_fill_shared, shared.name, dtype.str, count, start, stop,
+                            task, self.seed, self.backend, index)
+                for index, start, stop in blocks
+            ]
+            for future in futures:
+                future.result()
+            # Одно копирование из общей памяти в обычный массив вызывающего
+            view = np.ndarray(count, dtype=dtype, buffer=shared.buf)
+            out = view.copy()
+            del view
+            return out
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def _describe(self, count, dtype, task):
+        if count < 0:
+            raise ValueError("Количество чисел не может быть отрицательным")
+        dtype = np.dtype(dtype)
+        blocks = list(self._blocks(count))
+        if self.workers == 1 or len(blocks) <= 1:
+            return _describe_blocks(blocks, dtype, task, self.seed, self.backend)
+        pool = self._process_pool()
+        # Каждый процесс получает каждый workers-й блок и возвращает только статистику
+        futures = [pool.submit(_describe_blocks, blocks[offset::self.workers], dtype.str, task,
+                                     self.seed, self.backend)
+                   for offset in range(min(self.workers, len(blocks)))]
+        stats = StreamStats()
+        for future in futures:
+            stats.merge(future.result())
+        return stats
+
+    def describe_random_sequence(self, length, min_val, max_val, num_type='int', dtype=None,
+                                 decimals=FLOAT_DECIMALS):
+        """
+        Статистика (rng.stats.StreamStats) по тем же числам, что generate_random_sequence,
+        без построения массива.
+        """
+        check_range(min_val, max_val, num_type)
+        task = {'mode': 'random', 'min_val': min_val, 'max_val': max_val,
+                'num_type': num_type, 'decimals': decimals}
+        return self._describe(length, resolve_dtype(num_type, dtype), task)
+
+    def describe_advanced_numbers(self, distribution, count, **params):
+        """
+        Статистика по тем же числам, что generate_advanced_numbers, без построения массива.
+        """
+        distribution = get_distribution(distribution)
+        task = {'mode': 'distribution', 'distribution': distribution.name,
+                'params': distribution.resolve_params(params)}
+        return self._describe(count, distribution.dtype, task)
+
+    def generate_random_sequence(self, length, min_val, max_val, num_type='int', dtype=None,
+                                 decimals=FLOAT_DECIMALS):
+        """
+        Массив случайных чисел из [min_val, max_val] (аналог generate_random_sequence).
+        """
+        check_range(min_val, max_val, num_type)
+        task = {'mode': 'random', 'min_val': min_val, 'max_val': max_val,
+                'num_type': num_type, 'decimals': decimals}
+        return self._run(length, resolve_dtype(num_type, dtype), task)
+
+    def generate_advanced_numbers(self, distribution, count, **params):
+        """
+        Массив чисел по распределению (аналог generate_advanced_numbers).
+        """
+        distribution = get_distribution(distribution)
+        task = {'mode': 'distribution', 'distribution': distribution.name,
+                'params': distribution.resolve_params(params)}
+        return self._run(count, distribution.dtype, task)
+
+    def generate_crypto_secure_numbers(self, min_val, max_val, count):
+        """
+        Массив криптографически стойких чисел (аналог generate_crypto_secure_numbers).
+        """
+        check_range(min_val, max_val, 'int')
+        task = {'mode': 'crypto', 'min_val': min_val, 'max_val': max_val}
+        return self._run(count, np.int64, task)
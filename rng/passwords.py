@@ -0,0 +1,147 @@
+"""
+Пакетная генерация паролей из криптостойкого источника.
+
+Алфавит и политика (обязательные классы символов, исключённые символы)
+компилируются один раз; символы выбираются сразу для целой порции паролей
+индексами без смещения (см. CryptoRandom.fill_below). Пароли, в которых нет
+какого-либо обязательного класса, перегенерируются целиком, поэтому все
+допустимые пароли равновероятны.
+"""
+import math
+import string
+from functools import lru_cache
+
+import numpy as np
+
+from rng.crypto import get_crypto
+
+# Символы, которые легко перепутать при чтении
+AMBIGUOUS_CHARACTERS = 'Il1|O0o`\'"'
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class PasswordPolicy:
+    """
+    Скомпилированная политика паролей: алфавит, классы символов и длина.
+
+    require_each_class - требовать хотя бы один символ каждого класса
+    (тогда длина должна быть не меньше числа классов).
+    """
+    def __init__(self, length, use_uppercase=True, use_numbers=True, use_symbols=True,
+                 exclude_ambiguous=False, require_each_class=False, exclude=''):
+        if length < 1:
+            raise ValueError("Длина пароля должна быть положительной")
+        excluded = set(exclude) | (set(AMBIGUOUS_CHARACTERS) if exclude_ambiguous else set())
+        classes = [string.ascii_lowercase]
+        if use_uppercase:
+            classes.append(string.ascii_uppercase)
+        if use_numbers:
+            classes.append(string.digits)
+        if use_symbols:
+            classes.append(string.punctuation)
+        classes = [''.join(c for c in chars if c not in excluded) for chars in classes]
+        self.classes = [chars for chars in classes if chars]
+        if not self.classes:
+            raise ValueError("Алфавит пароля пуст")
+        self.length = length
+        self.alphabet = ''.join(self.classes)
+        self.require_each_class = require_each_class and len(self.classes) > 1
+        if self.require_each_class and length < len(self.classes):
+            raise ValueError("Длина пароля меньше количества обязательных классов символов")
+        self.codes = np.frombuffer(self.alphabet.encode('ascii'), dtype=np.uint8)
+        # Номер класса для каждого индекса алфавита
+        self._class_of = np.repeat(np.arange(len(self.classes)), [len(c) for c in self.classes])
+
+    @property
+    def entropy_bits(self):
+        """
+        Энтропия одного пароля в битах: log2 числа допустимых паролей.
+        """
+        size = len(self.alphabet)
+        if not self.require_each_class:
+            return self.length * math.log2(size)
+        # Формула включений-исключений по наборам отсутствующих классов
+        valid = 0
+        for mask in range(1 << len(self.classes)):
+            missing = sum(len(c) for i, c in enumerate(self.classes) if mask >> i & 1)
+            sign = -1 if bin(mask).count('1') % 2 else 1
+            valid += sign * (size - missing) ** self.length
+        return math.log2(valid)
+
+    def valid_rows(self, indices):
+        """
+        Маска строк матрицы индексов, содержащих все обязательные классы.
+        """
+        if not self.require_each_class:
+            return np.ones(len(indices), dtype=bool)
+        present = np.zeros((len(indices), len(self.classes)), dtype=bool)
+        rows = np.repeat(np.arange(len(indices)), self.length)
+        present[rows, self._class_of[indices].ravel()] = True
+        return present.all(axis=1)
+
+
+class PasswordGenerator:
+    """
+    Генератор паролей по политике.
+
+    generator = PasswordGenerator(PasswordPolicy(16, exclude_ambiguous=True))
+    generator.generate(10)                          # список строк
+    generator.write_to(file, 10**6)                 # по паролю в строке, порциями
+    """
+    def __init__(self, policy, source=None):
+        self.policy = policy
+        self.crypto = get_crypto(source)
+
+    def generate_codes(self, count):
+        """
+        Матрица (count, length) байт ASCII.
+        """
+        policy = self.policy
+        indices = np.empty((count, policy.length), dtype=np.uint8)
+        pending = np.arange(count)
+        while len(pending):
+            draw = np.empty((len(pending), policy.length), dtype=np.uint8)
+            self.crypto.fill_below(draw.reshape(-1), len(policy.alphabet))
+            valid = policy.valid_rows(draw)
+            indices[pending[valid]] = draw[valid]
+            pending = pending[~valid]
+        return policy.codes[indices]
+
+    def generate(self, count):
+        """
+        Список из count паролей.
+        """
+        codes = self.generate_codes(count)
+        return [row.decode('ascii') for row in codes.view(f'S{self.policy.length}').ravel().tolist()]
+
+    def iter_lines(self, count=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Порции паролей в виде байт, по паролю в строке (count=None - без ограничения).
+        """
+        produced = 0
+        while count is None or produced < count:
+            size = chunk_size if count is None else min(chunk_size, count - produced)
+            lines = np.empty((size, self.policy.length + 1), dtype=np.uint8)
+            lines[:, :-1] = self.generate_codes(size)
+            lines[:, -1] = ord('\n')
+            produced += size
+            yield lines.tobytes()
+
+    def write_to(self, file, count, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Запись count паролей в двоичный файл, по паролю в строке.
+        """
+        for block in self.iter_lines(count, chunk_size):
+            file.write(block)
+        return count
+
+
+@lru_cache(maxsize=32)
+def get_password_generator(length, use_uppercase=True, use_numbers=True, use_symbols=True,
+                           exclude_ambiguous=False, require_each_class=False):
+    """
+    Генератор для политики с кэшированием скомпилированного алфавита.
+    """
+    return PasswordGenerator(PasswordPolicy(length, use_uppercase, use_numbers, use_symbols,
+                                            exclude_ambiguous, require_each_class))
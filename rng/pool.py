@@ -0,0 +1,210 @@
+"""
+Пул заранее сгенерированных случайных слов для одиночных запросов.
+
+Фоновый поток держит наготове несколько блоков 64-битных слов и дозаполняет
+их, когда готовых блоков становится меньше low_water. Одиночное число -
+это снятие слова из текущего блока и отображение его в диапазон, без вызова
+генератора. Блоки хранятся списками int, поэтому снятие слова не создаёт
+объектов NumPy; размер блока невелик, чтобы преобразование в фоне не держало
+GIL долго.
+
+    pool = get_pool()                      # алгоритм по умолчанию
+    pool.randint(1, 6)
+    get_pool(crypto_source='os').randint(0, 2**128 - 1)
+    pool.stats()                           # попадания, промахи, дозаполнения
+
+Криптостойкий пул хранит ещё не выданные байты в памяти процесса; для
+долгоживущих ключей лучше запрашивать их напрямую из rng.crypto.
+"""
+import collections
+import threading
+import time
+
+import numpy as np
+
+from rng.backends import DEFAULT_BACKEND, create_generator
+from rng.crypto import get_crypto
+from rng.engine import FLOAT_DECIMALS, check_range, decimal_grid
+
+DEFAULT_POOL_BLOCK = 8192
+DEFAULT_POOL_BLOCKS = 8
+
+_WORD_SPAN = 1 << 64
+_WORD_MASK = _WORD_SPAN - 1
+
+
+class RandomPool:
+    """
+    Буфер блоков случайных слов с фоновым дозаполнением.
+
+    Источник - алгоритм backend с seed или, если задан crypto_source,
+    криптостойкий источник rng.crypto. Методы потокобезопасны.
+    """
+    def __init__(self, backend=DEFAULT_BACKEND, seed=None, crypto_source=None,
+                 block_size=DEFAULT_POOL_BLOCK, blocks=DEFAULT_POOL_BLOCKS, low_water=None):
+        if block_size < 1 or blocks < 1:
+            raise ValueError("Размер и количество блоков должны быть положительными")
+        if crypto_source is not None:
+            crypto = get_crypto(crypto_source)
+            self._fill = lambda size: np.frombuffer(crypto.random_bytes(size * 8), dtype=np.uint64)
+            self.name = f"crypto:{crypto_source}"
+        else:
+            generator = create_generator(backend, seed)
+            self._fill = lambda size: generator.integers(0, _WORD_MASK, size=size, dtype=np.uint64,
+                                                         endpoint=True)
+            self.name = backend
+        self.block_size = block_size
+        self.blocks = blocks
+        self.low_water = max(1, blocks // 2) if low_water is None else low_water
+
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._ready = collections.deque()
+        self._current = []
+        self._closed = False
+        self._draws = 0
+        self._misses = 0
+        self._refills = 0
+        self._refill_seconds = 0.0
+        self._thread = threading.Thread(target=self._refill_loop, name=f"rng-pool-{self.name}",
+                                        daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _make_block(self):
+        return self._fill(self.block_size).tolist()
+
+    def _refill_loop(self):
+        while True:
+            with self._wake:
+                while not self._closed and len(self._ready) >= self.low_water:
+                    self._wake.wait()
+                if self._closed:
+                    return
+            # Блоки генерируются без блокировки, чтобы не задерживать выдачу
+            while True:
+                start = time.perf_counter()
+                block = self._make_block()
+                with self._lock:
+                    self._ready.append(block)
+                    self._refills += 1
+                    self._refill_seconds += time.perf_counter() - start
+                    if self._closed or len(self._ready) >= self.blocks:
+                        break
+
+    def _next_block(self):
+        # Вызывается под блокировкой, когда текущий блок исчерпан
+        if self._ready:
+            self._current = self._ready.popleft()
+            if len(self._ready) < self.low_water:
+                self._wake.notify()
+        else:
+            # Промах: фоновый поток не успел, блок генерируется в вызывающем потоке
+            self._misses += 1
+            self._current = self._make_block()
+            self._wake.notify()
+        return self._current
+
+    def next_word(self):
+        """
+        Случайное 64-битное слово (int).
+        """
+        with self._lock:
+            self._draws += 1
+            if self._current:
+                return self._current.pop()
+            return self._next_block().pop()
+
+    def randint(self, min_val, max_val):
+        """
+        Равномерное целое из [min_val, max_val] без смещения.
+        """
+        span = max_val - min_val + 1
+        if span < 1:
+            raise ValueError("Минимальное значение не может быть больше максимального!")
+        if span > _WORD_SPAN:
+            return min_val + self._below_wide(span)
+        # Умножение со сдвигом (Lemire) с отбраковкой младших частей ниже порога
+        threshold = _WORD_SPAN % span
+        while True:
+            product = self.next_word() * span
+            if product & _WORD_MASK >= threshold:
+                return min_val + (product >> 64)
+
+    def _below_wide(self, span):
+        words = -(-(span - 1).bit_length() // 64)
+        mask = (1 << (span - 1).bit_length()) - 1
+        while True:
+            value = 0
+            for _ in range(words):
+                value = value << 64 | self.next_word()
+            value &= mask
+            if value < span:
+                return value
+
+    def random(self):
+        """
+        Равномерное вещественное из [0, 1) с 53 битами точности.
+        """
+        return (self.next_word() >> 11) * (1.0 / (1 << 53))
+
+    def random_number(self, min_val, max_val, num_type='int', decimals=FLOAT_DECIMALS):
+        """
+        Одно число как у generate_random_number: целое или вещественное на сетке decimals знаков.
+        """
+        check_range(min_val, max_val, num_type)
+        if num_type == 'int':
+            return self.randint(min_val, max_val)
+        grid = None if decimals is None else decimal_grid(min_val, max_val, decimals)
+        if grid is not None:
+            return self.randint(*grid) / 10.0 ** decimals
+        return min_val + self.random() * (max_val - min_val)
+
+    def stats(self):
+        """
+        Метрики пула: выдачи, попадания, промахи, дозаполнения в фоне.
+        """
+        with self._lock:
+            draws, misses = self._draws, self._misses
+            return {
+                'source': self.name,
+                'draws': draws,
+                'hits': draws - misses,
+                'misses': misses,
+                'hit_rate': (draws - misses) / draws if draws else 1.0,
+                'refills': self._refills,
+                'refill_seconds': self._refill_seconds,
+                'ready_blocks': len(self._ready),
+                'available': len(self._current) + sum(len(block) for block in self._ready),
+            }
+
+    def close(self):
+        """
+        Остановка фонового потока.
+        """
+        with self._wake:
+            self._closed = True
+            self._wake.notify()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(backend=DEFAULT_BACKEND, crypto_source=None):
+    """
+    Общий пул процесса для алгоритма backend (или криптостойкого источника).
+    """
+    key = ('crypto', crypto_source) if crypto_source is not None else (backend, None)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = RandomPool(backend, crypto_source=crypto_source)
+        return pool
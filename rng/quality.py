@@ -0,0 +1,397 @@
+"""
+Статистические тесты качества случайных чисел.
+
+Тесты векторизованы и рассчитаны на большие выборки (миллионы значений);
+p-значения считаются без SciPy. Каждый тест возвращает словарь
+{'test', 'statistic', 'p_value', 'passed'}, где passed - p_value >= alpha:
+
+    values = np.asarray(RandomNumberGenerator.generate_random_sequence(10**6, 1, 100))
+    uniform_chi_square(values, 1, 100)
+    runs_test(values)
+    birthday_spacings(lambda size: crypto_integers(0, 2**32 - 1, size))
+"""
+import math
+
+import numpy as np
+
+# Уровень значимости по умолчанию: при 0.001 исправный генератор проваливает
+# отдельный тест примерно в одном запуске из тысячи
+DEFAULT_ALPHA = 0.001
+# Наибольшее число интервалов критерия хи-квадрат для равномерных целых
+MAX_BINS = 1000
+# Наименьшее ожидаемое число попаданий в интервал хи-квадрат
+MIN_EXPECTED = 5.0
+
+_EPSILON = 1e-15
+_TINY = 1e-300
+
+
+def _result(test, statistic, p_value, alpha, **extra):
+    return dict(test=test, statistic=float(statistic), p_value=float(p_value),
+                passed=bool(p_value >= alpha), **extra)
+
+
+def gamma_q(a, x):
+    """
+    Регуляризованная верхняя неполная гамма-функция Q(a, x).
+    """
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Ряд для P(a, x)
+        term = total = 1.0 / a
+        n = a
+        for _ in range(10000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * _EPSILON:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Цепная дробь для Q(a, x) (метод Лентца)
+    b = x + 1 - a
+    c = 1 / _TINY
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = _TINY if abs(d) < _TINY else d
+        c = b + an / c
+        c = _TINY if abs(c) < _TINY else c
+        d = 1 / d
+        h *= d * c
+        if abs(d * c - 1) < _EPSILON:
+            break
+    return math.exp(log_prefix) * h
+
+
+def beta_i(a, b, x):
+    """
+    Регуляризованная неполная бета-функция I_x(a, b).
+    """
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - beta_i(b, a, 1 - x)
+    prefix = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                      + a * math.log(x) + b * math.log(1 - x))
+    # Цепная дробь (метод Лентца)
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (_TINY if abs(d) < _TINY else d)
+    h = d
+    for m in range(1, 10000):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + numerator * d
+            d = 1 / (_TINY if abs(d) < _TINY else d)
+            c = 1 + numerator / c
+            c = _TINY if abs(c) < _TINY else c
+            h *= d * c
+        if abs(d * c - 1) < _EPSILON:
+            break
+    return prefix * h / a
+
+
+def incomplete_gamma(a, x):
+    """
+    Регуляризованные неполные гамма-функции (P(a, x), Q(a, x)) для массива x.
+
+    Ряд и цепная дробь считаются сразу для всех элементов; каждая из двух
+    функций берётся из своей ветки, поэтому малые значения не теряют точность.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 0:
+        q = gamma_q(a, float(x))
+        return np.float64(1.0 - q), np.float64(q)
+    p, q = np.zeros(x.shape), np.ones(x.shape)
+    positive = x > 0
+    series = positive & (x < a + 1)
+    if series.any():
+        xs = x[series]
+        term = np.full(xs.shape, 1.0 / a)
+        total = term.copy()
+        n = a
+        for _ in range(10000):
+            n += 1
+            term *= xs / n
+            total += term
+            if np.all(term < total * _EPSILON):
+                break
+        p[series] = np.minimum(1.0, total * np.exp(-xs + a * np.log(xs) - math.lgamma(a)))
+        q[series] = 1.0 - p[series]
+    fraction = positive & ~series
+    if fraction.any():
+        xf = x[fraction]
+        # Цепная дробь (метод Лентца), как в gamma_q
+        b = xf + 1 - a
+        c = np.full(xf.shape, 1 / _TINY)
+        d = 1 / b
+        h = d.copy()
+        for i in range(1, 10000):
+            an = -i * (i - a)
+            b += 2
+            d = an * d + b
+            d[np.abs(d) < _TINY] = _TINY
+            c = b + an / c
+            c[np.abs(c) < _TINY] = _TINY
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if np.all(np.abs(delta - 1) < _EPSILON):
+                break
+        q[fraction] = np.exp(-xf + a * np.log(xf) - math.lgamma(a)) * h
+        p[fraction] = 1.0 - q[fraction]
+    return p, q
+
+
+def erfc_array(z):
+    """
+    Дополнительная функция ошибок для массива: erfc(z) = Q(1/2, z**2) при z >= 0.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    if z.ndim == 0:
+        return np.float64(math.erfc(float(z)))
+    p, q = incomplete_gamma(0.5, z * z)
+    return np.where(z >= 0, q, 1.0 + p)
+
+
+def beta_i_array(a, b, x):
+    """
+    Регуляризованная неполная бета-функция I_x(a, b) для массива x.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 0:
+        return np.float64(beta_i(a, b, float(x)))
+    result = np.where(x >= 1, 1.0, 0.0)
+    inside = (x > 0) & (x < 1)
+    if not inside.any():
+        return result
+    xi = x[inside]
+    # Где ряд сходится медленно, считается 1 - I_{1-x}(b, a)
+    swap = xi > (a + 1) / (a + b + 2)
+    aa, bb = np.where(swap, b, a), np.where(swap, a, b)
+    xx = np.where(swap, 1 - xi, xi)
+    prefix = np.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                    + aa * np.log(xx) + bb * np.log1p(-xx))
+    c = np.ones(xx.shape)
+    d = 1 - (aa + bb) * xx / (aa + 1)
+    d[np.abs(d) < _TINY] = _TINY
+    d = 1 / d
+    h = d.copy()
+    for m in range(1, 10000):
+        for numerator in (m * (bb - m) * xx / ((aa + 2 * m - 1) * (aa + 2 * m)),
+                          -(aa + m) * (aa + bb + m) * xx / ((aa + 2 * m) * (aa + 2 * m + 1))):
+            d = 1 + numerator * d
+            d[np.abs(d) < _TINY] = _TINY
+            d = 1 / d
+            c = 1 + numerator / c
+            c[np.abs(c) < _TINY] = _TINY
+            h *= d * c
+        if np.all(np.abs(d * c - 1) < _EPSILON):
+            break
+    value = prefix * h / aa
+    result[inside] = np.where(swap, 1.0 - value, value)
+    return result
+
+
+def chi_square(observed, expected, alpha=DEFAULT_ALPHA, test='chi-square'):
+    """
+    Критерий согласия хи-квадрат.
+
+    Интервалы с ожидаемым числом меньше MIN_EXPECTED объединяются в один.
+    """
+    observed = np.asarray(observed, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
+    small = expected < MIN_EXPECTED
+    if small.any():
+        extra_observed, extra_expected = observed[small].sum(), expected[small].sum()
+        observed, expected = observed[~small], expected[~small]
+        if extra_expected >= MIN_EXPECTED or len(expected) == 0:
+            observed = np.append(observed, extra_observed)
+            expected = np.append(expected, extra_expected)
+        else:
+            # Остаток слишком мал и для отдельного интервала - добавляется к наименьшему
+            smallest = np.argmin(expected)
+            observed[smallest] += extra_observed
+            expected[smallest] += extra_expected
+    if len(expected) < 2:
+        raise ValueError("Для критерия хи-квадрат нужно хотя бы два интервала")
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    dof = len(expected) - 1
+    return _result(test, statistic, gamma_q(dof / 2, statistic / 2), alpha, dof=dof)
+
+
+def uniform_chi_square(values, min_val, max_val, alpha=DEFAULT_ALPHA, bins=MAX_BINS):
+    """
+    Хи-квадрат для целых, равномерных на [min_val, max_val].
+
+    Узкий диапазон проверяется по каждому значению, широкий - по bins интервалам.
+    """
+    values = np.asarray(values)
+    span = max_val - min_val + 1
+    if span <= bins:
+        observed = np.bincount((values - min_val).astype(np.int64), minlength=span)
+        return chi_square(observed, np.full(span, len(values) / span), alpha)
+    # Границы интервалов - целые числа, поэтому ожидаемые частоты точные
+    edges = [min_val + span * i // bins for i in range(bins + 1)]
+    observed = np.histogram(values.astype(np.float64), bins=np.asarray(edges, dtype=np.float64))[0]
+    widths = np.diff(np.asarray([edge - min_val for edge in edges], dtype=np.float64))
+    return chi_square(observed, len(values) * widths / span, alpha)
+
+
+def discrete_chi_square(values, pmf, alpha=DEFAULT_ALPHA, test='chi-square'):
+    """
+    Хи-квадрат для целых значений с вероятностями pmf(k).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    low = int(values.min())
+    observed = np.bincount(values - low)
+    keys = range(low, low + len(observed))
+    expected = np.array([pmf(k) for k in keys]) * len(values)
+    # Вероятность значений вне наблюдённого отрезка - в отдельный интервал
+    rest = max(0.0, len(values) - expected.sum())
+    return chi_square(np.append(observed, 0), np.append(expected, rest), alpha, test)
+
+
+def weighted_chi_square(values, numbers, weights, alpha=DEFAULT_ALPHA):
+    """
+    Хи-квадрат для взвешенной выборки из numbers.
+    """
+    values = np.asarray(values)
+    weights = np.ones(len(numbers)) if weights is None else np.asarray(weights, dtype=np.float64)
+    probabilities = {}
+    for number, weight in zip(numbers, weights / weights.sum()):
+        probabilities[number] = probabilities.get(number, 0.0) + weight
+    keys = np.array(list(probabilities))
+    observed = np.array([np.count_nonzero(values == key) for key in keys])
+    expected = np.array(list(probabilities.values())) * len(values)
+    return chi_square(observed, expected, alpha)
+
+
+def kolmogorov_q(statistic):
+    """
+    Хвост распределения Колмогорова: P(K > statistic).
+    """
+    if statistic < 0.2:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = 2 * (-1) ** (j - 1) * math.exp(-2 * j * j * statistic * statistic)
+        total += term
+        if abs(term) < _EPSILON:
+            break
+    return min(1.0, max(0.0, total))
+
+
+def ks_test(values, cdf, alpha=DEFAULT_ALPHA):
+    """
+    Критерий Колмогорова - Смирнова для непрерывного распределения.
+
+    cdf - функция распределения, применяемая к отсортированному массиву.
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    n = len(values)
+    if n == 0:
+        raise ValueError("Пустая выборка")
+    probabilities = np.asarray(cdf(values), dtype=np.float64)
+    positions = np.arange(1, n + 1) / n
+    statistic = max((positions - probabilities).max(), (probabilities - positions + 1 / n).max())
+    root = math.sqrt(n)
+    return _result('ks', statistic, kolmogorov_q((root + 0.12 + 0.11 / root) * statistic), alpha)
+
+
+def runs_test(values, alpha=DEFAULT_ALPHA):
+    """
+    Критерий серий Вальда - Вольфовица: значения больше медианы и остальные.
+    """
+    values = np.asarray(values)
+    median = np.median(values)
+    signs = values > median
+    if not signs.any():
+        # Медиана совпала с максимумом (мало различных значений)
+        signs = values >= median
+    n = len(signs)
+    above = int(np.count_nonzero(signs))
+    below = n - above
+    if above == 0 or below == 0:
+        return _result('runs', float('inf'), 0.0, alpha)
+    runs = 1 + int(np.count_nonzero(signs[1:] != signs[:-1]))
+    mean = 2 * above * below / n + 1
+    variance = 2 * above * below * (2 * above * below - n) / (n * n * (n - 1))
+    z = (runs - mean) / math.sqrt(variance)
+    return _result('runs', z, math.erfc(abs(z) / math.sqrt(2)), alpha, runs=runs)
+
+
+def poisson_p_value(observed, mean):
+    """
+    Двустороннее p-значение числа observed для закона Пуассона со средним mean.
+    """
+    lower = gamma_q(observed + 1, mean)
+    upper = 1.0 - gamma_q(observed, mean) if observed > 0 else 1.0
+    return min(1.0, 2 * min(lower, upper))
+
+
+def birthday_spacings(draw, days=2 ** 32, birthdays=4096, trials=256, alpha=DEFAULT_ALPHA):
+    """
+    Тест дней рождения Марсальи.
+
+    draw(size) - целые из [0, days). В каждом испытании birthdays дней
+    сортируются, и считаются совпадения среди промежутков между соседними;
+    сумма по испытаниям распределена по Пуассону со средним
+    trials * birthdays**3 / (4 * days).
+    """
+    values = np.asarray(draw(birthdays * trials), dtype=np.int64).reshape(trials, birthdays)
+    spacings = np.sort(np.diff(np.sort(values, axis=1), axis=1), axis=1)
+    collisions = int(np.count_nonzero(spacings[:, 1:] == spacings[:, :-1]))
+    mean = trials * birthdays ** 3 / (4 * days)
+    return _result('birthday', collisions, poisson_p_value(collisions, mean), alpha, expected=mean)
+
+
+def _normal_cdf(x, mean, sigma):
+    return 0.5 * erfc_array(-(np.asarray(x, dtype=np.float64) - mean) / (sigma * math.sqrt(2)))
+
+
+def _lognormal_cdf(x, mean, sigma):
+    x = np.asarray(x, dtype=np.float64)
+    positive = x > 0
+    return np.where(positive, _normal_cdf(np.log(np.where(positive, x, 1.0)), mean, sigma), 0.0)[()]
+
+
+# Функции распределения (для массивов и чисел) и вероятности значений по именам rng.distributions
+CDFS = {
+    'Равномерное': lambda x, low, high: np.clip((np.asarray(x, dtype=np.float64) - low) / (high - low),
+                                                0.0, 1.0),
+    'Нормальное': _normal_cdf,
+    'Экспоненциальное': lambda x, lam: -np.expm1(-lam * np.maximum(np.asarray(x, dtype=np.float64), 0.0)),
+    'Гамма': lambda x, shape, scale: incomplete_gamma(
+        shape, np.maximum(np.asarray(x, dtype=np.float64), 0.0) / scale)[0],
+    'Бета': lambda x, a, b: beta_i_array(a, b, x),
+    'Логнормальное': _lognormal_cdf,
+}
+PMFS = {
+    'Пуассона': lambda k, lam: math.exp(k * math.log(lam) - lam - math.lgamma(k + 1)) if k >= 0 else 0.0,
+    'Биномиальное': lambda k, n, p: math.comb(int(n), k) * p ** k * (1 - p) ** (int(n) - k)
+    if 0 <= k <= n else 0.0,
+}
+
+
+def distribution_test(distribution, values, params, alpha=DEFAULT_ALPHA):
+    """
+    Проверка выборки по распределению rng.distributions.
+
+    Непрерывные - критерий Колмогорова - Смирнова по всей выборке (функция
+    распределения вычисляется сразу для массива), дискретные - хи-квадрат.
+    """
+    name = distribution.name
+    params = distribution.resolve_params(params)
+    if name in PMFS:
+        return discrete_chi_square(values, lambda k: PMFS[name](k, **params), alpha)
+    if name not in CDFS:
+        raise ValueError(f"Для распределения {name} нет функции распределения")
+    return ks_test(values, lambda x: CDFS[name](x, **params), alpha)
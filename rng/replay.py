@@ -0,0 +1,216 @@
+"""
+Воспроизведение результатов по компактному описанию вместо хранения чисел.
+
+Описание (ReplayDescriptor) - режим, параметры, алгоритм, seed, смещение
+в потоке и размер блока. Поток делится на блоки, как в rng.parallel: блок
+с номером i заполняется собственным генератором с seed, порождённым из главного
+(block_seed), и всегда генерируется целиком. Поэтому любой срез выхода
+восстанавливается генерацией только покрывающих его блоков, без прохода
+по предыдущим. Уникальные числа строятся перестановкой Фейстеля, которая
+вычисляется для любого индекса напрямую.
+
+    descriptor = ReplayDescriptor('random', {'min_val': 1, 'max_val': 100}, 10**9, seed=42)
+    tail = descriptor.generate(10**9 - 10, 10**9)
+    token = descriptor.to_token()
+    ReplayDescriptor.from_token(token).generate(0, 5)
+"""
+import base64
+import json
+import secrets
+import zlib
+
+import numpy as np
+
+from rng.backends import DEFAULT_BACKEND, create_generator
+from rng.distributions import get_distribution
+from rng.engine import FLOAT_DECIMALS, INT64_MAX, check_range, resolve_dtype
+from rng.jobs import GenerationJob, create_job
+from rng.parallel import fill_block
+from rng.unique import FeistelPermutation
+from rng.weighted import get_sampler
+
+# Режимы, которые можно воспроизвести (криптостойкие числа и пароли - нельзя)
+REPLAY_MODES = ('random', 'unique', 'weighted', 'distribution')
+DEFAULT_BLOCK_SIZE = 65536
+TOKEN_PREFIX = 'rng1:'
+
+
+class ReplayDescriptor:
+    """
+    Описание воспроизводимого результата из count значений.
+
+    params - параметры режима как у rng.jobs.create_job (без mode и count);
+    offset - номер первого значения в бесконечном потоке данного seed.
+    """
+    def __init__(self, mode, params, count, backend=DEFAULT_BACKEND, seed=None, offset=0,
+                 block_size=DEFAULT_BLOCK_SIZE):
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Режим {mode} нельзя воспроизвести")
+        if count < 0 or offset < 0:
+            raise ValueError("Количество и смещение не могут быть отрицательными")
+        if block_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.mode = mode
+        self.params = dict(params)
+        self.count = count
+        self.backend = backend
+        self.seed = secrets.randbits(128) if seed is None else seed
+        self.offset = offset
+        self.block_size = block_size
+        self._task, self.dtype = self._prepare()
+        self._permutation = None
+
+    def _prepare(self):
+        """
+        Задача для rng.parallel.fill_block и тип результата.
+        """
+        params = self.params
+        if self.mode == 'random':
+            num_type = params.get('num_type', 'int')
+            check_range(params['min_val'], params['max_val'], num_type)
+            task = {'mode': 'random', 'min_val': params['min_val'], 'max_val': params['max_val'],
+                    'num_type': num_type, 'decimals': params.get('decimals', FLOAT_DECIMALS)}
+            return task, resolve_dtype(num_type)
+        if self.mode == 'distribution':
+            distribution = get_distribution(params['distribution'])
+            task = {'mode': 'distribution', 'distribution': distribution.name,
+                    'params': distribution.resolve_params(params.get('params') or {})}
+            return task, distribution.dtype
+        if self.mode == 'weighted':
+            numbers = tuple(params['numbers'])
+            weights = None if params.get('weights') is None else tuple(params['weights'])
+            task = {'mode': 'weighted', 'numbers': numbers, 'weights': weights}
+            return task, get_sampler(numbers, weights).values.dtype
+        min_val, max_val = params['min_val'], params['max_val']
+        if min_val > max_val:
+            raise ValueError("Минимальное значение не может быть больше максимального!")
+        if min_val < 0 and max_val > INT64_MAX:
+            raise ValueError("Диапазон с отрицательными числами должен помещаться в int64")
+        if self.offset + self.count > max_val - min_val + 1:
+            raise ValueError("Невозможно сгенерировать уникальные числа с заданными параметрами")
+        return None, np.dtype(np.int64 if max_val <= INT64_MAX else np.uint64)
+
+    def fill(self, out, start=0):
+        """
+        Заполнение out значениями с номерами start, start + 1, ...
+        """
+        if start < 0 or start + len(out) > self.count:
+            raise ValueError("Срез выходит за пределы результата")
+        first = self.offset + start
+        if self.mode == 'unique':
+            self._fill_unique(out, first)
+            return out
+        size = self.block_size
+        buffer = None
+        position = 0
+        while position < len(out):
+            index, skip = divmod(first + position, size)
+            length = min(size - skip, len(out) - position)
+            target = out[position:position + length]
+            if length == size:
+                fill_block(target, self._task, self.seed, self.backend, index)
+            else:
+                # Неполный блок генерируется целиком, из него берётся нужный отрезок
+                if buffer is None:
+                    buffer = np.empty(size, dtype=self.dtype)
+                fill_block(buffer, self._task, self.seed, self.backend, index)
+                target[...] = buffer[skip:skip + length]
+            position += length
+        return out
+
+    def _fill_unique(self, out, first):
+        min_val, max_val = self.params['min_val'], self.params['max_val']
+        if self._permutation is None:
+            self._permutation = FeistelPermutation.random(max_val - min_val + 1,
+                                                          create_generator(self.backend, self.seed))
+        values = self._permutation(np.arange(first, first + len(out), dtype=np.uint64))
+        # Сложение по модулю 2**64, как в rng.unique.sample_unique
+        values += np.uint64(min_val % (1 << 64))
+        out[...] = values.view(out.dtype)
+
+    def generate(self, start=0, stop=None):
+        """
+        Значения с номерами из [start, stop).
+        """
+        stop = self.count if stop is None else stop
+        if not 0 <= start <= stop <= self.count:
+            raise ValueError("Срез выходит за пределы результата")
+        return self.fill(np.empty(stop - start, dtype=self.dtype), start)
+
+    def slice(self, start, stop):
+        """
+        Описание отрезка [start, stop) этого результата.
+        """
+        if not 0 <= start <= stop <= self.count:
+            raise ValueError("Срез выходит за пределы результата")
+        return ReplayDescriptor(self.mode, self.params, stop - start, self.backend, self.seed,
+                                self.offset + start, self.block_size)
+
+    def job(self, start=0, stop=None):
+        """
+        Задание rng.jobs для значений из [start, stop), порциями по блоку.
+
+        Как и срез списка, stop за концом результата ограничивается его длиной.
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        if not 0 <= start <= stop:
+            raise ValueError("Срез выходит за пределы результата")
+
+        def chunks():
+            # Границы порций совпадают с границами блоков потока
+            position = start
+            while position < stop:
+                end = min(position + self.block_size - (self.offset + position) % self.block_size, stop)
+                yield self.generate(position, end)
+                position = end
+        return GenerationJob(chunks, stop - start, self.dtype, f"Воспроизведение ({self.mode})")
+
+    def to_dict(self):
+        return {'mode': self.mode, 'params': self.params, 'count': self.count,
+                'backend': self.backend, 'seed': self.seed, 'offset': self.offset,
+                'block_size': self.block_size}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['mode'], data['params'], data['count'], data.get('backend', DEFAULT_BACKEND),
+                   data['seed'], data.get('offset', 0), data.get('block_size', DEFAULT_BLOCK_SIZE))
+
+    def to_token(self):
+        """
+        Короткая строка с описанием (сжатый JSON в base64).
+        """
+        data = self.to_dict()
+        # Значения по умолчанию в строку не попадают
+        if data['offset'] == 0:
+            del data['offset']
+        if data['block_size'] == DEFAULT_BLOCK_SIZE:
+            del data['block_size']
+        if data['backend'] == DEFAULT_BACKEND:
+            del data['backend']
+        data = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return TOKEN_PREFIX + base64.urlsafe_b64encode(zlib.compress(data, 9)).decode('ascii').rstrip('=')
+
+    @classmethod
+    def from_token(cls, token):
+        if not token.startswith(TOKEN_PREFIX):
+            raise ValueError("Строка не является описанием результата")
+        payload = token[len(TOKEN_PREFIX):]
+        try:
+            data = zlib.decompress(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        except (ValueError, zlib.error):
+            raise ValueError("Повреждённое описание результата") from None
+        return cls.from_dict(json.loads(data.decode('utf-8')))
+
+
+def create_replayable_job(params, backend=DEFAULT_BACKEND, seed=None):
+    """
+    Задание по параметрам rng.jobs.create_job и описание для его воспроизведения.
+
+    Для режимов вне REPLAY_MODES описание равно None, задание строится create_job.
+    """
+    params = dict(params)
+    mode, count = params.pop('mode'), params.pop('count')
+    if mode not in REPLAY_MODES:
+        return create_job(mode, count, **params), None
+    descriptor = ReplayDescriptor(mode, params, count, backend, seed)
+    return descriptor.job(), descriptor
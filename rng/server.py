@@ -0,0 +1,543 @@
+"""
+Локальный сервис генерации случайных чисел на asyncio.
+
+Сервис слушает два протокола:
+
+HTTP/1.1 (keep-alive, chunked для больших количеств):
+    GET  /random?min=1&max=100&count=10       - числа по одному в строке
+    GET  /distribution?name=normal&param=mean=5&param=sigma=2&count=1000&format=json
+    GET  /crypto?min=0&max=255&count=1000000&format=binary
+    GET  /password?length=16&count=3
+    GET  /wide?min=0&max=340282366920938463463374607431768211455&count=10&as=hex
+    POST /generate  - JSON-объект запроса или список (пакет), ответ JSON
+    GET  /stats     - счётчики сервиса
+
+Потоковый протокол (TCP или Unix-сокет): клиент пишет по одному JSON-объекту
+запроса в строке, сервер отвечает в том же порядке строкой-заголовком
+{"id": ..., "count": N, "dtype": "<i8"} и значениями: в формате text - по
+одному в строке с пустой строкой в конце, в формате binary - ровно
+count * размер_элемента байт little-endian. При ошибке заголовок содержит
+"error" и значений нет.
+
+Запрос - параметры rng.jobs.create_job (mode, count, min_val, max_val, ...)
+и при необходимости backend и seed. Генерация и форматирование выполняются
+в пуле потоков, а следующая порция запрашивается только после того, как
+клиент принял предыдущую (writer.drain), поэтому память на соединение
+ограничена одной порцией.
+
+    python -m rng serve --port 8000 --stream-port 8001
+"""
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import os
+import time
+import urllib.parse
+
+import numpy as np
+
+from rng.backends import DEFAULT_BACKEND, create_generator
+from rng.distributions import parse_params
+from rng.engine import FLOAT_DECIMALS, parse_decimals, resolve_dtype
+from rng.jobs import MODES, GenerationJob, create_job
+from rng.pool import get_pool
+from rng.stream import DEFAULT_CHUNK_SIZE
+from rng.text import format_lines, json_default, text_decimals
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+# Соединение без запросов дольше этого времени закрывается
+IDLE_TIMEOUT = 60.0
+MAX_BODY_SIZE = 1 << 20
+# Ограничение пакета POST /generate: ответ строится целиком в памяти
+MAX_BATCH_VALUES = 1_000_000
+
+REQUEST_KEYS = ('mode', 'count', 'min_val', 'max_val', 'num_type', 'numbers', 'weights',
+                'distribution', 'params', 'password_length', 'use_uppercase', 'use_numbers',
+                'use_symbols', 'source', 'backend', 'seed', 'output', 'decimals')
+FORMATS = ('text', 'json', 'binary')
+
+# Имена параметров запроса GET (как в командной строке) и их разбор
+_QUERY_PARAMS = {
+    'count': ('count', int),
+    'min': ('min_val', lambda text: _number(text)),
+    'max': ('max_val', lambda text: _number(text)),
+    'type': ('num_type', str),
+    'values': ('numbers', lambda text: [_number(item) for item in text.split(',')]),
+    'weights': ('weights', lambda text: [float(item) for item in text.split(',')]),
+    'name': ('distribution', str),
+    'length': ('password_length', int),
+    'uppercase': ('use_uppercase', lambda text: _flag(text)),
+    'numbers': ('use_numbers', lambda text: _flag(text)),
+    'symbols': ('use_symbols', lambda text: _flag(text)),
+    'source': ('source', str),
+    'backend': ('backend', str),
+    'seed': ('seed', int),
+    'as': ('output', str),
+    'decimals': ('decimals', parse_decimals),
+}
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large'}
+
+
+class HttpError(Exception):
+    """
+    Ошибка запроса, на которую отвечают кодом status.
+    """
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _flag(text):
+    return text.lower() not in ('0', 'false', 'no', 'off')
+
+
+def parse_query(mode, query):
+    """
+    Запрос из пути /<mode> и строки параметров GET: (запрос, формат ответа).
+    """
+    request = {'mode': mode}
+    fmt = 'text'
+    for key, values in urllib.parse.parse_qs(query, keep_blank_values=True).items():
+        if key == 'format':
+            fmt = values[-1]
+        elif key == 'param':
+            request['params'] = parse_params(','.join(values))
+        elif key in _QUERY_PARAMS:
+            name, convert = _QUERY_PARAMS[key]
+            request[name] = convert(values[-1])
+        else:
+            raise ValueError(f"Неизвестный параметр: {key}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат ответа: {fmt}")
+    return request, fmt
+
+
+def build_job(request, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Задание rng.jobs по словарю запроса.
+
+    Одиночное случайное число без seed берётся из общего пула rng.pool.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("Запрос должен быть JSON-объектом")
+    unknown = sorted(set(request) - set(REQUEST_KEYS))
+    if unknown:
+        raise ValueError(f"Неизвестный параметр: {unknown[0]}")
+    params = dict(request)
+    mode = params.pop('mode', None)
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим генерации: {mode}")
+    count = params.pop('count', 1)
+    if not isinstance(count, int) or isinstance(count, bool):
+        raise ValueError("Количество чисел должно быть целым")
+    backend, seed = params.pop('backend', None), params.pop('seed', None)
+    generator = None
+    if backend is not None or seed is not None:
+        generator = create_generator(backend or DEFAULT_BACKEND, seed)
+    if mode == 'random' and count == 1 and generator is None:
+        num_type = params.get('num_type', 'int')
+        dtype = resolve_dtype(num_type)
+        value = get_pool().random_number(params.get('min_val', 0), params.get('max_val', 100), num_type,
+                                         params.get('decimals', FLOAT_DECIMALS))
+        return GenerationJob(lambda: iter([np.array([value], dtype)]), 1, dtype, "Случайное число")
+    return create_job(mode, count, generator=generator, chunk_size=chunk_size, **params)
+
+
+def _text_encoder(decimals):
+    return lambda chunk: format_lines(chunk, decimals)
+
+
+def _encode_json(chunk):
+    values = chunk.tolist() if isinstance(chunk, np.ndarray) else chunk
+    text = json.dumps(values, ensure_ascii=False, separators=(',', ':'), default=json_default)
+    return text[1:-1].encode('utf-8')
+
+
+def _binary_encoder(dtype):
+    dtype = dtype.newbyteorder('<')
+    return lambda chunk: np.ascontiguousarray(chunk, dtype=dtype).tobytes()
+
+
+def _encoder(job, fmt, decimals=None):
+    if fmt == 'binary':
+        if job.dtype is None:
+            raise ValueError("В двоичном формате выдаются только числа")
+        return _binary_encoder(job.dtype)
+    return _encode_json if fmt == 'json' else _text_encoder(decimals)
+
+
+def _next_piece(chunks, encode):
+    # Генерация и форматирование порции выполняются в пуле потоков
+    chunk = next(chunks, None)
+    return None if chunk is None else encode(chunk)
+
+
+def _dtype_name(job):
+    return None if job.dtype is None else job.dtype.newbyteorder('<').str
+
+
+def run_batch(requests, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Выполнение пакета запросов: список {"values": [...]} или {"error": "..."} по порядку.
+    """
+    jobs = []
+    total = 0
+    for request in requests:
+        try:
+            job = build_job(request, chunk_size)
+            total += job.count
+            jobs.append(job)
+        except (ValueError, TypeError, KeyError) as e:
+            jobs.append(e)
+    if total > MAX_BATCH_VALUES:
+        raise ValueError(f"В пакете больше {MAX_BATCH_VALUES} значений, используйте потоковые запросы")
+    results = []
+    for job in jobs:
+        if isinstance(job, Exception):
+            results.append({'error': str(job)})
+            continue
+        try:
+            values = job.run()
+            results.append({'values': values.tolist() if isinstance(values, np.ndarray) else values})
+        except (ValueError, TypeError, KeyError) as e:
+            results.append({'error': str(e)})
+    return results
+
+
+def _batch_response(requests, chunk_size):
+    results = run_batch(requests, chunk_size)
+    body = json.dumps({'results': results}, ensure_ascii=False, default=json_default).encode('utf-8')
+    return body, sum(len(result['values']) for result in results if 'values' in result)
+
+
+class RandomServer:
+    """
+    Сервис генерации: HTTP на port, потоковый протокол на stream_port и/или unix_path.
+
+    Порт 0 означает свободный порт, выбранный системой; фактические адреса
+    доступны в addresses после start().
+    """
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, stream_port=None, unix_path=None,
+                 workers=None, chunk_size=DEFAULT_CHUNK_SIZE, idle_timeout=IDLE_TIMEOUT):
+        if chunk_size < 1:
+            raise ValueError("Размер порции должен быть положительным")
+        self.host = host
+        self.port = port
+        self.stream_port = stream_port
+        self.unix_path = unix_path
+        self.chunk_size = chunk_size
+        self.idle_timeout = idle_timeout
+        self.addresses = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix='rng-server')
+        self._servers = []
+        self._started = time.monotonic()
+        self._stats = {'connections': 0, 'active': 0, 'requests': 0, 'errors': 0,
+                       'values': 0, 'bytes': 0}
+
+    async def start(self):
+        """
+        Открытие слушающих сокетов.
+        """
+        if self.port is not None:
+            server = await asyncio.start_server(self._handle_http, self.host, self.port)
+            self._servers.append(server)
+            self.addresses['http'] = server.sockets[0].getsockname()[:2]
+        if self.stream_port is not None:
+            server = await asyncio.start_server(self._handle_stream, self.host, self.stream_port)
+            self._servers.append(server)
+            self.addresses['tcp'] = server.sockets[0].getsockname()[:2]
+        if self.unix_path is not None:
+            if os.path.exists(self.unix_path):
+                os.remove(self.unix_path)
+            self._servers.append(await asyncio.start_unix_server(self._handle_stream, self.unix_path))
+            self.addresses['unix'] = self.unix_path
+        if not self._servers:
+            raise ValueError("Не указан ни один адрес для прослушивания")
+
+    async def serve_forever(self):
+        if not self._servers:
+            await self.start()
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in self._servers))
+        finally:
+            await self.close()
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+        if self.unix_path is not None and os.path.exists(self.unix_path):
+            os.remove(self.unix_path)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """
+        Счётчики сервиса: соединения, запросы, ошибки, выданные значения и байты.
+        """
+        return dict(self._stats, uptime=time.monotonic() - self._started, pool=get_pool().stats())
+
+    async def _call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _readline(self, reader):
+        try:
+            return await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            return b''
+
+    async def _connection(self, handler, reader, writer):
+        self._stats['connections'] += 1
+        self._stats['active'] += 1
+        try:
+            await handler(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            # Клиент отключился или прислал слишком длинную строку
+            pass
+        finally:
+            self._stats['active'] -= 1
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _write(self, writer, data):
+        # Ожидание приёма клиентом до генерации следующей порции
+        writer.write(data)
+        self._stats['bytes'] += len(data)
+        await writer.drain()
+
+    async def _start_job(self, request, fmt):
+        """
+        Задание, кодировщик, итератор порций и первая порция.
+
+        Первая порция генерируется до отправки заголовка, чтобы ошибки
+        параметров попадали в ответ, а не обрывали поток.
+        """
+        self._stats['requests'] += 1
+        job = await self._call(build_job, request, self.chunk_size)
+        encode = _encoder(job, fmt, text_decimals(request))
+        chunks = job.iter_chunks()
+        first = await self._call(_next_piece, chunks, encode)
+        return job, encode, chunks, first
+
+    async def _send_pieces(self, writer, chunks, encode, first, frame=None, separator=b''):
+        piece = first
+        sent = 0
+        while piece is not None:
+            if piece:
+                data = separator + piece if sent else piece
+                await self._write(writer, frame(data) if frame else data)
+                sent += 1
+            try:
+                piece = await self._call(_next_piece, chunks, encode)
+            except (ValueError, TypeError) as e:
+                # Заголовок уже отправлен: о неполном ответе клиент узнаёт по обрыву соединения
+                self._stats['errors'] += 1
+                raise ConnectionAbortedError(str(e)) from e
+
+    # HTTP
+
+    def _http_head(self, status, headers):
+        lines = [f"HTTP/1.1 {status} {_REASONS[status]}"]
+        lines += [f"{name}: {value}" for name, value in headers]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def _http_reply(self, writer, status, body, content_type, keep_alive):
+        headers = [('Content-Type', content_type), ('Content-Length', len(body)),
+                   ('Connection', 'keep-alive' if keep_alive else 'close')]
+        await self._write(writer, self._http_head(status, headers) + body)
+
+    async def _read_http_request(self, line, reader):
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(400, "Неверная строка запроса") from None
+        headers = {}
+        while True:
+            header = await reader.readline()
+            if header in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = header.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0) or 0)
+        if length > MAX_BODY_SIZE:
+            raise HttpError(413, f"Тело запроса больше {MAX_BODY_SIZE} байт")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), target, version.upper(), headers, body
+
+    async def _handle_http(self, reader, writer):
+        await self._connection(self._http_loop, reader, writer)
+
+    async def _http_loop(self, reader, writer):
+        while True:
+            line = await self._readline(reader)
+            if not line:
+                return
+            if not line.strip():
+                continue
+            keep_alive = False
+            try:
+                method, target, version, headers, body = await self._read_http_request(line, reader)
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                keep_alive = await self._http_dispatch(writer, method, target, version, body, keep_alive)
+            except HttpError as e:
+                self._stats['errors'] += 1
+                await self._http_reply(writer, e.status, f"Ошибка: {e}\n".encode('utf-8'),
+                                       'text/plain; charset=utf-8', keep_alive)
+            except (ValueError, TypeError, KeyError) as e:
+                self._stats['errors'] += 1
+                await self._http_reply(writer, 400, f"Ошибка: {e}\n".encode('utf-8'),
+                                       'text/plain; charset=utf-8', keep_alive)
+            if not keep_alive:
+                return
+
+    async def _http_dispatch(self, writer, method, target, version, body, keep_alive):
+        """
+        Ответ на запрос; возвращает, можно ли продолжать соединение.
+        """
+        url = urllib.parse.urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        if path == '/stats':
+            if method != 'GET':
+                raise HttpError(405, "Ожидается GET")
+            body = json.dumps(self.stats(), ensure_ascii=False).encode('utf-8')
+            await self._http_reply(writer, 200, body, 'application/json', keep_alive)
+            return keep_alive
+        if path == '/generate':
+            if method != 'POST':
+                raise HttpError(405, "Ожидается POST")
+            await self._http_batch(writer, body, keep_alive)
+            return keep_alive
+        mode = path[1:]
+        if mode not in MODES:
+            raise HttpError(404, f"Неизвестный путь: {path}")
+        if method != 'GET':
+            raise HttpError(405, "Ожидается GET")
+        request, fmt = parse_query(mode, url.query)
+        return await self._http_stream(writer, request, fmt, version, keep_alive)
+
+    async def _http_batch(self, writer, body, keep_alive):
+        try:
+            requests = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HttpError(400, "Тело запроса должно быть JSON") from None
+        single = isinstance(requests, dict)
+        requests = [requests] if single else requests
+        if not isinstance(requests, list):
+            raise HttpError(400, "Ожидается JSON-объект или список объектов")
+        self._stats['requests'] += len(requests)
+        response, values = await self._call(_batch_response, requests, self.chunk_size)
+        self._stats['values'] += values
+        await self._http_reply(writer, 200, response, 'application/json', keep_alive)
+
+    async def _http_stream(self, writer, request, fmt, version, keep_alive):
+        job, encode, chunks, first = await self._start_job(request, fmt)
+        content_type = {'text': 'text/plain; charset=utf-8', 'json': 'application/json',
+                        'binary': 'application/octet-stream'}[fmt]
+        prefix, suffix, separator = (b'{"values":[', b']}', b',') if fmt == 'json' else (b'', b'', b'')
+        headers = [('Content-Type', content_type), ('X-Count', job.count)]
+        if job.dtype is not None:
+            headers.append(('X-Dtype', _dtype_name(job)))
+        if job.count <= self.chunk_size:
+            # Весь ответ - одна порция: обычный ответ с длиной
+            body = prefix + (first or b'') + suffix
+            headers += [('Content-Length', len(body)), ('Connection', 'keep-alive' if keep_alive else 'close')]
+            await self._write(writer, self._http_head(200, headers) + body)
+            self._stats['values'] += job.count
+            return keep_alive
+        if version == 'HTTP/1.0':
+            # Без chunked конец ответа обозначается закрытием соединения
+            keep_alive = False
+            frame = None
+            headers.append(('Connection', 'close'))
+        else:
+            frame = self._http_chunk
+            headers += [('Transfer-Encoding', 'chunked'),
+                        ('Connection', 'keep-alive' if keep_alive else 'close')]
+        await self._write(writer, self._http_head(200, headers))
+        if prefix:
+            await self._write(writer, frame(prefix) if frame else prefix)
+        await self._send_pieces(writer, chunks, encode, first, frame, separator)
+        if suffix:
+            await self._write(writer, frame(suffix) if frame else suffix)
+        if frame:
+            await self._write(writer, b'0\r\n\r\n')
+        self._stats['values'] += job.count
+        return keep_alive
+
+    @staticmethod
+    def _http_chunk(data):
+        return b'%x\r\n%b\r\n' % (len(data), data)
+
+    # Потоковый протокол
+
+    async def _handle_stream(self, reader, writer):
+        await self._connection(self._stream_loop, reader, writer)
+
+    async def _stream_loop(self, reader, writer):
+        while True:
+            line = await self._readline(reader)
+            if not line:
+                return
+            if not line.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Запрос должен быть JSON-объектом")
+                request_id = request.pop('id', None)
+                fmt = request.pop('format', 'text')
+                if fmt not in ('text', 'binary'):
+                    raise ValueError(f"Неизвестный формат ответа: {fmt}")
+                job, encode, chunks, first = await self._start_job(request, fmt)
+            except (ValueError, TypeError, KeyError) as e:
+                self._stats['errors'] += 1
+                await self._write(writer, self._stream_header({'id': request_id, 'error': str(e)}))
+                continue
+            header = {'id': request_id, 'count': job.count, 'dtype': _dtype_name(job)}
+            if fmt == 'binary':
+                header['bytes'] = job.count * job.dtype.itemsize
+            await self._write(writer, self._stream_header(header))
+            await self._send_pieces(writer, chunks, encode, first)
+            if fmt == 'text':
+                await self._write(writer, b'\n')
+            self._stats['values'] += job.count
+
+    @staticmethod
+    def _stream_header(header):
+        return json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, stream_port=None, unix_path=None, workers=None,
+          chunk_size=DEFAULT_CHUNK_SIZE, on_start=None):
+    """
+    Запуск сервиса до прерывания (Ctrl+C).
+
+    on_start(addresses) вызывается после открытия сокетов.
+    """
+    server = RandomServer(host, port, stream_port, unix_path, workers, chunk_size)
+
+    async def main():
+        await server.start()
+        if on_start is not None:
+            on_start(server.addresses)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,375 @@
+"""
+Потоковая статистика по результату генерации за один проход.
+
+Накопители принимают значения порциями (on_chunk задания rng.jobs, поток
+rng.stream, блоки rng.parallel), занимают память, не зависящую от длины
+потока, и объединяются методом merge - например, по блокам, посчитанным
+в разных процессах:
+
+    stats = StreamStats()
+    job.run(on_chunk=stats.update)
+    print(stats.format())
+
+    for chunk in observe(stream_random(1, 100, total=10**9), stats):
+        ...
+
+Moments - количество, среднее, дисперсия, минимум и максимум (формулы
+Уэлфорда и Чана для объединения порций); QuantileSketch - приближённые
+квантили (KLL); HyperLogLog - приближённое число различных значений.
+"""
+import hashlib
+import math
+
+import numpy as np
+
+from rng.backends import mix64
+
+# Размер блока, который целиком помещается в кэш процессора
+BLOCK_SIZE = 65536
+# Параметр k скетча KLL: ошибка ранга порядка 1/k
+DEFAULT_K = 256
+# Точность HyperLogLog: 2**14 регистров (16 КБ), относительная ошибка около 0.8%
+DEFAULT_PRECISION = 14
+DEFAULT_QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+
+
+def numeric_values(values):
+    """
+    Порция как массив numpy или None для нечисловых значений.
+    """
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values) if len(values) else np.empty(0)
+    return values if values.dtype.kind in 'iuf' else None
+
+
+class Moments:
+    """
+    Количество, среднее, дисперсия, минимум и максимум.
+
+    Среднее и сумма квадратов отклонений каждого блока объединяются с
+    накопленными по формуле Чана - это обобщение шага Уэлфорда на порции,
+    устойчивое к большому смещению значений.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, values):
+        """
+        Добавление порции значений.
+        """
+        values = numeric_values(values)
+        if values is None:
+            return
+        for start in range(0, len(values), BLOCK_SIZE):
+            chunk = values[start:start + BLOCK_SIZE]
+            block = chunk.astype(np.float64)
+            block_mean = float(block.mean())
+            deviations = block - block_mean
+            self._combine(len(block), block_mean, float(np.dot(deviations, deviations)),
+                          chunk.min().item(), chunk.max().item())
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+        self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+
+    def merge(self, other):
+        """
+        Объединение с накопителем по другой части потока.
+        """
+        self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        """
+        Выборочная дисперсия (с поправкой Бесселя).
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Скетч квантилей KLL.
+
+    Уровень h хранит значения с весом 2**h. Переполненный уровень
+    сортируется, и каждое второе значение (со случайным сдвигом) переходит
+    на следующий уровень; ёмкость нижних уровней убывает как (2/3)**глубина,
+    поэтому всего хранится O(k) значений.
+    """
+    def __init__(self, k=DEFAULT_K, seed=None):
+        if k < 8:
+            raise ValueError("Параметр k скетча должен быть не меньше 8")
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._random = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """
+        Добавление порции значений.
+        """
+        values = numeric_values(values)
+        if values is None or len(values) == 0:
+            return
+        values = values.astype(np.float64)
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # При нечётном числе одно значение остаётся на уровне
+                keep = items[len(items) - len(items) % 2:]
+                items = items[:len(items) - len(items) % 2]
+                promoted = items[int(self._random.integers(2))::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other):
+        """
+        Объединение со скетчем по другой части потока.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    @property
+    def size(self):
+        """
+        Число хранимых значений.
+        """
+        return sum(len(items) for items in self.levels)
+
+    def quantiles(self, probabilities):
+        """
+        Приближённые квантили для долей probabilities.
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        if self.count == 0:
+            return np.full(len(probabilities), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level_items), 2.0 ** level)
+                                  for level, level_items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, probabilities * cumulative[-1], side='left')
+        return items[np.minimum(index, len(items) - 1)]
+
+    def quantile(self, probability):
+        return float(self.quantiles([probability])[0])
+
+
+def hash_values(values):
+    """
+    64-битные хэши значений, одинаковые в любом процессе.
+
+    Числа хэшируются по двоичному представлению (SplitMix64),
+    строки и байты - BLAKE2b.
+    """
+    values = values if isinstance(values, np.ndarray) else np.asarray(values)
+    if values.dtype.kind in 'iub':
+        bits = values.astype(np.int64).view(np.uint64)
+    elif values.dtype.kind == 'f':
+        # + 0.0 превращает -0.0 в 0.0
+        bits = (values.astype(np.float64) + 0.0).view(np.uint64)
+    else:
+        digests = b''.join(hashlib.blake2b(value if isinstance(value, bytes) else str(value).encode('utf-8'),
+                                           digest_size=8).digest() for value in values.tolist())
+        return np.frombuffer(digests, dtype=np.uint64)
+    return mix64(bits + _GOLDEN_GAMMA)
+
+
+def _sigma(x):
+    if x == 1.0:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _tau(x):
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1.0 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """
+    Приближённое число различных значений (HyperLogLog).
+
+    Оценка по гистограмме регистров (метод Эртля) не требует таблиц
+    поправок и одинаково точна на малых и больших количествах.
+    """
+    def __init__(self, precision=DEFAULT_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError("Точность HyperLogLog должна быть от 4 до 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """
+        Добавление порции значений (числа, строки или байты).
+        """
+        if len(values) == 0:
+            return
+        width = 64 - self.precision
+        for start in range(0, len(values), BLOCK_SIZE):
+            hashes = hash_values(values[start:start + BLOCK_SIZE])
+            index = (hashes >> np.uint64(width)).astype(np.intp)
+            rest = (hashes << np.uint64(self.precision)).astype(np.float64)
+            # Номер старшего единичного бита оставшихся width бит: 1 + число ведущих нулей
+            exponent = np.frexp(rest)[1]
+            rank = np.clip(65 - exponent, 1, width + 1).astype(np.uint8)
+            np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """
+        Объединение с оценкой по другой части потока (той же точности).
+        """
+        if other.precision != self.precision:
+            raise ValueError("Объединять можно только HyperLogLog одинаковой точности")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    @property
+    def relative_error(self):
+        """
+        Стандартная относительная ошибка оценки.
+        """
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self):
+        """
+        Оценка числа различных значений.
+        """
+        m = len(self.registers)
+        width = 64 - self.precision
+        histogram = np.bincount(self.registers, minlength=width + 2)
+        z = m * _tau(1 - histogram[width + 1] / m)
+        for k in range(width, 0, -1):
+            z = 0.5 * (z + histogram[k])
+        z += m * _sigma(histogram[0] / m)
+        return m * m / (2 * math.log(2) * z)
+
+
+class StreamStats:
+    """
+    Все накопители вместе: моменты, квантили, число различных значений.
+
+    Подходит как on_chunk для задания rng.jobs. Для нечисловых значений
+    (паролей) считаются количество и число различных.
+    """
+    def __init__(self, k=DEFAULT_K, precision=DEFAULT_PRECISION, seed=None):
+        self.count = 0
+        self.moments = Moments()
+        self.sketch = QuantileSketch(k, seed)
+        self.distinct = HyperLogLog(precision)
+
+    def update(self, values):
+        """
+        Добавление порции значений.
+        """
+        self.count += len(values)
+        self.moments.update(values)
+        self.sketch.update(values)
+        self.distinct.update(values)
+
+    def merge(self, other):
+        """
+        Объединение со статистикой по другой части потока.
+        """
+        self.count += other.count
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+        return self
+
+    def duplicates(self):
+        """
+        Оценка числа повторов: (количество - число различных, погрешность).
+
+        Для generate_unique_numbers оценка должна быть в пределах погрешности от нуля.
+        """
+        distinct = min(self.distinct.estimate(), self.count)
+        return max(0, round(self.count - distinct)), round(distinct * self.distinct.relative_error)
+
+    def to_dict(self, quantiles=DEFAULT_QUANTILES):
+        """
+        Результаты в виде словаря (для JSON).
+        """
+        duplicates, error = self.duplicates()
+        result = {'count': self.count, 'distinct': round(min(self.distinct.estimate(), self.count)),
+                  'duplicates': duplicates, 'duplicates_error': error}
+        if self.moments.count:
+            result.update(mean=self.moments.mean, variance=self.moments.variance, std=self.moments.std,
+                          min=self.moments.minimum, max=self.moments.maximum,
+                          quantiles={str(q): float(v) for q, v in zip(quantiles, self.sketch.quantiles(quantiles))})
+        return result
+
+    def format(self, quantiles=DEFAULT_QUANTILES):
+        """
+        Текст статистики.
+        """
+        result = self.to_dict(quantiles)
+        lines = [f"Количество: {result['count']}   Различных: ~{result['distinct']}   "
+                 f"Повторов: ~{result['duplicates']} (±{result['duplicates_error']})"]
+        if 'mean' in result:
+            lines.append(f"Среднее: {result['mean']:.6g}   Отклонение: {result['std']:.6g}   "
+                         f"Мин: {result['min']}   Макс: {result['max']}")
+            lines.append("Квантили: " + '   '.join(f"{float(q):g}: {value:.6g}"
+                                                   for q, value in result['quantiles'].items()))
+        return '\n'.join(lines)
+
+
+def observe(chunks, stats):
+    """
+    Пропуск порций потока без изменений с обновлением статистики.
+    """
+    for chunk in chunks:
+        stats.update(chunk)
+        yield chunk
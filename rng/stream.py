@@ -0,0 +1,131 @@
+"""
+Потоковая генерация случайных чисел порциями фиксированного размера.
+
+Память ограничена одной порцией независимо от общего количества чисел,
+поэтому поток можно писать в файл или сокет без построения списка:
+
+    stream = stream_random(1, 100, total=10**9)
+    with open('numbers.bin', 'wb') as file:
+        stream.write_to(file)
+"""
+import numpy as np
+
+from rng.crypto import get_crypto
+from rng.distributions import get_distribution
+from rng.engine import FLOAT_DECIMALS, check_range, fill_random, resolve_dtype
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class ChunkStream:
+    """
+    Поток порций случайных чисел.
+
+    Итерация возвращает массивы NumPy длиной не более chunk_size. По умолчанию
+    все порции пишутся в один и тот же буфер, поэтому порцию нужно обработать
+    (или скопировать) до запроса следующей. Метод readinto позволяет заполнять
+    любой объект с буферным протоколом (bytearray, memoryview, mmap).
+    """
+    def __init__(self, fill, dtype, chunk_size=DEFAULT_CHUNK_SIZE, total=None, reuse_buffer=True):
+        if chunk_size < 1:
+            raise ValueError("Размер порции должен быть положительным")
+        if total is not None and total < 0:
+            raise ValueError("Количество чисел не может быть отрицательным")
+        self._fill = fill
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.total = total
+        self.reuse_buffer = reuse_buffer
+        self.produced = 0
+
+    @property
+    def remaining(self):
+        """
+        Сколько чисел осталось выдать (None для бесконечного потока).
+        """
+        return None if self.total is None else self.total - self.produced
+
+    def _next_size(self, limit):
+        if self.total is None:
+            return limit
+        return min(limit, self.total - self.produced)
+
+    def __iter__(self):
+        buffer = np.empty(self.chunk_size, dtype=self.dtype) if self.reuse_buffer else None
+        while True:
+            size = self._next_size(self.chunk_size)
+            if size <= 0:
+                return
+            chunk = buffer[:size] if buffer is not None else np.empty(size, dtype=self.dtype)
+            self._fill(chunk)
+            self.produced += size
+            yield chunk
+
+    def readinto(self, b):
+        """
+        Заполнение буфера b целым числом значений; возвращает число записанных байт.
+        """
+        view = memoryview(b).cast('B')
+        count = self._next_size(len(view) // self.dtype.itemsize)
+        if count <= 0:
+            if self.remaining == 0:
+                return 0
+            raise ValueError("Буфер меньше одного значения")
+        out = np.frombuffer(view, dtype=self.dtype, count=count)
+        self._fill(out)
+        self.produced += count
+        return count * self.dtype.itemsize
+
+    def write_to(self, file):
+        """
+        Запись потока в двоичный файл или сокет-файл; возвращает число записанных значений.
+        """
+        written = 0
+        for chunk in self:
+            file.write(memoryview(chunk).cast('B'))
+            written += len(chunk)
+        return written
+
+
+def stream_random(min_val, max_val, num_type='int', chunk_size=DEFAULT_CHUNK_SIZE, total=None,
+                  dtype=None, decimals=FLOAT_DECIMALS, generator=None, reuse_buffer=True):
+    """
+    Поток случайных чисел из [min_val, max_val] (аналог generate_random_sequence).
+    """
+    dtype = resolve_dtype(num_type, dtype)
+    check_range(min_val, max_val, num_type)
+
+    def fill(out):
+        fill_random(out, min_val, max_val, num_type, decimals, generator)
+
+    return ChunkStream(fill, dtype, chunk_size, total, reuse_buffer)
+
+
+def stream_advanced(distribution, chunk_size=DEFAULT_CHUNK_SIZE, total=None, reuse_buffer=True,
+                    generator=None, **params):
+    """
+    Поток чисел по распределению (аналог generate_advanced_numbers).
+    """
+    distribution = get_distribution(distribution)
+    params = distribution.resolve_params(params)
+
+    def fill(out):
+        out[...] = distribution.sample(len(out), generator, **params)
+
+    return ChunkStream(fill, distribution.dtype, chunk_size, total, reuse_buffer)
+
+
+def stream_crypto(min_val, max_val, chunk_size=DEFAULT_CHUNK_SIZE, total=None, reuse_buffer=True,
+                  source=None):
+    """
+    Поток криптографически стойких чисел (аналог generate_crypto_secure_numbers).
+
+    source - 'os' или 'chacha20'; по умолчанию общий генератор на случайности ОС.
+    """
+    check_range(min_val, max_val, 'int')
+    crypto = get_crypto(source)
+
+    def fill(out):
+        crypto.fill_integers(out, min_val, max_val)
+
+    return ChunkStream(fill, np.int64, chunk_size, total, reuse_buffer)
@@ -0,0 +1,57 @@
+"""
+Сводка по результату генерации: количество, минимум, максимум, среднее.
+
+Сводка накапливается порциями (например, через on_chunk задания rng.jobs),
+поэтому для всего результата хватает одного прохода по памяти:
+
+    summary = Summary()
+    numbers = job.run(on_chunk=summary.update)
+    print(summary.format())
+
+Числа считает накопитель rng.stats.Moments, поэтому сводке доступны и
+дисперсия с отклонением.
+"""
+from rng.stats import Moments, numeric_values
+
+
+class Summary(Moments):
+    """
+    Накопитель count/min/max/mean.
+
+    Для нечисловых значений (например, паролей) считается только количество.
+    """
+    @classmethod
+    def from_values(cls, values):
+        """
+        Сводка по готовому массиву или списку.
+        """
+        summary = cls()
+        summary.update(values)
+        return summary
+
+    def update(self, values):
+        """
+        Добавление порции значений.
+        """
+        if numeric_values(values) is None:
+            self.count += len(values)
+            return
+        super().update(values)
+
+    def merge(self, other):
+        """
+        Объединение со сводкой по другой части результата.
+        """
+        if other.minimum is None:
+            self.count += other.count
+            return self
+        return super().merge(other)
+
+    def format(self):
+        """
+        Текст сводки для заголовка результата.
+        """
+        if self.minimum is None:
+            return f"Количество: {self.count}"
+        return (f"Количество: {self.count}   Мин: {self.minimum}   "
+                f"Макс: {self.maximum}   Среднее: {self.mean:.6g}")
@@ -0,0 +1,98 @@
+"""
+Текстовый вывод порций чисел: по одному значению в строке.
+
+Целые и вещественные числа на десятичной сетке (rng.engine) печатаются
+целиком для массива: цифры получаются делением на 10 сразу для всех
+значений, пишутся в матрицу байтов фиксированной ширины, а ведущие нули
+вырезаются маской - без str() и round() для каждого значения:
+
+    out.write(format_lines(chunk, decimals=2))   # 12.30, -0.05, ...
+
+Остальные значения (вещественные без округления, строки) печатаются через str.
+Для JSON (история, метаданные экспорта, сервер) значения NumPy
+преобразует json_default.
+"""
+import numpy as np
+
+from rng.engine import FLOAT_DECIMALS, INT64_MAX, MAX_DECIMALS
+
+# Целые по модулю не больше 2**53 представимы во float64 точно
+_EXACT_LIMIT = float(1 << 53)
+
+
+def format_fixed(steps, decimals=0):
+    """
+    Строки k / 10**decimals для целых k (массив int64) с ровно decimals знаками после запятой.
+    """
+    steps = np.asarray(steps, dtype=np.int64)
+    count = len(steps)
+    if count == 0:
+        return b''
+    negative = steps < 0
+    # Модуль в uint64: -2**63 тоже помещается
+    magnitude = steps.view(np.uint64).copy()
+    np.negative(magnitude, out=magnitude, where=negative)
+    largest = int(magnitude.max())
+    digits = max(decimals + 1, len(str(largest)))
+    whole = digits - decimals
+    width = digits + (3 if decimals else 2)
+    lines = np.empty((count, width), dtype=np.uint8)
+    lines[:, 0] = ord('-')
+    lines[:, -1] = ord('\n')
+    if decimals:
+        lines[:, whole + 1] = ord('.')
+    columns = list(range(1, whole + 1)) + list(range(whole + 2, width - 1))
+    rest = magnitude
+    for column in reversed(columns):
+        # Деление 32-битных чисел заметно быстрее 64-битных
+        if rest.dtype == np.uint64 and largest < 1 << 32:
+            rest = rest.astype(np.uint32)
+        rest, digit = np.divmod(rest, rest.dtype.type(10))
+        lines[:, column] = digit + ord('0')
+        largest //= 10
+    keep = np.ones((count, width), dtype=bool)
+    keep[:, 0] = negative
+    if whole > 1:
+        # Ведущие нули целой части, кроме последней цифры
+        zeros = lines[:, 1:whole] == ord('0')
+        keep[:, 1:whole] = ~np.logical_and.accumulate(zeros, axis=1)
+    return lines[keep].tobytes()
+
+
+def format_lines(values, decimals=None):
+    """
+    Текст порции (байты UTF-8), по одному значению в строке.
+
+    decimals - число знаков после запятой у вещественных чисел (None - как str).
+    """
+    values = values if isinstance(values, np.ndarray) else np.asarray(values)
+    if len(values) == 0:
+        return b''
+    if values.dtype.kind == 'i' or (values.dtype.kind == 'u' and int(values.max()) <= INT64_MAX):
+        return format_fixed(values.astype(np.int64, copy=False))
+    if values.dtype.kind == 'f' and decimals is not None and 0 <= decimals <= MAX_DECIMALS:
+        scaled = values.astype(np.float64) * 10.0 ** decimals
+        # NaN и значения за пределами точной сетки печатаются как есть
+        if np.all(np.abs(scaled) <= _EXACT_LIMIT):
+            return format_fixed(np.rint(scaled).astype(np.int64), decimals)
+    return ('\n'.join(map(str, values.tolist())) + '\n').encode('utf-8')
+
+
+def text_decimals(params):
+    """
+    Знаков после запятой при выводе результата по параметрам rng.jobs.create_job.
+    """
+    if params.get('mode') == 'random' and params.get('num_type') == 'float':
+        return params.get('decimals', FLOAT_DECIMALS)
+    return None
+
+
+def json_default(value):
+    """
+    Преобразование значений NumPy для json.dumps.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Значение типа {type(value).__name__} нельзя записать в JSON")
@@ -0,0 +1,184 @@
+"""
+Выборка уникальных случайных чисел из целочисленного диапазона.
+
+Алгоритм выбирается по отношению количества чисел к размеру диапазона:
+
+* floyd - алгоритм Флойда, ровно count обращений к генератору; для небольших выборок;
+* rejection - векторизованная выборка с отбраковкой повторов; для разреженных выборок;
+* fisher_yates - частичное тасование Фишера-Йетса над массивом индексов;
+  для плотных выборок из диапазона, который помещается в память;
+* permutation - сохраняющая формат перестановка (сеть Фейстеля с обходом циклов);
+  для плотных выборок из огромного диапазона, без массива индексов.
+
+Диапазон может занимать до 2**64 значений, результат - массив int64
+(uint64, если max_val не помещается в int64) в случайном порядке.
+"""
+import numpy as np
+
+from rng.backends import mix64
+from rng.engine import INT64_MAX, INT64_MIN, get_generator
+
+# Выборки не больше этого размера строятся алгоритмом Флойда
+FLOYD_MAX_COUNT = 1024
+
+# Выше этой плотности отбраковка повторов становится невыгодной
+DENSE_DENSITY = 0.5
+
+# Ниже этой плотности массив индексов тратит память впустую
+SPARSE_DENSITY = 0.05
+
+# Наибольший диапазон, для которого допустим массив индексов
+ARRAY_LIMIT = 1 << 26
+
+# Количество раундов сети Фейстеля
+FEISTEL_ROUNDS = 6
+
+METHODS = ('floyd', 'rejection', 'fisher_yates', 'permutation')
+
+_UINT64_SPAN = 1 << 64
+
+
+def choose_method(count, span):
+    """
+    Выбор алгоритма по количеству чисел и размеру диапазона.
+    """
+    density = count / span
+    if density > DENSE_DENSITY:
+        return 'fisher_yates' if span <= ARRAY_LIMIT else 'permutation'
+    if count <= FLOYD_MAX_COUNT:
+        return 'floyd'
+    if span <= ARRAY_LIMIT and density > SPARSE_DENSITY:
+        return 'fisher_yates'
+    return 'rejection'
+
+
+def _draw_offsets(generator, span, size):
+    """
+    Равномерные смещения из [0, span) в виде uint64.
+    """
+    return generator.integers(0, span - 1, size=size, dtype=np.uint64, endpoint=True)
+
+
+def _floyd(generator, count, span):
+    # Для j из [span - count, span) берётся t из [0, j]; если t уже выбран, берётся j
+    highs = np.arange(span - count, span, dtype=np.uint64)
+    draws = generator.integers(0, highs, dtype=np.uint64, endpoint=True)
+    chosen = set()
+    for t, j in zip(draws.tolist(), highs.tolist()):
+        chosen.add(j if t in chosen else t)
+    # Порядок элементов множества не случаен, поэтому результат перемешивается
+    offsets = np.fromiter(chosen, dtype=np.uint64, count=count)
+    generator.shuffle(offsets)
+    return offsets
+
+
+def _rejection(generator, count, span):
+    density = count / span
+    offsets = np.empty(0, dtype=np.uint64)
+    while len(offsets) < count:
+        need = count - len(offsets)
+        # С запасом на ожидаемую долю повторов
+        batch = _draw_offsets(generator, span, int(need / max(1.0 - density, 0.125)) + 16)
+        combined = np.concatenate([offsets, batch])
+        _, first = np.unique(combined, return_index=True)
+        # Первые вхождения в порядке выпадения - как при поштучной отбраковке
+        first.sort()
+        offsets = combined[first]
+    return offsets[:count]
+
+
+def _fisher_yates(generator, count, span):
+    # Generator.choice без возвращения делает частичное тасование над arange(span)
+    return generator.choice(span, size=count, replace=False).astype(np.uint64)
+
+
+class FeistelPermutation:
+    """
+    Псевдослучайная биекция диапазона [0, span) на себя.
+
+    Сбалансированная сеть Фейстеля переставляет [0, 4**half), где 4**half - наименьшая
+    чётная степень двойки не меньше span, а обход циклов возвращает значения
+    в исходный диапазон. Перестановка определяется ключами раундов и вычисляется
+    для любого индекса независимо, без хранения таблицы.
+    """
+    def __init__(self, span, keys):
+        if not 1 <= span <= _UINT64_SPAN:
+            raise ValueError("Размер диапазона должен быть от 1 до 2**64")
+        half = max(1, ((span - 1).bit_length() + 1) // 2)
+        self.span = span
+        self.keys = np.asarray(keys, dtype=np.uint64)
+        self._half = np.uint64(half)
+        self._mask = np.uint64((1 << half) - 1)
+
+    @classmethod
+    def random(cls, span, generator=None, rounds=FEISTEL_ROUNDS):
+        """
+        Перестановка со случайными ключами раундов.
+        """
+        generator = get_generator(generator)
+        keys = generator.integers(0, _UINT64_SPAN - 1, size=rounds, dtype=np.uint64, endpoint=True)
+        return cls(span, keys)
+
+    def _rounds(self, x):
+        left = x >> self._half
+        right = x & self._mask
+        for key in self.keys:
+            left, right = right, left ^ (mix64(right ^ key) & self._mask)
+        return (left << self._half) | right
+
+    def __call__(self, indices):
+        """
+        Образы индексов из [0, span).
+        """
+        values = self._rounds(np.asarray(indices, dtype=np.uint64))
+        if self.span == _UINT64_SPAN:
+            return values
+        # Значения за пределами диапазона продвигаются по циклу перестановки
+        limit = np.uint64(self.span)
+        outside = np.flatnonzero(values >= limit)
+        while len(outside):
+            walked = self._rounds(values[outside])
+            values[outside] = walked
+            outside = outside[walked >= limit]
+        return values
+
+
+def _permutation(generator, count, span):
+    return FeistelPermutation.random(span, generator)(np.arange(count, dtype=np.uint64))
+
+
+_ALGORITHMS = {
+    'floyd': _floyd,
+    'rejection': _rejection,
+    'fisher_yates': _fisher_yates,
+    'permutation': _permutation,
+}
+
+
+def sample_unique(min_val, max_val, count, method=None, generator=None):
+    """
+    Выборка count различных чисел из [min_val, max_val] в случайном порядке.
+
+    Если method не указан, алгоритм выбирается функцией choose_method.
+    """
+    if min_val > max_val:
+        raise ValueError("Минимальное значение не может быть больше максимального!")
+    span = max_val - min_val + 1
+    if span > _UINT64_SPAN or min_val < INT64_MIN or max_val >= _UINT64_SPAN:
+        raise ValueError("Диапазон выходит за пределы 64-битного целого")
+    if min_val < 0 and max_val > INT64_MAX:
+        # Результат не помещается ни в int64, ни в uint64
+        raise ValueError("Диапазон с отрицательными числами должен помещаться в int64")
+    if count < 0 or count > span:
+        raise ValueError("Невозможно сгенерировать уникальные числа с заданными параметрами")
+    if method is None:
+        method = 'floyd' if count == 0 else choose_method(count, span)
+    if method not in _ALGORITHMS:
+        raise ValueError(f"Неизвестный алгоритм выборки: {method}")
+    if method == 'fisher_yates' and span > ARRAY_LIMIT:
+        raise ValueError("Диапазон слишком велик для массива индексов")
+
+    offsets = _ALGORITHMS[method](get_generator(generator), count, span)
+    # Сложение по модулю 2**64 с последующей интерпретацией как int64 даёт точный результат
+    offsets += np.uint64(min_val % _UINT64_SPAN)
+    return offsets if max_val > INT64_MAX else offsets.view(np.int64)
@@ -0,0 +1,142 @@
+"""
+Взвешенная выборка по таблице псевдонимов (алгоритм Уолкера в варианте Воза).
+
+Таблица строится один раз за O(n), после чего каждое значение выбирается
+за O(1): случайная ячейка и одно сравнение с её вероятностью. Выборка
+сразу большого количества значений выполняется векторно.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from rng.engine import get_generator
+
+
+def _parse_value(text):
+    """
+    Преобразование текста в целое, вещественное число или оставление строкой.
+    """
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_weight_table(values_text, weights_text=''):
+    """
+    Разбор значений и весов, перечисленных через запятую или пробел.
+
+    Пустая строка весов означает равные веса.
+    """
+    values = [_parse_value(item) for item in values_text.replace(',', ' ').split()]
+    weights = [float(item) for item in weights_text.replace(',', ' ').split()]
+    if not values:
+        raise ValueError("Не указаны значения")
+    return values, (weights or None)
+
+
+def load_weight_table(path):
+    """
+    Загрузка таблицы из файла: по строке "значение вес" (или "значение,вес") на элемент.
+    """
+    values = []
+    weights = []
+    with open(path, encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.replace(',', ' ').split()
+            if len(parts) != 2:
+                raise ValueError(f"Строка {line_number}: ожидается значение и вес")
+            values.append(_parse_value(parts[0]))
+            weights.append(float(parts[1]))
+    if not values:
+        raise ValueError("Таблица весов пуста")
+    return values, weights
+
+
+class WeightedSampler:
+    """
+    Многократно используемая взвешенная выборка значений.
+
+    sampler = WeightedSampler([1, 2, 3], [0.5, 0.3, 0.2])
+    sampler.sample()        # одно значение
+    sampler.sample(10**6)   # массив из миллиона значений
+    """
+    def __init__(self, values, weights=None):
+        self.values = np.asarray(values)
+        n = len(self.values)
+        if n == 0:
+            raise ValueError("Не указаны значения")
+        if weights is None:
+            weights = np.ones(n)
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != (n,):
+            raise ValueError("Количество весов должно совпадать с количеством значений")
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("Веса должны быть неотрицательными конечными числами")
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError("Сумма весов должна быть положительной")
+        self.probabilities = weights / total
+        self._prob, self._alias = self._build_alias_table(self.probabilities * n)
+
+    @staticmethod
+    def _build_alias_table(scaled):
+        """
+        Построение таблицы псевдонимов по весам, нормированным к среднему 1.
+        """
+        n = len(scaled)
+        prob = np.ones(n)
+        alias = np.arange(n)
+        scaled = scaled.tolist()
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            # Ячейка less дополняется избытком more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Остатки из-за погрешности округления считаются полными ячейками
+        return prob, alias
+
+    def __len__(self):
+        return len(self.values)
+
+    def sample_indices(self, count, generator=None):
+        """
+        Индексы выбранных значений (массив длины count).
+        """
+        generator = get_generator(generator)
+        cells = generator.integers(0, len(self.values), size=count)
+        keep = generator.random(count) < self._prob[cells]
+        return np.where(keep, cells, self._alias[cells])
+
+    def sample(self, count=None, generator=None):
+        """
+        Одно значение (count=None) или массив из count значений.
+        """
+        if count is None:
+            return self.values[self.sample_indices(1, generator)[0]].item()
+        if count < 0:
+            raise ValueError("Количество чисел не может быть отрицательным")
+        return self.values[self.sample_indices(count, generator)]
+
+
+@lru_cache(maxsize=32)
+def _cached_sampler(values, weights):
+    return WeightedSampler(values, weights)
+
+
+def get_sampler(values, weights=None):
+    """
+    Выборка для таблицы значений с кэшированием: повторные вызовы
+    с той же таблицей не перестраивают таблицу псевдонимов.
+    """
+    return _cached_sampler(tuple(values), None if weights is None else tuple(weights))
@@ -0,0 +1,237 @@
+"""
+Целые числа из диапазонов шире 64 бит (идентификаторы, ключи, nonce).
+
+Числа до 128 бит строятся без длинной арифметики Python: смещение от
+min_val собирается из 64-битных слов (младшее слово первым), лишние
+старшие биты обнуляются маской, а смещения больше размера диапазона
+отбрасываются сравнением слов - всё сразу для всего массива. Шире 128 бит
+каждое значение собирается как целое Python:
+
+    ids = wide_integers(0, 2**128 - 1, 1000, output='hex')
+    keys = wide_integers(1, 2**255 - 19, 10, source='os')
+
+Результат выдаётся целыми числами Python (output='int'), шестнадцатеричными
+строками фиксированной длины ('hex') или массивом байтов ('bytes', по
+строке на число). В форматах hex и bytes числа записываются старшим байтом
+вперёд, отрицательные - в дополнительном коде; ширина одна на весь
+диапазон (byte_width).
+"""
+import re
+
+import numpy as np
+
+from rng.crypto import get_crypto
+from rng.engine import get_generator
+
+# Наибольшая ширина чисел, которые собираются из слов numpy
+FAST_BITS = 128
+OUTPUTS = ('int', 'hex', 'bytes')
+
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+# Степень с необязательным сдвигом: 2**128, 2^64 - 1, -2**63
+_POWER = re.compile(r'^(-?)(\d+)(?:\*\*|\^)(\d+)([+-]\d+)?$')
+_PREFIXED = re.compile(r'^[+-]?0[xob]', re.IGNORECASE)
+
+
+def parse_integer(text):
+    """
+    Целое из строки: десятичное, 0x..., 0o..., 0b... или степень вида 2**128 - 1.
+    """
+    compact = str(text).replace(' ', '').replace('_', '')
+    match = _POWER.match(compact)
+    try:
+        if match:
+            sign, base, exponent, shift = match.groups()
+            if int(exponent) > 65536:
+                raise ValueError
+            value = -int(base) ** int(exponent) if sign else int(base) ** int(exponent)
+            return value + int(shift or 0)
+        return int(compact, 0) if _PREFIXED.match(compact) else int(compact)
+    except ValueError:
+        raise ValueError(f"Не удалось прочитать целое число: {text}") from None
+
+
+def byte_width(min_val, max_val):
+    """
+    Число байтов на значение из [min_val, max_val].
+
+    Для неотрицательных диапазонов - беззнаковая запись, иначе - дополнительный код.
+    """
+    if min_val >= 0:
+        bits = max_val.bit_length()
+    else:
+        bits = max(max_val.bit_length(), (-min_val - 1).bit_length()) + 1
+    return max(1, -(-bits // 8))
+
+
+def check_wide(min_val, max_val, count, output='int'):
+    """
+    Проверка границ, количества и формата чисел.
+    """
+    if not isinstance(min_val, int) or not isinstance(max_val, int):
+        raise ValueError("Границы диапазона должны быть целыми")
+    if min_val > max_val:
+        raise ValueError("Минимальное значение не может быть больше максимального!")
+    if count < 0:
+        raise ValueError("Количество чисел не может быть отрицательным")
+    if output not in OUTPUTS:
+        raise ValueError(f"Неизвестный формат чисел: {output}")
+
+
+def _words(count, generator=None, source=None):
+    """
+    count случайных слов uint64 из генератора или криптостойкого источника.
+    """
+    if source is not None:
+        return np.frombuffer(get_crypto(source).random_bytes(8 * count), dtype=np.uint64).copy()
+    return get_generator(generator).bit_generator.random_raw(count)
+
+
+def _split(value, limbs):
+    """
+    Неотрицательное целое как список из limbs слов, младшее первым.
+    """
+    return [(value >> (_WORD_BITS * i)) & _WORD_MASK for i in range(limbs)]
+
+
+def random_limbs(span, count, limbs=None, generator=None, source=None):
+    """
+    Массив (count, limbs) слов uint64 с равномерными числами из [0, span).
+
+    span - до 2**128; limbs - число слов в строке (по умолчанию минимально нужное).
+    """
+    if not 1 <= span <= 1 << FAST_BITS:
+        raise ValueError(f"Размер диапазона должен быть от 1 до 2**{FAST_BITS}")
+    bits = (span - 1).bit_length()
+    used = max(1, -(-bits // _WORD_BITS))
+    limbs = used if limbs is None else limbs
+    out = np.zeros((count, limbs), dtype=np.uint64)
+    if span == 1:
+        return out
+    top_mask = np.uint64((1 << (bits - _WORD_BITS * (used - 1))) - 1)
+    # Степень двойки: после маски подходит любое слово
+    exact = span == 1 << bits
+    limit = _split(span - 1, used)
+    accept_rate = span / (1 << bits)
+    filled = 0
+    while filled < count:
+        need = count - filled
+        # С запасом на долю отбракованных значений (не меньше половины подходит)
+        draw = need if exact else int(need / accept_rate) + 16
+        words = _words(draw * used, generator, source).reshape(draw, used)
+        words[:, -1] &= top_mask
+        if not exact:
+            # Сравнение с span - 1 по словам, начиная со старшего
+            below = np.zeros(draw, dtype=bool)
+            equal = np.ones(draw, dtype=bool)
+            for i in range(used - 1, -1, -1):
+                word, bound = words[:, i], np.uint64(limit[i])
+                below |= equal & (word < bound)
+                equal &= word == bound
+            words = words[below | equal]
+        size = min(len(words), need)
+        out[filled:filled + size, :used] = words[:size]
+        filled += size
+    return out
+
+
+def _add(limbs, value):
+    """
+    Прибавление value по модулю 2**(64 * число слов) на месте, с переносом между словами.
+    """
+    carry = np.zeros(len(limbs), dtype=bool)
+    for i, word in enumerate(_split(value % (1 << (_WORD_BITS * limbs.shape[1])), limbs.shape[1])):
+        column = limbs[:, i]
+        total = column + np.uint64(word)
+        overflow = total < column
+        total += carry
+        overflow |= carry & (total == 0)
+        limbs[:, i] = total
+        carry = overflow
+    return limbs
+
+
+def _packed(limbs, width):
+    """
+    Массив (count, width) байтов: строки слов старшим байтом вперёд, лишние старшие байты отброшены.
+    """
+    data = np.ascontiguousarray(limbs[:, ::-1], dtype='>u8').view(np.uint8)
+    return data[:, data.shape[1] - width:]
+
+
+def _to_int(limbs, signed):
+    if limbs.shape[1] == 1:
+        return limbs[:, 0].view(np.int64 if signed else np.uint64).tolist()
+    high = limbs[:, 1].view(np.int64) if signed else limbs[:, 1]
+    return (high.astype(object) * (1 << _WORD_BITS) + limbs[:, 0].astype(object)).tolist()
+
+
+def _to_hex(rows):
+    if len(rows) == 0:
+        return []
+    # Одна строка на весь массив, разрезанная numpy на строки фиксированной длины
+    return np.array([rows.tobytes().hex()]).view(f'U{rows.shape[1] * 2}').tolist()
+
+
+def _bignum_integers(min_val, max_val, count, generator=None, source=None):
+    """
+    Числа шире 128 бит: отбраковка по одному значению в целых Python.
+    """
+    span = max_val - min_val + 1
+    bits = (span - 1).bit_length()
+    limbs = -(-bits // _WORD_BITS)
+    mask = (1 << bits) - 1
+    result = []
+    while len(result) < count:
+        need = count - len(result)
+        draw = int(need * (1 << bits) / span) + 16
+        data = _words(draw * limbs, generator, source).astype('<u8').tobytes()
+        step = limbs * 8
+        for start in range(0, len(data), step):
+            offset = int.from_bytes(data[start:start + step], 'little') & mask
+            if offset < span:
+                result.append(min_val + offset)
+                if len(result) == count:
+                    break
+    return result
+
+
+def wide_integers(min_val, max_val, count, output='int', generator=None, source=None):
+    """
+    count равномерных целых из [min_val, max_val] любой ширины.
+
+    generator - генератор numpy или rng.backends; source - источник криптостойких
+    чисел (rng.crypto.SOURCES), если он задан, генератор не используется.
+    """
+    check_wide(min_val, max_val, count, output)
+    width = byte_width(min_val, max_val)
+    signed = min_val < 0
+    span = max_val - min_val + 1
+    if width * 8 > FAST_BITS:
+        values = _bignum_integers(min_val, max_val, count, generator, source)
+        if output == 'int':
+            return values
+        data = b''.join(value.to_bytes(width, 'big', signed=signed) for value in values)
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(count, width)
+        return rows if output == 'bytes' else _to_hex(rows)
+
+    limbs = random_limbs(span, count, -(-width // 8), generator, source)
+    _add(limbs, min_val)
+    if output == 'int':
+        return _to_int(limbs, signed)
+    rows = _packed(limbs, width)
+    return np.ascontiguousarray(rows) if output == 'bytes' else _to_hex(rows)
+
+
+def from_hex(values, signed=False):
+    """
+    Целые числа из строк формата hex (обратное преобразование).
+    """
+    result = []
+    for text in values:
+        value = int(text, 16)
+        if signed and value >> (len(text) * 4 - 1):
+            value -= 1 << (len(text) * 4)
+        result.append(value)
+    return result
@@ -0,0 +1,3 @@
+"""
+Общие компоненты графического интерфейса (PyQt5) поверх ядра rng.
+"""
@@ -0,0 +1,24 @@
+"""
+Запуск интерфейса выбранного уровня:
+
+    python -m rng_gui --tier mini [--no-splash]
+"""
+import argparse
+import sys
+
+from rng_gui.splash import run_app
+from rng_gui.tiers import TIERS
+from rng_gui.window import GeneratorWindow
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    parser = argparse.ArgumentParser(prog='python -m rng_gui', description=__doc__)
+    parser.add_argument('--tier', choices=list(TIERS), default='extended')
+    args, qt_args = parser.parse_known_args(argv[1:])
+    tier = TIERS[args.tier]
+    return run_app(lambda: GeneratorWindow(tier.name), argv[:1] + qt_args, splash=tier.splash)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Панель графиков результата: гистограмма, функция распределения, QQ-график.
+
+Графики строятся по потоковой гистограмме (rng.histogram), а не по самим
+значениям, поэтому рисуется не больше точек, чем интервалов, при любом
+размере выборки. Пока идёт генерация, панель перерисовывается не чаще
+одного раза в REDRAW_MS и только если гистограмма изменилась.
+"""
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt, QTimer
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from rng.histogram import qq_points, theoretical_quantiles
+
+# Наименьший интервал между перерисовками во время генерации, мс
+REDRAW_MS = 250
+PLOT_KINDS = ['Гистограмма', 'Функция распределения', 'QQ-график']
+BAR_COLOR = QColor('#3D8EE0')
+REFERENCE_COLOR = QColor('#E08A3D')
+# Поля вокруг области графика: слева, сверху, справа, снизу
+MARGINS = (75, 10, 15, 25)
+
+
+def _format(value):
+    return f"{value:.4g}"
+
+
+class PlotCanvas(QWidget):
+    """
+    Область рисования: столбцы, ступенчатые и обычные линии, точки.
+
+    Серия - кортеж (вид, xs, ys, цвет), вид - 'bars' (xs - границы
+    интервалов), 'steps', 'line' или 'points'.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = []
+        self.bounds = None
+        self.message = "Нет данных"
+        self.setMinimumHeight(150)
+
+    def set_series(self, series, bounds):
+        self.series = series
+        self.bounds = bounds
+        self.update()
+
+    def clear(self, message="Нет данных"):
+        self.series = []
+        self.bounds = None
+        self.message = message
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        foreground = self.palette().color(self.foregroundRole())
+        painter.setPen(foreground)
+        if not self.series:
+            painter.drawText(self.rect(), Qt.AlignCenter, self.message)
+            return
+
+        left, top, right, bottom = MARGINS
+        area = QRectF(left, top, max(1, self.width() - left - right), max(1, self.height() - top - bottom))
+        x0, x1, y0, y1 = self.bounds
+        x_scale = area.width() / ((x1 - x0) or 1.0)
+        y_scale = area.height() / ((y1 - y0) or 1.0)
+
+        def points(xs, ys):
+            xs = area.left() + (np.asarray(xs, dtype=np.float64) - x0) * x_scale
+            ys = area.bottom() - (np.asarray(ys, dtype=np.float64) - y0) * y_scale
+            return [QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+        painter.setClipRect(area)
+        for kind, xs, ys, color in self.series:
+            painter.setPen(QPen(color, 1.5))
+            if kind == 'bars':
+                painter.setBrush(color)
+                corners = points(xs, np.zeros(len(xs)))
+                tops = points(xs[:-1], ys)
+                for i, top_left in enumerate(tops):
+                    painter.drawRect(QRectF(top_left, corners[i + 1]))
+            elif kind == 'steps':
+                step_xs = np.repeat(xs, 2)[1:]
+                step_ys = np.repeat(ys, 2)[:-1]
+                painter.drawPolyline(QPolygonF(points(step_xs, step_ys)))
+            elif kind == 'line':
+                painter.drawPolyline(QPolygonF(points(xs, ys)))
+            else:
+                painter.setBrush(color)
+                for point in points(xs, ys):
+                    painter.drawEllipse(point, 2.0, 2.0)
+        painter.setClipping(False)
+
+        # Оси и подписи крайних значений
+        painter.setPen(foreground)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(area)
+        painter.drawText(QRectF(0, area.top() - 5, left - 5, 20), Qt.AlignRight, _format(y1))
+        painter.drawText(QRectF(0, area.bottom() - 15, left - 5, 20), Qt.AlignRight, _format(y0))
+        painter.drawText(QRectF(area.left(), area.bottom() + 3, 100, 20), Qt.AlignLeft, _format(x0))
+        painter.drawText(QRectF(area.right() - 100, area.bottom() + 3, 100, 20), Qt.AlignRight, _format(x1))
+
+
+class PlotView(QWidget):
+    """
+    Выбор вида графика и область рисования для одной гистограммы.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.histogram = None
+        self.reference = None
+        self._theoretical = None
+        self._reference_cdf = None
+        self._drawn = None
+
+        self.kind_select = QComboBox()
+        self.kind_select.addItems(PLOT_KINDS)
+        self.kind_select.currentIndexChanged.connect(lambda: self.refresh(force=True))
+        self.info = QLabel()
+        self.canvas = PlotCanvas()
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.kind_select)
+        controls.addWidget(self.info, 1)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(controls)
+        layout.addWidget(self.canvas, 1)
+
+        # Перерисовка по таймеру: частота не зависит от числа порций
+        self.timer = QTimer(self)
+        self.timer.setInterval(REDRAW_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def set_histogram(self, histogram, reference=None):
+        """
+        Новая гистограмма; reference - теоретическая функция распределения (или None).
+        """
+        self.histogram = histogram
+        self.reference = reference
+        self._theoretical = None
+        self._reference_cdf = None
+        self.refresh(force=True)
+
+    def clear(self):
+        self.timer.stop()
+        self.histogram = None
+        self.info.setText("")
+        self.canvas.clear()
+
+    def start_live(self):
+        """
+        Периодическая перерисовка, пока гистограмма пополняется.
+        """
+        self.timer.start()
+
+    def stop_live(self):
+        self.timer.stop()
+        self.refresh(force=True)
+
+    def refresh(self, force=False):
+        """
+        Перерисовка, если гистограмма изменилась с прошлого раза.
+        """
+        histogram = self.histogram
+        if histogram is None:
+            return
+        state = (histogram.version, self.kind_select.currentIndex())
+        if state == self._drawn and not force:
+            return
+        self._drawn = state
+        if histogram.count == 0:
+            self.info.setText("")
+            self.canvas.clear("Нет данных" if self.timer.isActive() else "Нет числовых данных")
+            return
+        self.info.setText(f"Значений: {histogram.count}   Интервалов: {histogram.bins}")
+        kind = PLOT_KINDS[self.kind_select.currentIndex()]
+        if kind == 'Гистограмма':
+            self._plot_histogram()
+        elif kind == 'Функция распределения':
+            self._plot_cdf()
+        else:
+            self._plot_qq()
+
+    def _plot_histogram(self):
+        edges, counts = self.histogram.trimmed()
+        self.canvas.set_series([('bars', edges, counts, BAR_COLOR)],
+                               (edges[0], edges[-1], 0, max(1, int(counts.max()))))
+
+    def _plot_cdf(self):
+        xs, ys = self.histogram.cdf()
+        start = xs[0] - (xs[1] - xs[0] if len(xs) > 1 else 1.0)
+        xs, ys = np.append(start, xs), np.append(0.0, ys)
+        series = [('steps', xs, ys, BAR_COLOR)]
+        if self.reference is not None:
+            # Теоретическая кривая пересчитывается только при смене границ
+            key = (xs[0], xs[-1], len(xs))
+            if self._reference_cdf is None or self._reference_cdf[0] != key:
+                self._reference_cdf = (key, np.asarray(self.reference(xs), dtype=np.float64))
+            series.append(('line', xs, self._reference_cdf[1], REFERENCE_COLOR))
+        self.canvas.set_series(series, (xs[0], xs[-1], 0.0, 1.0))
+
+    def _plot_qq(self):
+        if self._theoretical is None and self.reference is not None:
+            # Теоретические квантили не зависят от выборки - считаются один раз
+            self._theoretical = theoretical_quantiles(self.reference, self.histogram.minimum,
+                                                      self.histogram.maximum)
+        theoretical, sample = qq_points(self.histogram, self.reference, theoretical=self._theoretical)
+        low = float(min(theoretical.min(), sample.min()))
+        high = float(max(theoretical.max(), sample.max()))
+        self.canvas.set_series([('line', [low, high], [low, high], REFERENCE_COLOR),
+                                ('points', theoretical, sample, BAR_COLOR)], (low, high, low, high))
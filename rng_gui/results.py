@@ -0,0 +1,169 @@
+"""
+Виртуальная таблица результата генерации.
+
+Модель не хранит текст: значения берутся из исходного массива и форматируются
+только для строк, видимых на экране. Обычный QTableView держит геометрию
+каждой строки, поэтому модель отдаёт представлению лишь окно из видимых
+строк, а прокрутка по всему результату идёт отдельной полосой прокрутки.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt
+from PyQt5.QtWidgets import QHBoxLayout, QHeaderView, QLabel, QScrollBar, QTableView, QVBoxLayout, QWidget
+
+from rng.summary import Summary
+
+# Значений в одной строке таблицы
+VALUES_PER_ROW = 10
+ROW_HEIGHT = 24
+
+
+class ResultModel(QAbstractTableModel):
+    """
+    Окно из строк таблицы над массивом (или списком) значений.
+    """
+    def __init__(self, columns=VALUES_PER_ROW, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self._values = []
+        self._first_row = 0
+        self._window_rows = 0
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def total_rows(self):
+        return -(-len(self._values) // self.columns)
+
+    @property
+    def first_row(self):
+        return self._first_row
+
+    def set_values(self, values):
+        """
+        Новый результат; окно возвращается в начало.
+        """
+        self.beginResetModel()
+        self._values = values
+        self._first_row = 0
+        self.endResetModel()
+
+    def set_window(self, first_row, rows):
+        """
+        Показ rows строк, начиная с first_row.
+        """
+        first_row = max(0, min(first_row, self.total_rows - 1))
+        if rows == self._window_rows:
+            # Размер окна не изменился - перерисовываются только ячейки
+            self._first_row = first_row
+            if self.rowCount():
+                self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columns - 1))
+            self.headerDataChanged.emit(Qt.Vertical, 0, max(rows - 1, 0))
+            return
+        self.beginResetModel()
+        self._first_row = first_row
+        self._window_rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return max(0, min(self._window_rows, self.total_rows - self._first_row))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.columns
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        position = (self._first_row + index.row()) * self.columns + index.column()
+        if position >= len(self._values):
+            return None
+        if role == Qt.DisplayRole:
+            value = self._values[position]
+            return str(value.item() if hasattr(value, 'item') else value)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(section + 1)
+        # Номер первого значения в строке
+        return str((self._first_row + section) * self.columns + 1)
+
+
+class ResultView(QWidget):
+    """
+    Сводка (количество, минимум, максимум, среднее) и таблица значений.
+    """
+    def __init__(self, parent=None, columns=VALUES_PER_ROW):
+        super().__init__(parent)
+        self.model = ResultModel(columns, self)
+        self.summary_label = QLabel()
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.table.viewport().installEventFilter(self)
+
+        self.scroll_bar = QScrollBar(Qt.Vertical)
+        self.scroll_bar.valueChanged.connect(self.update_window)
+
+        table_layout = QHBoxLayout()
+        table_layout.setContentsMargins(0, 0, 0, 0)
+        table_layout.addWidget(self.table)
+        table_layout.addWidget(self.scroll_bar)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.summary_label)
+        layout.addLayout(table_layout)
+        self.setLayout(layout)
+        self.clear()
+
+    def set_values(self, values, summary=None):
+        """
+        Показ результата; сводка считается, если не передана.
+        """
+        if summary is None:
+            summary = Summary.from_values(values)
+        self.summary_label.setText(summary.format())
+        self.model.set_values(values)
+        self.scroll_bar.setValue(0)
+        self.update_window()
+
+    def clear(self):
+        """
+        Очистка таблицы и сводки.
+        """
+        self.summary_label.setText("")
+        self.model.set_values([])
+        self.update_window()
+
+    def visible_rows(self):
+        return max(1, self.table.viewport().height() // ROW_HEIGHT)
+
+    def update_window(self):
+        """
+        Синхронизация окна модели с полосой прокрутки и размером таблицы.
+        """
+        rows = self.visible_rows()
+        self.scroll_bar.setRange(0, max(0, self.model.total_rows - rows))
+        self.scroll_bar.setPageStep(rows)
+        self.model.set_window(self.scroll_bar.value(), rows)
+
+    def eventFilter(self, source, event):
+        if source is self.table.viewport() and event.type() == QEvent.Resize:
+            self.update_window()
+        # Колесо мыши над таблицей двигает общую полосу прокрутки
+        if source is self.table.viewport() and event.type() == QEvent.Wheel:
+            steps = event.angleDelta().y() // 120
+            self.scroll_bar.setValue(self.scroll_bar.value() - steps * self.scroll_bar.singleStep() * 3)
+            return True
+        return super().eventFilter(source, event)
@@ -0,0 +1,176 @@
+"""
+Заставка при запуске и запуск приложения с заставкой или без неё.
+
+Главное окно строится, пока показывается заставка, и открывается, как только
+оно готово (но не раньше чем через SPLASH_MIN_MS). Быстрый запуск без
+заставки - ключ --no-splash или переменная окружения RNG_NO_SPLASH=1:
+
+    sys.exit(run_app(RandomGenerator))
+"""
+import os
+import sys
+
+from PyQt5.QtCore import QElapsedTimer, QPropertyAnimation, Qt, QTimer
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication, QLabel, QProgressBar, QPushButton, QVBoxLayout, QWidget
+
+# Наименьшее время показа заставки, мс
+SPLASH_MIN_MS = 800
+NO_SPLASH_FLAG = '--no-splash'
+NO_SPLASH_ENV = 'RNG_NO_SPLASH'
+
+
+class SplashScreen(QWidget):
+    """
+    Класс для отображения заставки при запуске приложения.
+    """
+    def __init__(self, window_factory):
+        super().__init__()
+        self.window_factory = window_factory
+        self.generator = None
+        self.setWindowTitle("Загрузка")
+        self.setGeometry(100, 100, 600, 600)
+        self.setStyleSheet("background-color: #2E2E2E;")
+
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignCenter)
+
+        # Логотип
+        self.logo = QLabel()
+        self.logo.setPixmap(QPixmap("logo.png").scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.logo.setAlignment(Qt.AlignCenter)
+        self.logo.setStyleSheet("opacity: 0;")
+        layout.addWidget(self.logo)
+
+        # Заголовок
+        self.title = QLabel("")
+        self.title.setAlignment(Qt.AlignCenter)
+        self.title.setStyleSheet("color: white; font-size: 50px; opacity: 0;")
+        layout.addWidget(self.title)
+
+        # Индикатор загрузки
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 100)
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+
+        # Кнопка с текстом
+        self.footer_button = QPushButton('Создано Габеркорн Вадимом')
+        self.footer_button.setStyleSheet("""
+    QPushButton {
+        background-color: #FFD700;  
+        color: black; 
+        font-size: 18px; 
+        font-weight: bold; 
+        border: 2px solid #FFA500;  
+        border-radius: 10px; 
+        padding: 10px 20px;  
+        max-width: 350px;   
+    }
+    QPushButton:hover {
+        background-color: #FFA500;  
+        border: 2px solid #FF8C00;  
+    }
+""")
+        self.footer_button.setFixedWidth(350)
+        self.footer_button.setCursor(Qt.PointingHandCursor)
+
+        layout.addStretch()
+        layout.addWidget(self.footer_button, alignment=Qt.AlignCenter)
+        layout.addStretch()
+
+        self.setLayout(layout)
+
+        # Анимация для логотипа
+        self.logo_animation = QPropertyAnimation(self.logo, b"opacity")
+        self.logo_animation.setDuration(2000)
+        self.logo_animation.setStartValue(0)
+        self.logo_animation.setEndValue(1)
+
+        # Таймер для обновления индикатора загрузки
+        self.elapsed = QElapsedTimer()
+        self.elapsed.start()
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_progress)
+        self.timer.start(100)
+
+        self.show()
+        self.logo_animation.start()
+
+        # Инициализация анимации заголовка
+        self.title_text = "RANDOM NUMBER GENERATOR"
+        self.title_index = 0
+        self.title_timer = QTimer()
+        self.title_timer.timeout.connect(self.update_title)
+        self.title_timer.start(200)
+
+        # Главное окно строится в цикле событий сразу после показа заставки
+        QTimer.singleShot(0, self.build_generator)
+
+    def update_title(self):
+        """
+        Обновление заголовка заставки.
+        """
+        if self.title_index < len(self.title_text):
+            self.title.setText(self.title.text() + self.title_text[self.title_index])
+            self.title_index += 1
+        else:
+            self.title_timer.stop()
+
+        if self.title_index == len(self.title_text):
+            self.title_animation = QPropertyAnimation(self.title, b"opacity")
+            self.title_animation.setDuration(8000)
+            self.title_animation.setStartValue(0)
+            self.title_animation.setEndValue(1)
+            self.title_animation.start()
+
+    def build_generator(self):
+        """
+        Построение главного окна, пока показывается заставка.
+        """
+        self.generator = self.window_factory()
+
+    def update_progress(self):
+        """
+        Обновление индикатора загрузки.
+
+        Индикатор доходит до конца, когда окно построено и заставка
+        показана не меньше SPLASH_MIN_MS.
+        """
+        elapsed = self.elapsed.elapsed()
+        if self.generator is not None and elapsed >= SPLASH_MIN_MS:
+            self.timer.stop()
+            self.close()
+            self.open_generator()
+            return
+        self.progress.setValue(min(elapsed * 100 // SPLASH_MIN_MS, 100 if self.generator else 96))
+
+    def open_generator(self):
+        """
+        Открытие основного окна генератора случайных чисел.
+        """
+        self.generator.show()
+
+
+def fast_start(argv):
+    """
+    Запуск без заставки (ключ --no-splash или RNG_NO_SPLASH).
+    """
+    return NO_SPLASH_FLAG in argv or os.environ.get(NO_SPLASH_ENV, '') not in ('', '0')
+
+
+def run_app(window_factory, argv=None, splash=True):
+    """
+    Запуск приложения: window_factory() строит главное окно; возвращает код выхода.
+
+    splash=False - всегда без заставки (например, для уровня mini).
+    """
+    argv = sys.argv if argv is None else argv
+    app = QApplication(argv)
+    if not splash or fast_start(argv):
+        window = window_factory()
+        window.show()
+    else:
+        # Заставка сама откроет главное окно
+        window = SplashScreen(window_factory)
+    return app.exec_()
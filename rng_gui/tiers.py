@@ -0,0 +1,64 @@
+"""
+Уровни возможностей графического интерфейса.
+
+Все интерфейсы построены на одном окне (rng_gui.window); уровень определяет
+доступные режимы, предел количества и дополнительные компоненты:
+
+    full     - случайные целые и вещественные числа, большие результаты
+    extended - все режимы rng.jobs.MODES
+    mini     - три режима, до 1000 чисел, без фоновой генерации, таблицы и графиков
+"""
+from rng.jobs import MODES
+
+# Названия режимов в интерфейсе
+MODE_LABELS = {
+    'random': 'Случайные числа',
+    'unique': 'Уникальные числа',
+    'weighted': 'Взвешенная генерация',
+    'distribution': 'Распределение',
+    'crypto': 'Криптостойкие',
+    'password': 'Генератор паролей',
+    'wide': 'Длинные целые',
+}
+
+
+class Tier:
+    """
+    Набор возможностей интерфейса.
+
+    background - генерация в фоновом потоке с прогрессом и отменой;
+    table - таблица значений и сохранение результата в двоичный файл;
+    plots - графики распределения результата (rng_gui.plots);
+    splash - заставка при запуске.
+    """
+    def __init__(self, name, modes, max_count, size, background=True, table=True, plots=True,
+                 splash=True):
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise ValueError(f"Неизвестные режимы генерации: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.modes = tuple(modes)
+        self.max_count = max_count
+        self.size = size
+        self.background = background
+        self.table = table
+        self.plots = plots
+        self.splash = splash
+
+
+TIERS = {
+    'full': Tier('full', ('random',), 100_000_000, (600, 600)),
+    'extended': Tier('extended', MODES, 100_000_000, (800, 800)),
+    'mini': Tier('mini', ('random', 'unique', 'weighted'), 1000, (600, 700),
+                 background=False, table=False, plots=False, splash=False),
+}
+
+
+def get_tier(name):
+    """
+    Уровень по имени.
+    """
+    try:
+        return TIERS[name]
+    except KeyError:
+        raise ValueError(f"Неизвестный уровень интерфейса: {name}") from None
@@ -0,0 +1,500 @@
+"""
+Главное окно генератора случайных чисел, общее для всех интерфейсов.
+
+Состав окна задаётся уровнем (rng_gui.tiers). Модули фоновой генерации,
+таблицы результатов, графиков и экспорта загружаются, только если уровень их
+использует, поэтому сборка Mini может обойтись без них.
+
+    class RandomGenerator(GeneratorWindow):
+        tier = 'mini'
+"""
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (QCheckBox, QComboBox, QFileDialog, QGridLayout, QLabel, QLineEdit,
+                             QMessageBox, QProgressBar, QPushButton, QSpinBox, QTabWidget,
+                             QTextEdit, QVBoxLayout, QWidget)
+
+from rng.engine import FLOAT_DECIMALS, MAX_DECIMALS
+from rng.history import HistoryStore, make_record
+from rng.replay import ReplayDescriptor, create_replayable_job
+from rng_gui.tiers import MODE_LABELS, get_tier
+
+DEFAULT_WEIGHTED_VALUES = "1, 2, 3, 4, 5"
+DEFAULT_WEIGHTS = "0.1, 0.2, 0.3, 0.2, 0.2"
+DEFAULT_WIDE_MIN = "0"
+DEFAULT_WIDE_MAX = "2**128 - 1"
+# Вид чисел режима wide в интерфейсе и в rng.wide
+WIDE_OUTPUTS = {'Десятичные': 'int', 'Шестнадцатеричные': 'hex'}
+HISTORY_EXPORT_PATH = "history.txt"
+
+
+class GeneratorWindow(QWidget):
+    """
+    Класс для создания графического интерфейса генератора случайных чисел.
+
+    Уровень берётся из аргумента tier или атрибута класса.
+    """
+    tier = 'extended'
+
+    def __init__(self, tier=None):
+        super().__init__()
+        self.tier = get_tier(tier or self.tier)
+        self.is_dark_theme = True
+        self.setWindowTitle("Генератор Случайных Чисел")
+        self.setGeometry(100, 100, *self.tier.size)
+
+        self.history = HistoryStore()
+        self.worker = None
+        self.last_record = None
+        font = QFont("Arial", 16)
+
+        # Кнопки управления
+        self.theme_button = QPushButton("Светлая тема")
+        self.theme_button.clicked.connect(self.toggle_theme)
+
+        self.help_button = QPushButton("?")
+        self.help_button.clicked.connect(self.show_help)
+
+        self.export_button = QPushButton("Экспорт")
+        self.export_button.clicked.connect(self.export_history)
+        self.buttons = [self.theme_button, self.help_button, self.export_button]
+
+        if self.tier.table:
+            self.save_button = QPushButton("Сохранить данные")
+            self.save_button.clicked.connect(self.save_values)
+            self.buttons.append(self.save_button)
+
+        layout = QGridLayout()
+        for column, button in enumerate(self.buttons):
+            layout.addWidget(button, 0, column)
+
+        # Результат
+        self.result = QTextEdit()
+        self.result.setReadOnly(True)
+        self.result.setFont(font)
+        self.result_view = None
+        self.plot_view = None
+        if self.tier.table or self.tier.plots:
+            self.result.setMaximumHeight(90)
+            result_tabs = QTabWidget()
+            if self.tier.table:
+                from rng_gui.results import ResultView
+                # Значения результата: таблица форматирует только видимые строки
+                self.result_view = ResultView()
+                result_tabs.addTab(self.result_view, "Значения")
+            if self.tier.plots:
+                from rng_gui.plots import PlotView
+                # Графики строятся по гистограмме, которая пополняется во время генерации
+                self.plot_view = PlotView()
+                result_tabs.addTab(self.plot_view, "График")
+            result_layout = QVBoxLayout()
+            result_layout.addWidget(self.result)
+            result_layout.addWidget(result_tabs)
+            layout.addLayout(result_layout, 1, 0, 1, 5)
+        else:
+            layout.addWidget(self.result, 1, 0, 1, 5)
+
+        # Элементы управления
+        layout.addWidget(QLabel("Минимальное значение:"), 2, 0)
+        self.min_input = QSpinBox()
+        self.min_input.setRange(-1000000, 1000000)
+        layout.addWidget(self.min_input, 2, 1)
+
+        layout.addWidget(QLabel("Максимальное значение:"), 2, 2)
+        self.max_input = QSpinBox()
+        self.max_input.setRange(-1000000, 1000000)
+        self.max_input.setValue(100)
+        layout.addWidget(self.max_input, 2, 3)
+
+        self.type_select = QComboBox()
+        self.type_select.addItems(['Целое', 'Вещественное'])
+        self.type_select.currentIndexChanged.connect(self.update_generation_ui)
+        # Знаков после запятой у вещественных чисел; наименьшее значение - без округления
+        self.decimals_input = QSpinBox()
+        self.decimals_input.setRange(-1, MAX_DECIMALS)
+        self.decimals_input.setValue(FLOAT_DECIMALS)
+        self.decimals_input.setPrefix("Знаков: ")
+        self.decimals_input.setSpecialValueText("Все знаки")
+        self.count_input = QSpinBox()
+        self.count_input.setRange(1, self.tier.max_count)
+        self.count_input.setValue(1)
+        self.generation_type = QComboBox()
+        self.generation_type.addItems([MODE_LABELS[mode] for mode in self.tier.modes])
+        row = 3
+        if len(self.tier.modes) > 1:
+            # Тип генерации, тип числа и количество
+            layout.addWidget(QLabel("Тип генерации:"), 3, 0)
+            layout.addWidget(self.generation_type, 3, 1)
+            layout.addWidget(QLabel("Тип числа:"), 3, 2)
+            layout.addWidget(self.type_select, 3, 3)
+            layout.addWidget(self.decimals_input, 3, 4)
+            layout.addWidget(QLabel("Количество:"), 4, 0)
+            layout.addWidget(self.count_input, 4, 1)
+            row = 5
+        else:
+            layout.addWidget(QLabel("Тип числа:"), 3, 0)
+            layout.addWidget(self.type_select, 3, 1)
+            layout.addWidget(QLabel("Количество чисел:"), 3, 2)
+            layout.addWidget(self.count_input, 3, 3)
+            layout.addWidget(self.decimals_input, 3, 4)
+            row = 4
+
+        # Дополнительные элементы для специальных генераций
+        self.extra_layout = QGridLayout()
+        self._add_extra_controls()
+        if self.extra_layout.count():
+            layout.addLayout(self.extra_layout, row, 0, 1, 5)
+            row += 1
+
+        # Кнопка генерации
+        self.generate_button = QPushButton("Сгенерировать")
+        self.generate_button.clicked.connect(self.generate_numbers)
+        layout.addWidget(self.generate_button, row, 0, 1, 5)
+
+        if self.tier.background:
+            # Прогресс и отмена фоновой генерации
+            self.generation_progress = QProgressBar()
+            self.generation_progress.setRange(0, 100)
+            layout.addWidget(self.generation_progress, row + 1, 0, 1, 4)
+            self.cancel_button = QPushButton("Отмена")
+            self.cancel_button.setEnabled(False)
+            self.cancel_button.clicked.connect(self.cancel_generation)
+            layout.addWidget(self.cancel_button, row + 1, 4)
+
+        self.generation_type.currentIndexChanged.connect(self.update_generation_ui)
+        self.setLayout(layout)
+        self.update_generation_ui()
+        self.apply_theme()
+
+    def _add_extra_controls(self):
+        """
+        Элементы режимов пароли, распределение, взвешенная генерация и длинные целые
+        (если они есть в уровне).
+        """
+        modes = self.tier.modes
+        if 'password' in modes:
+            self.uppercase_check = QCheckBox("Заглавные буквы")
+            self.numbers_check = QCheckBox("Цифры")
+            self.symbols_check = QCheckBox("Спецсимволы")
+            self.extra_layout.addWidget(self.uppercase_check, 0, 0)
+            self.extra_layout.addWidget(self.numbers_check, 0, 1)
+            self.extra_layout.addWidget(self.symbols_check, 0, 2)
+
+        if 'distribution' in modes:
+            from rng.distributions import distribution_names
+            self.distribution_select = QComboBox()
+            self.distribution_select.addItems(distribution_names())
+            self.distribution_select.currentIndexChanged.connect(self.update_distribution_params)
+            self.extra_layout.addWidget(QLabel("Распределение:"), 1, 0)
+            self.extra_layout.addWidget(self.distribution_select, 1, 1)
+            self.distribution_params_input = QLineEdit()
+            self.extra_layout.addWidget(QLabel("Параметры:"), 1, 2)
+            self.extra_layout.addWidget(self.distribution_params_input, 1, 3)
+            self.update_distribution_params()
+
+        if 'weighted' in modes:
+            self.weighted_values_input = QLineEdit(DEFAULT_WEIGHTED_VALUES)
+            self.weighted_weights_input = QLineEdit(DEFAULT_WEIGHTS)
+            self.extra_layout.addWidget(QLabel("Значения:"), 2, 0)
+            self.extra_layout.addWidget(self.weighted_values_input, 2, 1)
+            self.extra_layout.addWidget(QLabel("Веса:"), 2, 2)
+            self.extra_layout.addWidget(self.weighted_weights_input, 2, 3)
+
+        if 'wide' in modes:
+            # Границы шире 64 бит не помещаются в QSpinBox - вводятся строкой (2**128, 0xff...)
+            self.wide_min_input = QLineEdit(DEFAULT_WIDE_MIN)
+            self.wide_max_input = QLineEdit(DEFAULT_WIDE_MAX)
+            self.wide_output_select = QComboBox()
+            self.wide_output_select.addItems(list(WIDE_OUTPUTS))
+            self.extra_layout.addWidget(QLabel("От:"), 3, 0)
+            self.extra_layout.addWidget(self.wide_min_input, 3, 1)
+            self.extra_layout.addWidget(QLabel("До:"), 3, 2)
+            self.extra_layout.addWidget(self.wide_max_input, 3, 3)
+            self.extra_layout.addWidget(self.wide_output_select, 3, 4)
+
+    def current_mode(self):
+        """
+        Выбранный режим генерации (rng.jobs.MODES).
+        """
+        return self.tier.modes[max(0, self.generation_type.currentIndex())]
+
+    def update_generation_ui(self):
+        """
+        Обновление UI в зависимости от выбранного типа генерации.
+        """
+        mode = self.current_mode()
+        self.type_select.setEnabled(mode == 'random')
+        self.decimals_input.setEnabled(mode == 'random' and self.type_select.currentText() != 'Целое')
+        if 'password' in self.tier.modes:
+            for check in (self.uppercase_check, self.numbers_check, self.symbols_check):
+                check.setEnabled(mode == 'password')
+        if 'distribution' in self.tier.modes:
+            self.distribution_select.setEnabled(mode == 'distribution')
+            self.distribution_params_input.setEnabled(mode == 'distribution')
+        if 'weighted' in self.tier.modes:
+            self.weighted_values_input.setEnabled(mode == 'weighted')
+            self.weighted_weights_input.setEnabled(mode == 'weighted')
+        if 'wide' in self.tier.modes:
+            for widget in (self.wide_min_input, self.wide_max_input, self.wide_output_select):
+                widget.setEnabled(mode == 'wide')
+
+    def update_distribution_params(self):
+        """
+        Подстановка параметров по умолчанию для выбранного распределения.
+        """
+        from rng.distributions import format_params, get_distribution
+        distribution = get_distribution(self.distribution_select.currentText())
+        self.distribution_params_input.setText(format_params(distribution.defaults))
+
+    def generation_params(self):
+        """
+        Параметры задания (как у rng.jobs.create_job) и заголовок результата.
+        """
+        mode = self.current_mode()
+        min_val = self.min_input.value()
+        max_val = self.max_input.value()
+        count = self.count_input.value()
+
+        if mode == 'random':
+            if self.type_select.currentText() == 'Целое':
+                params = {'num_type': 'int'}
+            else:
+                decimals = self.decimals_input.value()
+                params = {'num_type': 'float', 'decimals': None if decimals < 0 else decimals}
+            return ({'mode': 'random', 'count': count, 'min_val': min_val, 'max_val': max_val, **params},
+                    f"Сгенерированы числа ({count} шт.):")
+        if mode == 'unique':
+            return ({'mode': 'unique', 'count': count, 'min_val': min_val, 'max_val': max_val},
+                    "Сгенерированы уникальные числа:")
+        if mode == 'weighted':
+            from rng.weighted import parse_weight_table
+            numbers, weights = parse_weight_table(self.weighted_values_input.text(),
+                                                  self.weighted_weights_input.text())
+            return ({'mode': 'weighted', 'count': count, 'numbers': numbers, 'weights': weights},
+                    "Сгенерированы взвешенные числа:")
+        if mode == 'distribution':
+            from rng.distributions import parse_params
+            distribution = self.distribution_select.currentText()
+            return ({'mode': 'distribution', 'count': count, 'distribution': distribution,
+                     'params': parse_params(self.distribution_params_input.text())},
+                    f"Сгенерированы числа по распределению {distribution}:")
+        if mode == 'crypto':
+            return ({'mode': 'crypto', 'count': count, 'min_val': min_val, 'max_val': max_val},
+                    "Сгенерированы криптографически стойкие числа:")
+        if mode == 'wide':
+            from rng.wide import parse_integer
+            return ({'mode': 'wide', 'count': count, 'min_val': parse_integer(self.wide_min_input.text()),
+                     'max_val': parse_integer(self.wide_max_input.text()),
+                     'output': WIDE_OUTPUTS[self.wide_output_select.currentText()]},
+                    "Сгенерированы длинные целые числа:")
+        return ({'mode': 'password', 'count': 5, 'password_length': count,
+                 'use_uppercase': self.uppercase_check.isChecked(),
+                 'use_numbers': self.numbers_check.isChecked(),
+                 'use_symbols': self.symbols_check.isChecked()}, "Сгенерированные пароли:")
+
+    def generate_numbers(self):
+        """
+        Генерация случайных чисел (в фоновом потоке, если уровень это поддерживает).
+        """
+        try:
+            if self.current_mode() in ('random', 'unique', 'crypto') and \
+                    self.min_input.value() > self.max_input.value():
+                self.result.setText("Минимальное значение не может быть больше максимального!")
+                return
+            params, header = self.generation_params()
+            if params['mode'] == 'random' and params['count'] == 1:
+                self.show_single_number(params)
+                return
+
+            # Свой seed на каждый запуск: по описанию из истории результат воспроизводится
+            job, descriptor = create_replayable_job(params)
+
+            if not self.tier.background:
+                values = job.run() if descriptor is None else descriptor.generate()
+                numbers = values.tolist() if hasattr(values, 'tolist') else list(values)
+                self.result.setText(f"{header}\n{numbers}")
+                self.show_histogram(params, values)
+                self.history.append(make_record(params, values=numbers, descriptor=descriptor))
+                return
+        except Exception as e:
+            self.result.setText(f"Ошибка: {str(e)}")
+            return
+
+        self.start_generation(job, header, params, descriptor)
+
+    def show_single_number(self, params):
+        """
+        Одно число сразу, без фонового потока.
+
+        Уровни с фоновой генерацией берут его из заранее заполненного пула
+        (в историю пишется само значение), остальные - из описания с блоком
+        в одно значение, которое воспроизводится без генерации лишних чисел.
+        """
+        descriptor = None
+        if self.tier.background:
+            from rng.pool import get_pool
+            number = get_pool().random_number(params['min_val'], params['max_val'], params['num_type'],
+                                              params.get('decimals', FLOAT_DECIMALS))
+        else:
+            replay_params = {key: value for key, value in params.items() if key not in ('mode', 'count')}
+            descriptor = ReplayDescriptor('random', replay_params, 1, block_size=1)
+            number = descriptor.generate()[0].item()
+        self.result.setText(f"Сгенерировано число: {number}")
+        if self.result_view is not None:
+            self.result_view.clear()
+        if self.plot_view is not None:
+            self.plot_view.clear()
+        self.history.append(make_record(params, values=[number], descriptor=descriptor))
+
+    def start_generation(self, job, header, params, descriptor):
+        """
+        Запуск задания в фоновом потоке; окно остаётся отзывчивым.
+        """
+        from rng_gui.worker import GenerationWorker
+        histogram = self.show_histogram(params)
+        self.worker = GenerationWorker(job, self, histogram)
+        self.worker.progress.connect(self.generation_progress.setValue)
+        self.worker.result_ready.connect(
+            lambda values, summary: self.show_result(header, values, summary,
+                                                     make_record(params, summary, values, descriptor)))
+        self.worker.failed.connect(lambda message: self.generation_stopped(f"Ошибка: {message}"))
+        self.worker.cancelled.connect(lambda: self.generation_stopped("Генерация отменена"))
+        self.worker.finished.connect(self.generation_finished)
+        self.generate_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.generation_progress.setValue(0)
+        if self.result_view is not None:
+            self.result_view.clear()
+        if histogram is not None:
+            self.plot_view.start_live()
+        self.worker.start()
+
+    def show_histogram(self, params, values=None):
+        """
+        Новая гистограмма для панели графиков (None, если панели нет).
+        """
+        if self.plot_view is None:
+            return None
+        from rng.histogram import StreamingHistogram, reference_cdf
+        histogram = StreamingHistogram()
+        if values is not None:
+            histogram.update(values)
+        self.plot_view.set_histogram(histogram, reference_cdf(params))
+        return histogram
+
+    def generation_stopped(self, message):
+        """
+        Ошибка или отмена фоновой генерации: частичные графики не показываются.
+        """
+        self.result.setText(message)
+        if self.plot_view is not None:
+            self.plot_view.clear()
+
+    def show_result(self, header, values, summary, record):
+        """
+        Вывод результата завершённого задания и запись в историю.
+        """
+        if self.result_view is not None:
+            self.result.setText(f"{header}\n{summary.format()}")
+            self.result_view.set_values(values, summary)
+        else:
+            from rng_gui.worker import format_values
+            self.result.setText(f"{header}\n{format_values(values)}")
+        self.history.append(record)
+        self.last_record = record
+
+    def cancel_generation(self):
+        """
+        Отмена текущей генерации.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def generation_finished(self):
+        """
+        Возврат кнопок в исходное состояние после завершения потока.
+        """
+        self.generate_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.worker = None
+        if self.plot_view is not None:
+            self.plot_view.stop_live()
+
+    def closeEvent(self, event):
+        """
+        Остановка фоновой генерации при закрытии окна.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+        self.history.close()
+        super().closeEvent(event)
+
+    def apply_theme(self):
+        """
+        Применение темы.
+        """
+        if self.is_dark_theme:
+            self.setStyleSheet("background-color: #2E2E2E; color: white;")
+            for button in self.buttons:
+                button.setStyleSheet("background-color: #4C4C4C; color: white;")
+            self.result.setStyleSheet("background-color: #1E1E1E; color: white;")
+        else:
+            self.setStyleSheet("background-color: #FFFFFF; color: black;")
+            for button in self.buttons:
+                button.setStyleSheet("background-color: #CCCCCC; color: black;")
+            self.result.setStyleSheet("background-color: #F0F0F0; color: black;")
+
+    def toggle_theme(self):
+        """
+        Переключение темы.
+        """
+        self.is_dark_theme = not self.is_dark_theme
+        self.apply_theme()
+
+    def show_help(self):
+        """
+        Показ справки.
+        """
+        if len(self.tier.modes) > 1:
+            step = "2. Выберите тип генерации.\n"
+        else:
+            step = "2. Выберите тип числа (целое или вещественное).\n"
+        QMessageBox.information(self, "Справка",
+            "Генератор случайных чисел:\n"
+            "1. Выберите минимальное и максимальное значения.\n"
+            + step +
+            "3. Укажите количество чисел для генерации.\n"
+            "4. Нажмите 'Сгенерировать' для получения результата.")
+
+    def export_history(self):
+        """
+        Экспортировать историю генерации в текстовый файл.
+        """
+        self.history.export_text(HISTORY_EXPORT_PATH)
+        QMessageBox.information(self, "Экспорт", f"История генерации экспортирована в {HISTORY_EXPORT_PATH}")
+
+    def save_values(self):
+        """
+        Сохранение последнего результата в двоичный файл (.npy, .bin, .arrow, .parquet).
+        """
+        values = self.result_view.model.values
+        if self.last_record is None or len(values) == 0:
+            QMessageBox.information(self, "Сохранение", "Нет данных для сохранения")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить данные", "numbers.npy",
+            "NumPy (*.npy);;Двоичный файл (*.bin);;Arrow (*.arrow);;Parquet (*.parquet)")
+        if not path:
+            return
+        metadata = dict(self.last_record['params'])
+        if self.last_record.get('replay') is not None:
+            metadata['replay'] = self.last_record['replay']
+        # Модуль экспорта загружается при первом сохранении, а не при запуске
+        from rng.export import export_array
+        try:
+            export_array(values, path, metadata)
+        except Exception as e:
+            QMessageBox.warning(self, "Сохранение", f"Ошибка: {str(e)}")
+            return
+        QMessageBox.information(self, "Сохранение", f"Данные сохранены в {path}")
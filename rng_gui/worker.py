@@ -0,0 +1,73 @@
+"""
+Фоновое выполнение заданий генерации (rng.jobs) в отдельном потоке Qt.
+
+Окно остаётся отзывчивым: задание работает в QThread, а прогресс, результат
+и ошибки передаются в поток интерфейса сигналами.
+"""
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from rng.jobs import JobCancelled
+from rng.summary import Summary
+
+# Сколько значений показывать текстом в окне результата
+PREVIEW_LIMIT = 1000
+
+
+def format_values(values, limit=PREVIEW_LIMIT):
+    """
+    Текст списка значений; для длинных результатов - только начало.
+    """
+    if len(values) <= limit:
+        return str(list(values) if not hasattr(values, 'tolist') else values.tolist())
+    head = values[:limit]
+    head = head.tolist() if hasattr(head, 'tolist') else list(head)
+    return f"{str(head)[:-1]}, ...]\nПоказаны первые {limit} из {len(values)}"
+
+
+class GenerationWorker(QThread):
+    """
+    Поток, выполняющий одно задание генерации.
+
+    Вместе с результатом передаётся сводка (rng.summary), собранная
+    по порциям во время генерации. Если передана гистограмма
+    (rng.histogram), она пополняется теми же порциями.
+    """
+    progress = pyqtSignal(int)
+    result_ready = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, job, parent=None, histogram=None):
+        super().__init__(parent)
+        self.job = job
+        self.histogram = histogram
+        self._percent = -1
+
+    def cancel(self):
+        """
+        Отмена задания (поток завершится после текущей порции).
+        """
+        self.job.cancel()
+
+    def _report(self, done, total):
+        percent = 100 if total == 0 else done * 100 // total
+        # Сигнал только при изменении процента, чтобы не засыпать очередь событий
+        if percent != self._percent:
+            self._percent = percent
+            self.progress.emit(percent)
+
+    def run(self):
+        summary = Summary()
+        on_chunk = summary.update
+        if self.histogram is not None:
+            def on_chunk(chunk):
+                summary.update(chunk)
+                self.histogram.update(chunk)
+        try:
+            result = self.job.run(on_progress=self._report, on_chunk=on_chunk)
+        except JobCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.result_ready.emit(result, summary)